@@ -0,0 +1,379 @@
+from datetime import datetime, timedelta
+from threading import Lock
+from typing import Any, Dict, List, Optional
+import glob
+import json
+import logging
+import os
+import duckdb
+import pyarrow as pa
+import pyarrow.parquet as pq
+from config import settings
+from database import get_db_manager
+
+logger = logging.getLogger(__name__)
+
+# Re-read this much before each watermark so rows committed late with an
+# older updated_at are not missed; the duplicates are dropped on load
+WATERMARK_OVERLAP = timedelta(minutes=5)
+SNAPSHOT_BATCH_ROWS = 50000
+STATE_FILE = "_state.json"
+
+_money = pa.decimal128(12, 2)
+
+
+class _SnapshotTable:
+    """How one MySQL table is copied to Parquet and deduplicated into DuckDB.
+
+    Incremental tables select their change timestamp as _watermark and
+    re-read rows whose `watermark` is at or after the last run's; full tables
+    are copied whole every run. `latest` is the DuckDB clause that keeps the
+    newest copy of each row across part files.
+    """
+
+    def __init__(self, name: str, query: str, schema: pa.Schema, latest: str,
+                 watermark: Optional[str] = None):
+        self.name = name
+        self.query = query
+        self.schema = schema.append(pa.field("_snapshot", pa.int32()))
+        self.latest = latest
+        self.watermark = watermark
+
+
+SNAPSHOT_TABLES = [
+    _SnapshotTable(
+        "orders",
+        """SELECT order_id, customer_id, restaurant_id, status, created_at, confirmed_at, prepared_at,
+                  ready_at, picked_up_at, delivered_at, cancelled_at, updated_at, subtotal, tax,
+                  delivery_fee, service_fee, tip, discount, total, is_paid, updated_at AS _watermark
+           FROM `Order`""",
+        pa.schema([
+            ("order_id", pa.int64()), ("customer_id", pa.int64()), ("restaurant_id", pa.int64()),
+            ("status", pa.string()), ("created_at", pa.timestamp("us")), ("confirmed_at", pa.timestamp("us")),
+            ("prepared_at", pa.timestamp("us")), ("ready_at", pa.timestamp("us")),
+            ("picked_up_at", pa.timestamp("us")), ("delivered_at", pa.timestamp("us")),
+            ("cancelled_at", pa.timestamp("us")), ("updated_at", pa.timestamp("us")),
+            ("subtotal", _money), ("tax", _money), ("delivery_fee", _money), ("service_fee", _money),
+            ("tip", _money), ("discount", _money), ("total", _money), ("is_paid", pa.int8())
+        ]),
+        "QUALIFY row_number() OVER (PARTITION BY order_id ORDER BY _snapshot DESC) = 1",
+        watermark="updated_at"
+    ),
+    _SnapshotTable(
+        # OrderItem has no timestamps, so an order's items are re-copied with the order
+        "order_items",
+        """SELECT oi.order_item_id, oi.order_id, oi.menu_item_id, oi.item_name, oi.quantity, oi.unit_price,
+                  o.updated_at AS _watermark
+           FROM OrderItem oi JOIN `Order` o ON oi.order_id = o.order_id""",
+        pa.schema([
+            ("order_item_id", pa.int64()), ("order_id", pa.int64()), ("menu_item_id", pa.int64()),
+            ("item_name", pa.string()), ("quantity", pa.int32()), ("unit_price", _money)
+        ]),
+        "QUALIFY _snapshot = max(_snapshot) OVER (PARTITION BY order_id)",
+        watermark="o.updated_at"
+    ),
+    _SnapshotTable(
+        "refunds",
+        """SELECT refund_id, order_id, refund_amount, status, requested_at, processed_at,
+                  COALESCE(processed_at, requested_at) AS _watermark
+           FROM Refund""",
+        pa.schema([
+            ("refund_id", pa.int64()), ("order_id", pa.int64()), ("refund_amount", _money),
+            ("status", pa.string()), ("requested_at", pa.timestamp("us")), ("processed_at", pa.timestamp("us"))
+        ]),
+        "QUALIFY row_number() OVER (PARTITION BY refund_id ORDER BY _snapshot DESC) = 1",
+        watermark="COALESCE(processed_at, requested_at)"
+    ),
+    _SnapshotTable(
+        "restaurants",
+        "SELECT restaurant_id, restaurant_name, operating_status, city, state FROM Restaurant",
+        pa.schema([
+            ("restaurant_id", pa.int64()), ("restaurant_name", pa.string()),
+            ("operating_status", pa.string()), ("city", pa.string()), ("state", pa.string())
+        ]),
+        "QUALIFY _snapshot = max(_snapshot) OVER ()"
+    ),
+    _SnapshotTable(
+        "customers",
+        "SELECT customer_id, customer_name FROM Customer",
+        pa.schema([("customer_id", pa.int64()), ("customer_name", pa.string())]),
+        "QUALIFY _snapshot = max(_snapshot) OVER ()"
+    ),
+]
+
+
+def _read_state(directory: str) -> dict:
+    try:
+        with open(os.path.join(directory, STATE_FILE), encoding="utf-8") as handle:
+            return json.load(handle)
+    except FileNotFoundError:
+        return {"seq": 0, "watermarks": {}, "snapshot_at": None}
+
+
+def _write_state(directory: str, state: dict) -> None:
+    path = os.path.join(directory, STATE_FILE)
+    with open(path + ".tmp", "w", encoding="utf-8") as handle:
+        json.dump(state, handle)
+    os.replace(path + ".tmp", path)
+
+
+def _part_files(directory: str, table: str) -> List[str]:
+    return sorted(glob.glob(os.path.join(directory, table, "part-*.parquet")))
+
+
+class AnalyticsSnapshotter:
+    """Copies the reporting tables from MySQL into Parquet part files under ANALYTICS_DIR.
+
+    Each run writes one new part per table holding the rows changed since the
+    previous run (by watermark), streamed from MySQL in batches. A full run
+    re-copies everything and removes the older parts, which also drops rows
+    deleted from MySQL.
+    """
+
+    def __init__(self, directory: Optional[str] = None):
+        self.db = get_db_manager()
+        self.directory = directory or settings.ANALYTICS_DIR
+
+    def _write_part(self, table: _SnapshotTable, seq: int, since: Optional[datetime]) -> tuple:
+        query, params = table.query, ()
+        if table.watermark and since is not None:
+            query += f" WHERE {table.watermark} >= %s"
+            params = (since - WATERMARK_OVERLAP,)
+
+        os.makedirs(os.path.join(self.directory, table.name), exist_ok=True)
+        path = os.path.join(self.directory, table.name, f"part-{seq:06d}.parquet")
+        newest, rows_written, batch = None, 0, []
+        writer = None
+        try:
+            for row in self.db.stream_query(query, params, batch_size=5000):
+                row["_snapshot"] = seq
+                batch.append(row)
+                value = row.get("_watermark")
+                if value is not None and (newest is None or value > newest):
+                    newest = value
+                if len(batch) >= SNAPSHOT_BATCH_ROWS:
+                    writer = writer or pq.ParquetWriter(path + ".tmp", table.schema)
+                    writer.write_table(pa.Table.from_pylist(batch, schema=table.schema))
+                    rows_written += len(batch)
+                    batch = []
+            if batch or writer is None:
+                writer = writer or pq.ParquetWriter(path + ".tmp", table.schema)
+                writer.write_table(pa.Table.from_pylist(batch, schema=table.schema))
+                rows_written += len(batch)
+        finally:
+            if writer is not None:
+                writer.close()
+
+        if rows_written == 0 and since is not None:
+            os.remove(path + ".tmp")
+            return 0, None
+        os.replace(path + ".tmp", path)
+        return rows_written, newest
+
+    def snapshot(self, full: bool = False) -> Dict[str, int]:
+        """Copy changed rows (or everything) to new part files; returns rows written per table."""
+        os.makedirs(self.directory, exist_ok=True)
+        state = _read_state(self.directory)
+        if full:
+            state["watermarks"] = {}
+        seq = state["seq"] + 1
+        started_at = datetime.now()
+
+        written = {}
+        for table in SNAPSHOT_TABLES:
+            since = None
+            if table.watermark and table.name in state["watermarks"]:
+                since = datetime.fromisoformat(state["watermarks"][table.name])
+            rows, newest = self._write_part(table, seq, since)
+            written[table.name] = rows
+            if newest is not None:
+                state["watermarks"][table.name] = newest.isoformat()
+            if since is None:
+                # A whole copy supersedes every older part
+                for path in _part_files(self.directory, table.name)[:-1]:
+                    os.remove(path)
+
+        state.update(seq=seq, snapshot_at=started_at.isoformat())
+        _write_state(self.directory, state)
+        logger.info(f"Analytics snapshot {seq}: {written}")
+        return written
+
+
+# Predefined reports (from Database/Queries_and_Automation.sql), run against the snapshot tables
+REPORTS: Dict[str, Dict[str, Any]] = {
+    "restaurant_daily_sales": {
+        "description": "Delivered orders, gross sales and revenue per restaurant per day over the last `days` days",
+        "parameters": {"days": 30},
+        "sql": """
+            SELECT r.restaurant_id, r.restaurant_name, CAST(o.created_at AS DATE) AS order_date,
+                   COUNT(DISTINCT o.order_id) AS total_orders,
+                   SUM(o.subtotal) AS gross_sales,
+                   SUM(o.total) AS total_revenue
+            FROM restaurants r
+            JOIN orders o ON r.restaurant_id = o.restaurant_id
+            WHERE o.status = 'DELIVERED'
+              AND o.created_at >= current_date - to_days(CAST($days AS INTEGER))
+            GROUP BY ALL
+            ORDER BY total_revenue DESC
+        """
+    },
+    "restaurant_metrics": {
+        "description": "Delivered orders, revenue, refunds and average fulfillment minutes per restaurant over the last `days` days",
+        "parameters": {"days": 30},
+        "sql": """
+            SELECT r.restaurant_id, r.restaurant_name,
+                   COUNT(DISTINCT o.order_id) AS delivered_orders,
+                   SUM(o.total) AS delivered_revenue,
+                   COALESCE(SUM(rf.refunded), 0) AS refunded_amount,
+                   ROUND(AVG(date_diff('minute', o.confirmed_at, o.delivered_at)), 1) AS avg_fulfillment_minutes
+            FROM restaurants r
+            JOIN orders o ON r.restaurant_id = o.restaurant_id
+            LEFT JOIN (
+                SELECT order_id, SUM(refund_amount) AS refunded
+                FROM refunds WHERE status = 'COMPLETED' GROUP BY order_id
+            ) rf ON rf.order_id = o.order_id
+            WHERE o.status = 'DELIVERED'
+              AND o.created_at >= current_date - to_days(CAST($days AS INTEGER))
+            GROUP BY ALL
+            ORDER BY delivered_revenue DESC
+        """
+    },
+    "customer_lifetime_value": {
+        "description": "Customers by delivered-order spend net of completed refunds, top `limit`",
+        "parameters": {"limit": 100},
+        "sql": """
+            SELECT c.customer_id, c.customer_name,
+                   COUNT(*) AS delivered_orders,
+                   SUM(o.total) AS gross_spent,
+                   SUM(o.total) - COALESCE(SUM(rf.refunded), 0) AS lifetime_value,
+                   MIN(o.created_at) AS first_order_at,
+                   MAX(o.created_at) AS last_order_at
+            FROM customers c
+            JOIN orders o ON c.customer_id = o.customer_id
+            LEFT JOIN (
+                SELECT order_id, SUM(refund_amount) AS refunded
+                FROM refunds WHERE status = 'COMPLETED' GROUP BY order_id
+            ) rf ON rf.order_id = o.order_id
+            WHERE o.status = 'DELIVERED'
+            GROUP BY ALL
+            ORDER BY lifetime_value DESC
+            LIMIT $limit
+        """
+    },
+    "above_average_customers": {
+        "description": "Customers whose delivered-order spend is above the average customer's",
+        "parameters": {},
+        "sql": """
+            WITH totals AS (
+                SELECT customer_id, SUM(total) AS lifetime_value
+                FROM orders WHERE status = 'DELIVERED' GROUP BY customer_id
+            )
+            SELECT c.customer_id, c.customer_name, t.lifetime_value
+            FROM totals t
+            JOIN customers c ON c.customer_id = t.customer_id
+            WHERE t.lifetime_value > (SELECT AVG(lifetime_value) FROM totals)
+            ORDER BY t.lifetime_value DESC
+        """
+    },
+    "top_menu_items": {
+        "description": "Best-selling menu items by quantity in delivered orders over the last `days` days, top `limit`",
+        "parameters": {"days": 30, "limit": 50},
+        "sql": """
+            SELECT r.restaurant_name, oi.menu_item_id, any_value(oi.item_name) AS item_name,
+                   SUM(oi.quantity) AS quantity_sold,
+                   SUM(oi.quantity * oi.unit_price) AS revenue
+            FROM order_items oi
+            JOIN orders o ON oi.order_id = o.order_id
+            JOIN restaurants r ON r.restaurant_id = o.restaurant_id
+            WHERE o.status = 'DELIVERED'
+              AND o.created_at >= current_date - to_days(CAST($days AS INTEGER))
+            GROUP BY r.restaurant_name, oi.menu_item_id
+            ORDER BY quantity_sold DESC
+            LIMIT $limit
+        """
+    },
+}
+
+
+class AnalyticsEngine:
+    """Embedded DuckDB over the Parquet snapshots, for reports that must not touch MySQL.
+
+    The latest copy of every snapshot row is loaded into an in-memory DuckDB
+    database whenever a new snapshot lands. File access is then switched off
+    and the configuration locked, so queries can only read the loaded tables.
+    """
+
+    def __init__(self, directory: Optional[str] = None):
+        self.directory = directory or settings.ANALYTICS_DIR
+        self._connection: Optional[duckdb.DuckDBPyConnection] = None
+        self._loaded_seq: Optional[int] = None
+        self.snapshot_at: Optional[str] = None
+        self._lock = Lock()
+
+    def refresh(self) -> None:
+        """Load the newest snapshot if it changed since the last load."""
+        state = _read_state(self.directory)
+        if state["seq"] == self._loaded_seq:
+            return
+        with self._lock:
+            if state["seq"] == self._loaded_seq:
+                return
+            connection = duckdb.connect(":memory:")
+            for table in SNAPSHOT_TABLES:
+                parts = _part_files(self.directory, table.name)
+                if not parts:
+                    raise ValueError(f"Analytics snapshot is missing {table.name}")
+                columns = ", ".join(field.name for field in table.schema if field.name != "_snapshot")
+                connection.execute(
+                    f"CREATE TABLE {table.name} AS SELECT {columns} FROM read_parquet(?) {table.latest}",
+                    [parts]
+                )
+            connection.execute("SET enable_external_access = false")
+            connection.execute("SET lock_configuration = true")
+            self._connection = connection
+            self._loaded_seq = state["seq"]
+            self.snapshot_at = state["snapshot_at"]
+            logger.info(f"Loaded analytics snapshot {state['seq']}")
+
+    def query(self, sql: str, params: Optional[Dict[str, Any]] = None,
+              max_rows: Optional[int] = None) -> Dict[str, Any]:
+        """Run one read-only SELECT; returns columns, rows, whether rows were cut off, and the snapshot time."""
+        statements = duckdb.extract_statements(sql)
+        if len(statements) != 1 or statements[0].type != duckdb.StatementType.SELECT:
+            raise ValueError("Only a single SELECT statement is allowed")
+
+        if os.path.exists(os.path.join(self.directory, STATE_FILE)):
+            self.refresh()
+        if self._connection is None:
+            raise ValueError("No analytics snapshot yet; run python -m jobs.snapshot_analytics")
+
+        # A caller may ask for fewer rows, never more than the cap
+        max_rows = min(max_rows or settings.ANALYTICS_MAX_ROWS, settings.ANALYTICS_MAX_ROWS)
+        cursor = self._connection.cursor()
+        try:
+            cursor.execute(sql, params or {})
+            rows = cursor.fetchmany(max_rows + 1)
+            columns = [column[0] for column in cursor.description]
+        finally:
+            cursor.close()
+        return {
+            "columns": columns,
+            "rows": [list(row) for row in rows[:max_rows]],
+            "truncated": len(rows) > max_rows,
+            "snapshot_at": self.snapshot_at
+        }
+
+    def run_report(self, name: str, parameters: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """Run a predefined report; unknown parameters are ignored and missing ones take their defaults."""
+        report = REPORTS.get(name)
+        if report is None:
+            raise ValueError(f"Unknown report: {name}")
+        values = {key: (parameters or {}).get(key, default) for key, default in report["parameters"].items()}
+        for key, value in values.items():
+            if not isinstance(value, int) or value <= 0:
+                raise ValueError(f"{key} must be a positive integer")
+        return self.query(report["sql"], values)
+
+
+# Global analytics engine
+analytics_engine = AnalyticsEngine()
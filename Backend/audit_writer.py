@@ -0,0 +1,252 @@
+from datetime import datetime
+from pathlib import Path
+from threading import Event, Lock, Thread
+from typing import Dict, List, Optional, Tuple
+import fcntl
+import json
+import logging
+import os
+import queue
+import secrets
+import time
+from config import settings
+from database import get_db_manager
+
+logger = logging.getLogger(__name__)
+
+INSERT_AUDIT_LOG = """INSERT INTO AuditLog (table_name, record_id, action, field_name, old_value, new_value,
+                      performed_by, performed_at, ip_address, user_agent)
+                      VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s)"""
+
+# (table_name, record_id, action, field_name, old_value, new_value, performed_by, performed_at,
+#  ip_address, user_agent); JSON-serializable as is, performed_at as 'YYYY-MM-DD HH:MM:SS'
+AuditEvent = Tuple
+
+_RETRY_SECONDS = (0.5, 1, 2, 5)
+
+
+class AuditWriter:
+    """Batches AuditLog inserts off the request path (BR-005, BR-039).
+
+    Each event is appended to a local JSONL spool segment, then queued for
+    the writer thread, which inserts up to AUDIT_BATCH_MAX_EVENTS rows per
+    executemany at least every AUDIT_FLUSH_INTERVAL_MS. A segment is deleted
+    once all of its events are committed. Segments are named per writer and
+    guarded by a flock'd lock file, so with several workers sharing
+    AUDIT_SPOOL_DIR each only replays spools whose process has exited (after
+    a crash or a failed shutdown flush); delivery is at-least-once. When the
+    queue is full, callers wait up to AUDIT_ENQUEUE_TIMEOUT_SECONDS and then
+    insert the event themselves.
+    """
+
+    def __init__(self):
+        self.db = get_db_manager()
+        self.spool_dir = Path(settings.AUDIT_SPOOL_DIR)
+        self._queue: "queue.Queue[Tuple[int, AuditEvent]]" = queue.Queue(maxsize=settings.AUDIT_QUEUE_MAX_EVENTS)
+        self._lock = Lock()
+        self._stopping = Event()
+        self._thread: Optional[Thread] = None
+        self._segment = 0
+        self._spool = None
+        # segment -> [events written, events committed]
+        self._segments: Dict[int, List[int]] = {}
+        # This writer's spool owner id and the fd holding its lock file
+        self._owner = ""
+        self._owner_fd: Optional[int] = None
+        # (lock fd, lock file, segments) of dead owners claimed for replay
+        self._recovered: List[Tuple[int, Path, List[Path]]] = []
+
+    def _segment_path(self, segment: int) -> Path:
+        return self.spool_dir / f"audit-{self._owner}-{segment:09d}.jsonl"
+
+    def _open_segment(self, segment: int) -> None:
+        self._segment = segment
+        self._spool = open(self._segment_path(segment), "a", encoding="utf-8")
+        self._segments[segment] = [0, 0]
+
+    @staticmethod
+    def _try_lock(path: Path) -> Optional[int]:
+        """Exclusive non-blocking flock on path; the fd, or None if a live process holds it."""
+        fd = os.open(path, os.O_RDWR | os.O_CREAT, 0o644)
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except OSError:
+            os.close(fd)
+            return None
+        return fd
+
+    def _claim_dead_owners(self) -> None:
+        """Claim spools whose owner no longer holds its lock (the process exited or crashed).
+
+        Every writer process owns audit-<owner>.lock for its lifetime, so the
+        segments of workers that are still running are never touched.
+        """
+        for lock_path in sorted(self.spool_dir.glob("audit-*.lock")):
+            owner = lock_path.stem[len("audit-"):]
+            if owner == self._owner:
+                continue
+            fd = self._try_lock(lock_path)
+            if fd is None:
+                continue
+            # Listed only after locking, so segments another process already replayed are gone
+            segments = sorted(self.spool_dir.glob(f"audit-{owner}-*.jsonl"))
+            self._recovered.append((fd, lock_path, segments))
+
+    def start(self) -> None:
+        """Start the writer thread; spools left by exited processes are replayed first."""
+        if self._thread is not None:
+            return
+        # Anything still queued from an earlier stop is in a kept segment and replays below
+        while not self._queue.empty():
+            self._queue.get_nowait()
+        self.spool_dir.mkdir(parents=True, exist_ok=True)
+        self._owner = f"{os.getpid()}-{secrets.token_hex(4)}"
+        self._owner_fd = self._try_lock(self.spool_dir / f"audit-{self._owner}.lock")
+        self._claim_dead_owners()
+        self._stopping.clear()
+        with self._lock:
+            self._open_segment(1)
+        self._thread = Thread(target=self._run, name="audit-writer", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Flush queued events and stop the writer thread."""
+        if self._thread is None:
+            return
+        self._stopping.set()
+        self._thread.join()
+        self._thread = None
+        with self._lock:
+            self._spool.close()
+            self._spool = None
+            for segment, (written, committed) in list(self._segments.items()):
+                if committed == written:
+                    self._segment_path(segment).unlink(missing_ok=True)
+                    del self._segments[segment]
+            # Segments still listed are replayed by the next process to find this lock free
+            if not self._segments:
+                (self.spool_dir / f"audit-{self._owner}.lock").unlink(missing_ok=True)
+            self._segments = {}
+        os.close(self._owner_fd)
+        self._owner_fd = None
+        for fd, _, _ in self._recovered:
+            os.close(fd)
+        self._recovered = []
+
+    def enqueue(self, event: AuditEvent) -> None:
+        """Spool and queue one event, or insert it directly when the writer is not running."""
+        line = json.dumps(event) + "\n"
+        with self._lock:
+            spooled = self._spool is not None
+            if spooled:
+                segment = self._segment
+                self._spool.write(line)
+                self._spool.flush()
+                if settings.AUDIT_SPOOL_FSYNC:
+                    os.fsync(self._spool.fileno())
+                self._segments[segment][0] += 1
+        if not spooled:
+            self.db.execute_update(INSERT_AUDIT_LOG, event)
+            return
+
+        try:
+            self._queue.put((segment, event), timeout=settings.AUDIT_ENQUEUE_TIMEOUT_SECONDS)
+        except queue.Full:
+            # The writer is behind; write this one on the caller's connection instead
+            logger.warning("Audit queue full; writing event synchronously")
+            self.db.execute_update(INSERT_AUDIT_LOG, event)
+            with self._lock:
+                self._segments[segment][1] += 1
+
+    def _take_batch(self) -> List[Tuple[int, AuditEvent]]:
+        interval = settings.AUDIT_FLUSH_INTERVAL_MS / 1000
+        try:
+            batch = [self._queue.get(timeout=interval)]
+        except queue.Empty:
+            return []
+        deadline = time.monotonic() + interval
+        while len(batch) < settings.AUDIT_BATCH_MAX_EVENTS:
+            remaining = deadline - time.monotonic()
+            try:
+                batch.append(self._queue.get(timeout=remaining) if remaining > 0 else self._queue.get_nowait())
+            except queue.Empty:
+                break
+        return batch
+
+    def _insert(self, rows: List[AuditEvent]) -> bool:
+        """Insert rows, retrying while the writer runs; False if given up at shutdown."""
+        attempt = 0
+        while True:
+            try:
+                self.db.execute_many(INSERT_AUDIT_LOG, rows)
+                return True
+            except Exception as e:
+                logger.error(f"Failed to write {len(rows)} audit events: {e}")
+                if self._stopping.is_set():
+                    return False
+                self._stopping.wait(_RETRY_SECONDS[min(attempt, len(_RETRY_SECONDS) - 1)])
+                attempt += 1
+
+    def _committed(self, batch: List[Tuple[int, AuditEvent]]) -> None:
+        with self._lock:
+            for segment, _ in batch:
+                self._segments[segment][1] += 1
+            # Start a new segment so this one can be deleted once its queued events are committed
+            if self._segments[self._segment][0]:
+                self._spool.close()
+                self._open_segment(self._segment + 1)
+            for segment, (written, committed) in list(self._segments.items()):
+                if segment != self._segment and committed == written:
+                    self._segment_path(segment).unlink(missing_ok=True)
+                    del self._segments[segment]
+
+    def _replay(self) -> None:
+        while self._recovered:
+            fd, lock_path, segments = self._recovered[0]
+            for path in segments:
+                rows = []
+                with open(path, encoding="utf-8") as spool:
+                    for line in spool:
+                        try:
+                            rows.append(tuple(json.loads(line)))
+                        except ValueError:
+                            # Torn last line from a crash mid-write
+                            logger.warning(f"Skipping unreadable audit event in {path.name}")
+                size = settings.AUDIT_BATCH_MAX_EVENTS
+                if not all(self._insert(rows[i:i + size]) for i in range(0, len(rows), size)):
+                    # Shutting down; stop() releases the lock so a later start retries
+                    return
+                path.unlink()
+                logger.info(f"Replayed {len(rows)} audit events from {path.name}")
+            lock_path.unlink(missing_ok=True)
+            os.close(fd)
+            self._recovered.pop(0)
+
+    def _run(self) -> None:
+        self._replay()
+        while True:
+            batch = self._take_batch()
+            if batch:
+                if self._insert([event for _, event in batch]):
+                    self._committed(batch)
+                else:
+                    # Shutting down with the database unavailable; the spool keeps these events
+                    while not self._queue.empty():
+                        self._queue.get_nowait()
+                    return
+            elif self._stopping.is_set():
+                return
+
+
+def audit_event(table_name: str, record_id: int, action: str, field_name: Optional[str] = None,
+                old_value: Optional[str] = None, new_value: Optional[str] = None,
+                performed_by: Optional[int] = None, ip_address: Optional[str] = None,
+                user_agent: Optional[str] = None) -> AuditEvent:
+    """Build an event stamped with the time of the audited action."""
+    performed_at = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    return (table_name, record_id, action, field_name, old_value, new_value,
+            performed_by, performed_at, ip_address, user_agent)
+
+
+# Global audit writer
+audit_writer = AuditWriter()
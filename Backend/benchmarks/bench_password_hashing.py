@@ -0,0 +1,45 @@
+"""Measure password verifications (logins) per second with the configured scrypt cost.
+
+Run from the Backend directory:
+
+    python -m benchmarks.bench_password_hashing --logins 200
+"""
+import argparse
+import asyncio
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from config import settings
+from passwords import get_pool, hash_password, shutdown_pool, verify_password_async
+
+
+async def _run(stored_hash: str, logins: int) -> float:
+    start = time.perf_counter()
+    results = await asyncio.gather(*(verify_password_async("benchmark-password", stored_hash) for _ in range(logins)))
+    elapsed = time.perf_counter() - start
+    assert all(results)
+    return elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--logins", type=int, default=200, help="verifications to run")
+    args = parser.parse_args()
+
+    workers = get_pool()._max_workers
+    stored_hash = hash_password("benchmark-password")
+    asyncio.run(_run(stored_hash, workers))  # warm up the worker processes
+
+    elapsed = asyncio.run(_run(stored_hash, args.logins))
+    per_second = args.logins / elapsed
+    print(f"scrypt n={settings.PASSWORD_SCRYPT_N} r={settings.PASSWORD_SCRYPT_R} p={settings.PASSWORD_SCRYPT_P}")
+    print(f"{args.logins} logins in {elapsed:.2f}s with {workers} workers")
+    print(f"{per_second:.1f} logins/s total, {per_second / workers:.1f} logins/s per core")
+    shutdown_pool()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,172 @@
+from collections import OrderedDict
+from threading import Lock
+from typing import Any, Callable, Dict, Hashable, Optional
+import asyncio
+import logging
+import time
+from config import settings
+
+logger = logging.getLogger(__name__)
+
+# Stored for lookups that found nothing, so repeated misses skip the database
+NOT_FOUND = object()
+
+
+class TTLCache:
+    """Small in-process cache with per-entry expiry, LRU eviction and hit/miss counters."""
+
+    def __init__(self, ttl_seconds: float, max_entries: int = 1024):
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[Hashable, tuple]" = OrderedDict()
+        self._lock = Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """Return the cached value, or None if missing or expired."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            expires_at, value = entry
+            if expires_at < time.monotonic():
+                del self._entries[key]
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """Store a value, evicting the least recently used entry when full."""
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl_seconds, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, key: Hashable) -> None:
+        """Drop a single entry."""
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        """Drop every entry."""
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """Size and hit/miss counters since startup."""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "ttl_seconds": self.ttl_seconds,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0
+            }
+
+
+class ReportCache:
+    """Cache for aggregate report results with stale-while-revalidate and single-flight.
+
+    A result younger than ttl_seconds is served as is. Up to stale_seconds
+    past that it is still served, and one background refresh is started.
+    Older or missing results are computed while the caller waits. Concurrent
+    callers for the same key share one in-flight computation, which runs in
+    a worker thread. Used from the event loop only.
+    """
+
+    def __init__(self, ttl_seconds: float, stale_seconds: float, max_entries: int = 1024):
+        self.ttl_seconds = ttl_seconds
+        self.stale_seconds = stale_seconds
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[Hashable, tuple]" = OrderedDict()
+        self._inflight: Dict[Hashable, asyncio.Task] = {}
+        self.hits = 0
+        self.stale_hits = 0
+        self.misses = 0
+        self.refresh_errors = 0
+
+    async def _compute(self, key: Hashable, compute: Callable[[], Any]) -> Any:
+        try:
+            value = await asyncio.to_thread(compute)
+            self._entries[key] = (time.monotonic(), value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+            return value
+        finally:
+            self._inflight.pop(key, None)
+
+    def _start(self, key: Hashable, compute: Callable[[], Any]) -> asyncio.Task:
+        task = self._inflight.get(key)
+        if task is None:
+            task = self._inflight[key] = asyncio.create_task(self._compute(key, compute))
+        return task
+
+    def _refresh_done(self, task: asyncio.Task) -> None:
+        if not task.cancelled() and task.exception() is not None:
+            self.refresh_errors += 1
+            logger.error(f"Failed to refresh cached report: {task.exception()}")
+
+    async def get(self, key: Hashable, compute: Callable[[], Any]) -> Any:
+        """Return the cached result for key, computing it with compute() when needed."""
+        entry = self._entries.get(key)
+        if entry is not None:
+            computed_at, value = entry
+            age = time.monotonic() - computed_at
+            if age <= self.ttl_seconds:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return value
+            if age <= self.ttl_seconds + self.stale_seconds:
+                self._entries.move_to_end(key)
+                self.stale_hits += 1
+                if key not in self._inflight:
+                    self._start(key, compute).add_done_callback(self._refresh_done)
+                return value
+        self.misses += 1
+        # Shielded so a disconnecting caller does not cancel the computation others wait on
+        return await asyncio.shield(self._start(key, compute))
+
+    def clear(self) -> None:
+        """Drop every entry (in-flight computations still store their result)."""
+        self._entries.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """Size and hit/stale/miss counters since startup."""
+        lookups = self.hits + self.stale_hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "max_entries": self.max_entries,
+            "ttl_seconds": self.ttl_seconds,
+            "stale_seconds": self.stale_seconds,
+            "in_flight": len(self._inflight),
+            "hits": self.hits,
+            "stale_hits": self.stale_hits,
+            "misses": self.misses,
+            "refresh_errors": self.refresh_errors,
+            "hit_rate": round((self.hits + self.stale_hits) / lookups, 4) if lookups else 0.0
+        }
+
+
+# Restaurant menu items keyed by restaurant_id
+menu_cache = TTLCache(ttl_seconds=60)
+
+# Accounts ("id", account_id), email lookups ("email", email) and
+# profiles ("customer", id) / ("restaurant", id)
+account_cache = TTLCache(ttl_seconds=60, max_entries=20000)
+
+# Aggregated customer profile pages keyed by customer_id; short-lived, not invalidated per write
+profile_cache = TTLCache(ttl_seconds=10, max_entries=5000)
+
+# Stored fulfillment latency sketches by stage, keyed by restaurant_id or "platform"
+latency_cache = TTLCache(ttl_seconds=60, max_entries=5000)
+
+# Aggregate report results keyed by (report, *parameters)
+report_cache = ReportCache(settings.REPORT_CACHE_TTL_SECONDS, settings.REPORT_CACHE_STALE_SECONDS)
@@ -18,6 +18,52 @@ class Settings:
     # Application settings
     SECRET_KEY: str = os.getenv("SECRET_KEY", "fallback-secret-key")
     DEBUG: bool = os.getenv("DEBUG", "False").lower() == "true"
+    SESSION_TTL_SECONDS: int = int(os.getenv("SESSION_TTL_SECONDS", "3600"))
+    
+    # Password hashing (scrypt cost and worker processes; 0 workers = one per core)
+    PASSWORD_SCRYPT_N: int = int(os.getenv("PASSWORD_SCRYPT_N", "16384"))
+    PASSWORD_SCRYPT_R: int = int(os.getenv("PASSWORD_SCRYPT_R", "8"))
+    PASSWORD_SCRYPT_P: int = int(os.getenv("PASSWORD_SCRYPT_P", "1"))
+    PASSWORD_HASH_WORKERS: int = int(os.getenv("PASSWORD_HASH_WORKERS", "0"))
+    
+    # Delivery quotes: "max_km:fee" tiers, kitchen time and courier speed
+    DELIVERY_FEE_TIERS: str = os.getenv("DELIVERY_FEE_TIERS", "3:2.99,6:4.99,10:7.99")
+    DELIVERY_PREP_MINUTES: int = int(os.getenv("DELIVERY_PREP_MINUTES", "15"))
+    DELIVERY_SPEED_KMH: float = float(os.getenv("DELIVERY_SPEED_KMH", "25"))
+    
+    # Login throttling (BR-004)
+    LOGIN_MAX_FAILURES_PER_EMAIL: int = int(os.getenv("LOGIN_MAX_FAILURES_PER_EMAIL", "5"))
+    LOGIN_MAX_FAILURES_PER_IP: int = int(os.getenv("LOGIN_MAX_FAILURES_PER_IP", "50"))
+    LOGIN_WINDOW_SECONDS: int = int(os.getenv("LOGIN_WINDOW_SECONDS", "900"))
+    LOGIN_FLUSH_INTERVAL_SECONDS: float = float(os.getenv("LOGIN_FLUSH_INTERVAL_SECONDS", "5"))
+    
+    # Popular item counters: how often sales are written and counters reloaded
+    ITEM_SALES_FLUSH_INTERVAL_SECONDS: float = float(os.getenv("ITEM_SALES_FLUSH_INTERVAL_SECONDS", "10"))
+    ITEM_SALES_REFRESH_SECONDS: float = float(os.getenv("ITEM_SALES_REFRESH_SECONDS", "300"))
+    
+    # Fulfillment latency sketches: how often this worker's samples are merged into FulfillmentSketch
+    LATENCY_FLUSH_INTERVAL_SECONDS: float = float(os.getenv("LATENCY_FLUSH_INTERVAL_SECONDS", "10"))
+    
+    # Report cache: results are fresh for TTL, then served stale for up to STALE more seconds while refreshing
+    REPORT_CACHE_TTL_SECONDS: float = float(os.getenv("REPORT_CACHE_TTL_SECONDS", "30"))
+    REPORT_CACHE_STALE_SECONDS: float = float(os.getenv("REPORT_CACHE_STALE_SECONDS", "300"))
+    
+    # Audit log writer: queue bound, batch size and interval, caller wait when full, and crash spool
+    AUDIT_QUEUE_MAX_EVENTS: int = int(os.getenv("AUDIT_QUEUE_MAX_EVENTS", "10000"))
+    AUDIT_BATCH_MAX_EVENTS: int = int(os.getenv("AUDIT_BATCH_MAX_EVENTS", "500"))
+    AUDIT_FLUSH_INTERVAL_MS: int = int(os.getenv("AUDIT_FLUSH_INTERVAL_MS", "200"))
+    AUDIT_ENQUEUE_TIMEOUT_SECONDS: float = float(os.getenv("AUDIT_ENQUEUE_TIMEOUT_SECONDS", "1"))
+    AUDIT_SPOOL_DIR: str = os.getenv("AUDIT_SPOOL_DIR", "audit_spool")
+    AUDIT_SPOOL_FSYNC: bool = os.getenv("AUDIT_SPOOL_FSYNC", "False").lower() == "true"
+    
+    # Time-series metrics: how long closed buckets are served from cache (picks up late status changes)
+    TIMESERIES_CLOSED_BUCKET_TTL_SECONDS: float = float(os.getenv("TIMESERIES_CLOSED_BUCKET_TTL_SECONDS", "900"))
+    
+    # Analytics: Parquet snapshot directory, row cap per result, and accounts allowed to run reports
+    ANALYTICS_DIR: str = os.getenv("ANALYTICS_DIR", "analytics_data")
+    ANALYTICS_MAX_ROWS: int = int(os.getenv("ANALYTICS_MAX_ROWS", "10000"))
+    ADMIN_ACCOUNT_IDS: set = {int(account_id) for account_id in os.getenv("ADMIN_ACCOUNT_IDS", "").split(",")
+                              if account_id.strip()}
     
     @property
     def database_url(self) -> str:
@@ -6,11 +6,14 @@ from .account_crud import AccountCRUD, CustomerCRUD, RestaurantCRUD
 # Address and Payment CRUD
 from .address_crud import AddressCRUD
 from .payment_method_crud import PaymentMethodCRUD
+from .notification_crud import NotificationCRUD
 
 # Menu and Restaurant CRUD
 from .menu_crud import MenuCRUD, MenuItemCRUD
 from .modifier_crud import ModifierCRUD, ModifierOptionCRUD
 from .business_hours_crud import BusinessHoursCRUD
+from .delivery_zone_crud import DeliveryZoneCRUD
+from .menu_import_crud import MenuImportCRUD
 
 # Order CRUD
 from .order_crud import OrderCRUD, OrderItemCRUD
@@ -25,6 +28,7 @@ from .price_history_crud import MenuItemPriceHistoryCRUD
 # Audit and Utility CRUD
 from .audit_crud import AuditLogCRUD
 from .utility_crud import UtilityCRUD
+from .stats_crud import RestaurantStatsCRUD, CustomerStatsCRUD
 
 __all__ = [
     # Account and Customer
@@ -35,6 +39,7 @@ __all__ = [
     # Address and Payment
     'AddressCRUD',
     'PaymentMethodCRUD',
+    'NotificationCRUD',
     
     # Menu and Restaurant
     'MenuCRUD',
@@ -42,6 +47,8 @@ __all__ = [
     'ModifierCRUD',
     'ModifierOptionCRUD',
     'BusinessHoursCRUD',
+    'DeliveryZoneCRUD',
+    'MenuImportCRUD',
     
     # Order
     'OrderCRUD',
@@ -56,5 +63,7 @@ __all__ = [
     
     # Audit and Utility
     'AuditLogCRUD',
-    'UtilityCRUD'
+    'UtilityCRUD',
+    'RestaurantStatsCRUD',
+    'CustomerStatsCRUD'
 ]
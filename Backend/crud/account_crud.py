@@ -1,5 +1,15 @@
-from typing import List, Optional
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple, Union
+from mysql.connector import IntegrityError
+from mysql.connector import errorcode
 from database import get_db_manager
+from cache import NOT_FOUND, account_cache, profile_cache
+from geo import GEOHASH_PRECISION, bounding_box, geohash_cover
+from spatial_index import restaurant_index
+from schedule_index import schedule_index
+from delivery_quotes import delivery_quotes
+from session_tokens import revoked_sessions
+from passwords import hash_password
 from models import (
     Account, AccountCreate, AccountUpdate,
     Customer, CustomerCreate, CustomerUpdate,
@@ -7,9 +17,20 @@ from models import (
     Address, AddressCreate, AddressUpdate,
     PaymentMethod, PaymentMethodCreate, PaymentMethodUpdate,
     BusinessHours, BusinessHoursCreate, BusinessHoursUpdate,
-    PaginationParams, AccountStatusEnum
+    PaginationParams, AccountStatusEnum, RoleEnum,
+    Order, CustomerOrderSummary, CustomerProfile
 )
-import hashlib
+
+
+def _email_key(email: str) -> tuple:
+    return ("email", email.strip().casefold())
+
+
+def invalidate_account(account_id: int) -> None:
+    """Drop the cached account and profiles for an account id."""
+    for kind in ("id", "customer", "restaurant"):
+        account_cache.invalidate((kind, account_id))
+    profile_cache.invalidate(account_id)
 
 
 class AccountCRUD:
@@ -17,27 +38,116 @@ class AccountCRUD:
         self.db = get_db_manager()
     
     def _hash_password(self, password: str) -> str:
-        """Hash password using SHA-256."""
-        return hashlib.sha256(password.encode()).hexdigest()
+        """Hash password with scrypt (see passwords.py)."""
+        return hash_password(password)
     
-    def create_account(self, account_data: AccountCreate, created_by: Optional[int] = None) -> int:
-        """Create a new account with audit trail (BR-005)."""
+    def create_account(self, account_data: AccountCreate, created_by: Optional[int] = None,
+                       password_hash: Optional[str] = None) -> int:
+        """Create a new account with audit trail (BR-005).
+        
+        Async callers pass password_hash from hash_password_async; otherwise
+        the password is hashed here, blocking the calling thread.
+        """
         query = "INSERT INTO Account (email, password_hash, role, status, created_by) VALUES (%s, %s, %s, 'ACTIVE', %s)"
-        password_hash = self._hash_password(account_data.password)
+        password_hash = password_hash or self._hash_password(account_data.password)
         params = (account_data.email, password_hash, account_data.role.value, created_by)
-        return self.db.execute_update(query, params)
+        account_id = self.db.execute_update(query, params)
+        account_cache.invalidate(_email_key(account_data.email))
+        return account_id
+    
+    def register_account(self, email: str, password_hash: str, role: RoleEnum,
+                         profile: Union[CustomerCreate, RestaurantCreate],
+                         address_data: Optional[AddressCreate] = None) -> int:
+        """Create account, profile and optional customer address in one transaction (BR-005, BR-006).
+        
+        The unique email key decides duplicates, so concurrent sign-ups can't both
+        pass a pre-check. address_data.customer_id is replaced by the new account id.
+        """
+        if address_data is not None and (address_data.latitude is None or address_data.longitude is None):
+            location = delivery_quotes.geocode(address_data.postal_code, address_data.country)
+            if location:
+                address_data = address_data.model_copy(update={"latitude": location[0], "longitude": location[1]})
+        
+        try:
+            with self.db.transaction() as cursor:
+                cursor.execute(
+                    "INSERT INTO Account (email, password_hash, role, status) VALUES (%s, %s, %s, 'ACTIVE')",
+                    (email, password_hash, role.value)
+                )
+                account_id = cursor.lastrowid
+                
+                if role == RoleEnum.CUSTOMER:
+                    cursor.execute(
+                        "INSERT INTO Customer (customer_id, customer_name, phone) VALUES (%s, %s, %s)",
+                        (account_id, profile.customer_name, profile.phone)
+                    )
+                    if address_data is not None:
+                        cursor.execute(
+                            """INSERT INTO Address (customer_id, address_label, street_address, city, state, postal_code, 
+                               country, is_default, latitude, longitude) 
+                               VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s)""",
+                            (account_id, address_data.address_label, address_data.street_address,
+                             address_data.city, address_data.state, address_data.postal_code,
+                             address_data.country, address_data.is_default,
+                             address_data.latitude, address_data.longitude)
+                        )
+                else:
+                    cursor.execute(
+                        """INSERT INTO Restaurant (restaurant_id, restaurant_name, contact_phone, contact_email, operating_status, 
+                           street_address, city, state, postal_code, country, latitude, longitude, geohash) 
+                           VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, ST_GeoHash(%s, %s, %s))""",
+                        (account_id, profile.restaurant_name, profile.contact_phone,
+                         profile.contact_email, profile.operating_status.value,
+                         profile.street_address, profile.city, profile.state,
+                         profile.postal_code, profile.country,
+                         profile.latitude, profile.longitude,
+                         profile.longitude, profile.latitude, GEOHASH_PRECISION)
+                    )
+        except IntegrityError as e:
+            if e.errno == errorcode.ER_DUP_ENTRY:
+                raise ValueError("Email already registered")
+            raise
+        
+        account_cache.invalidate(_email_key(email))
+        if role == RoleEnum.RESTAURANT:
+            restaurant_index.refresh_restaurant(account_id)
+            schedule_index.refresh_restaurant(account_id)
+        return account_id
     
     def get_account_by_id(self, account_id: int) -> Optional[Account]:
-        """Get account by ID."""
+        """Get account by ID (cached)."""
+        cached = account_cache.get(("id", account_id))
+        if cached is not None:
+            return cached
         query = "SELECT * FROM Account WHERE account_id = %s"
         result = self.db.execute_query(query, (account_id,), fetch_one=True)
-        return Account(**result) if result else None
+        if not result:
+            return None
+        account = Account(**result)
+        account_cache.set(("id", account_id), account)
+        return account
     
     def get_account_by_email(self, email: str) -> Optional[Account]:
-        """Get account by email."""
+        """Get account by email (cached, including unknown emails)."""
+        key = _email_key(email)
+        cached = account_cache.get(key)
+        if cached is NOT_FOUND:
+            return None
+        if cached is not None:
+            account = self.get_account_by_id(cached)
+            # The id mapping can outlive an email change or delete
+            if account is not None and _email_key(account.email) == key:
+                return account
+        
         query = "SELECT * FROM Account WHERE email = %s"
         result = self.db.execute_query(query, (email,), fetch_one=True)
-        return Account(**result) if result else None
+        if not result:
+            account_cache.set(key, NOT_FOUND)
+            return None
+        account = Account(**result)
+        account_cache.set(("id", account.account_id), account)
+        account_cache.set(key, account.account_id)
+        return account
     
     def get_accounts_by_role(self, role: str) -> List[Account]:
         """Get all accounts by role."""
@@ -63,8 +173,9 @@ class AccountCRUD:
         results = self.db.execute_query(query, (pagination.limit, pagination.offset))
         return [Account(**row) for row in results] if results else []
     
-    def update_account(self, account_id: int, account_data: AccountUpdate) -> int:
-        """Update account information."""
+    def update_account(self, account_id: int, account_data: AccountUpdate,
+                       password_hash: Optional[str] = None) -> int:
+        """Update account information (password_hash: precomputed hash of account_data.password)."""
         updates = []
         params = []
         
@@ -74,7 +185,7 @@ class AccountCRUD:
         
         if account_data.password is not None:
             updates.append("password_hash = %s")
-            params.append(self._hash_password(account_data.password))
+            params.append(password_hash or self._hash_password(account_data.password))
         
         if account_data.role is not None:
             updates.append("role = %s")
@@ -91,33 +202,80 @@ class AccountCRUD:
         params.append(account_id)
         
         query = f"UPDATE Account SET {', '.join(updates)} WHERE account_id = %s"
-        return self.db.execute_update(query, tuple(params))
+        rows_affected = self.db.execute_update(query, tuple(params))
+        invalidate_account(account_id)
+        if account_data.email is not None:
+            account_cache.invalidate(_email_key(account_data.email))
+        return rows_affected
     
-    def update_password(self, account_id: int, new_password: str) -> int:
-        """Update password only."""
+    def update_password(self, account_id: int, new_password: str, password_hash: Optional[str] = None) -> int:
+        """Update password only (password_hash: precomputed hash of new_password)."""
         query = "UPDATE Account SET password_hash = %s, updated_at = CURRENT_TIMESTAMP WHERE account_id = %s"
-        password_hash = self._hash_password(new_password)
-        return self.db.execute_update(query, (password_hash, account_id))
+        password_hash = password_hash or self._hash_password(new_password)
+        rows_affected = self.db.execute_update(query, (password_hash, account_id))
+        invalidate_account(account_id)
+        revoked_sessions.revoke_account(account_id)
+        return rows_affected
+    
+    def set_password_hash(self, account_id: int, password_hash: str) -> int:
+        """Store an already computed hash, e.g. when upgrading a legacy hash at login."""
+        query = "UPDATE Account SET password_hash = %s WHERE account_id = %s"
+        rows_affected = self.db.execute_update(query, (password_hash, account_id))
+        invalidate_account(account_id)
+        return rows_affected
     
     def update_account_status(self, account_id: int, status: AccountStatusEnum) -> int:
         """Update account status (BR-003)."""
         query = "UPDATE Account SET status = %s, updated_at = CURRENT_TIMESTAMP WHERE account_id = %s"
-        return self.db.execute_update(query, (status.value, account_id))
+        rows_affected = self.db.execute_update(query, (status.value, account_id))
+        invalidate_account(account_id)
+        restaurant_index.refresh_restaurant(account_id)
+        if status != AccountStatusEnum.ACTIVE:
+            revoked_sessions.revoke_account(account_id)
+        return rows_affected
     
     def record_failed_login(self, account_id: int) -> int:
         """Record failed login attempt (BR-004)."""
         query = "UPDATE Account SET failed_login_attempts = failed_login_attempts + 1, last_login_attempt = CURRENT_TIMESTAMP WHERE account_id = %s"
-        return self.db.execute_update(query, (account_id,))
+        rows_affected = self.db.execute_update(query, (account_id,))
+        invalidate_account(account_id)
+        return rows_affected
     
     def reset_failed_logins(self, account_id: int) -> int:
         """Reset failed login attempts (BR-004)."""
         query = "UPDATE Account SET failed_login_attempts = 0, last_login_attempt = CURRENT_TIMESTAMP WHERE account_id = %s"
-        return self.db.execute_update(query, (account_id,))
+        rows_affected = self.db.execute_update(query, (account_id,))
+        invalidate_account(account_id)
+        return rows_affected
+    
+    def record_failed_logins_bulk(self, failures: Dict[int, Tuple[int, datetime]]) -> int:
+        """Add batched failed-attempt counts per account (BR-004)."""
+        query = """UPDATE Account SET failed_login_attempts = failed_login_attempts + %s, last_login_attempt = %s 
+                   WHERE account_id = %s"""
+        params = [(count, last_attempt, account_id) for account_id, (count, last_attempt) in failures.items()]
+        rows_affected = self.db.execute_many(query, params)
+        for account_id in failures:
+            invalidate_account(account_id)
+        return rows_affected
+    
+    def reset_failed_logins_bulk(self, account_ids: List[int]) -> int:
+        """Reset failed login attempts for several accounts in one statement (BR-004)."""
+        placeholders = ", ".join(["%s"] * len(account_ids))
+        query = f"""UPDATE Account SET failed_login_attempts = 0, last_login_attempt = CURRENT_TIMESTAMP 
+                    WHERE account_id IN ({placeholders})"""
+        rows_affected = self.db.execute_update(query, tuple(account_ids))
+        for account_id in account_ids:
+            invalidate_account(account_id)
+        return rows_affected
     
     def delete_account(self, account_id: int) -> int:
         """Delete account (will cascade to Customer/Restaurant)."""
         query = "DELETE FROM Account WHERE account_id = %s"
-        return self.db.execute_update(query, (account_id,))
+        rows_affected = self.db.execute_update(query, (account_id,))
+        invalidate_account(account_id)
+        restaurant_index.refresh_restaurant(account_id)
+        revoked_sessions.revoke_account(account_id)
+        return rows_affected
 
 
 class CustomerCRUD:
@@ -130,7 +288,10 @@ class CustomerCRUD:
         return self.db.execute_update(query, (account_id, customer_data.customer_name, customer_data.phone))
     
     def get_customer_by_id(self, customer_id: int) -> Optional[Customer]:
-        """Get customer by ID with account information."""
+        """Get customer by ID with account information (cached)."""
+        cached = account_cache.get(("customer", customer_id))
+        if cached is not None:
+            return cached
         query = """
         SELECT c.*, a.email, a.created_at, a.updated_at 
         FROM Customer c 
@@ -138,7 +299,62 @@ class CustomerCRUD:
         WHERE c.customer_id = %s
         """
         result = self.db.execute_query(query, (customer_id,), fetch_one=True)
-        return Customer(**result) if result else None
+        if not result:
+            return None
+        customer = Customer(**result)
+        account_cache.set(("customer", customer_id), customer)
+        return customer
+    
+    def get_customer_profile(self, customer_id: int) -> Optional[CustomerProfile]:
+        """Customer, addresses, payment methods, active orders and order summary on one connection.
+        
+        Cached per customer for a few seconds (profile_cache).
+        """
+        cached = profile_cache.get(customer_id)
+        if cached is not None:
+            return cached
+        
+        query = """
+        SELECT c.*, a.email, a.created_at, a.updated_at 
+        FROM Customer c 
+        JOIN Account a ON c.customer_id = a.account_id 
+        WHERE c.customer_id = %s;
+        
+        SELECT * FROM Address WHERE customer_id = %s ORDER BY is_default DESC, created_at DESC;
+        
+        SELECT * FROM PaymentMethod WHERE customer_id = %s ORDER BY is_default DESC, created_at DESC;
+        
+        SELECT o.*, r.restaurant_name 
+        FROM `Order` o 
+        JOIN Restaurant r ON o.restaurant_id = r.restaurant_id 
+        WHERE o.customer_id = %s 
+          AND o.status NOT IN ('DELIVERED', 'CANCELLED', 'FAILED')
+        ORDER BY o.created_at DESC;
+        
+        SELECT total_orders, total_spent, last_order_date
+        FROM CustomerStats 
+        WHERE customer_id = %s
+        """
+        customers, addresses, payment_methods, orders, summaries = self.db.execute_multi(
+            query, (customer_id,) * 5
+        )
+        if not customers:
+            return None
+        
+        customer = Customer(**customers[0])
+        profile = CustomerProfile(
+            customer=customer,
+            addresses=[Address(**row) for row in addresses],
+            payment_methods=[PaymentMethod(**row) for row in payment_methods],
+            active_orders=[Order(**row) for row in orders],
+            order_summary=CustomerOrderSummary(
+                customer_id=customer.customer_id,
+                customer_name=customer.customer_name,
+                **(summaries[0] if summaries else {"total_orders": 0, "total_spent": 0})
+            )
+        )
+        profile_cache.set(customer_id, profile)
+        return profile
     
     def get_customer_by_email(self, email: str) -> Optional[Customer]:
         """Get customer by email."""
@@ -193,12 +409,16 @@ class CustomerCRUD:
         
         params.append(customer_id)
         query = f"UPDATE Customer SET {', '.join(updates)} WHERE customer_id = %s"
-        return self.db.execute_update(query, tuple(params))
+        rows_affected = self.db.execute_update(query, tuple(params))
+        invalidate_account(customer_id)
+        return rows_affected
     
     def delete_customer(self, customer_id: int) -> int:
         """Delete customer."""
         query = "DELETE FROM Customer WHERE customer_id = %s"
-        return self.db.execute_update(query, (customer_id,))
+        rows_affected = self.db.execute_update(query, (customer_id,))
+        invalidate_account(customer_id)
+        return rows_affected
 
 
 class RestaurantCRUD:
@@ -208,18 +428,25 @@ class RestaurantCRUD:
     def create_restaurant(self, account_id: int, restaurant_data: RestaurantCreate) -> int:
         """Create a new restaurant (account_id should already exist) (BR-010, BR-012, BR-013)."""
         query = """INSERT INTO Restaurant (restaurant_id, restaurant_name, contact_phone, contact_email, operating_status, 
-                   street_address, city, state, postal_code, country, latitude, longitude) 
-                   VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)"""
-        return self.db.execute_update(query, (
+                   street_address, city, state, postal_code, country, latitude, longitude, geohash) 
+                   VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, ST_GeoHash(%s, %s, %s))"""
+        result = self.db.execute_update(query, (
             account_id, restaurant_data.restaurant_name, restaurant_data.contact_phone,
             restaurant_data.contact_email, restaurant_data.operating_status.value,
             restaurant_data.street_address, restaurant_data.city, restaurant_data.state,
             restaurant_data.postal_code, restaurant_data.country,
-            restaurant_data.latitude, restaurant_data.longitude
+            restaurant_data.latitude, restaurant_data.longitude,
+            restaurant_data.longitude, restaurant_data.latitude, GEOHASH_PRECISION
         ))
+        restaurant_index.refresh_restaurant(account_id)
+        schedule_index.refresh_restaurant(account_id)
+        return result
     
     def get_restaurant_by_id(self, restaurant_id: int) -> Optional[Restaurant]:
-        """Get restaurant by ID with account information."""
+        """Get restaurant by ID with account information (cached)."""
+        cached = account_cache.get(("restaurant", restaurant_id))
+        if cached is not None:
+            return cached
         query = """
         SELECT r.*, a.email, a.created_at, a.updated_at 
         FROM Restaurant r 
@@ -227,7 +454,11 @@ class RestaurantCRUD:
         WHERE r.restaurant_id = %s
         """
         result = self.db.execute_query(query, (restaurant_id,), fetch_one=True)
-        return Restaurant(**result) if result else None
+        if not result:
+            return None
+        restaurant = Restaurant(**result)
+        account_cache.set(("restaurant", restaurant_id), restaurant)
+        return restaurant
     
     def get_restaurant_by_email(self, email: str) -> Optional[Restaurant]:
         """Get restaurant by email."""
@@ -276,20 +507,39 @@ class RestaurantCRUD:
         return [Restaurant(**row) for row in results] if results else []
     
     def get_restaurants_within_radius(self, latitude: float, longitude: float, radius_km: float) -> List[dict]:
-        """Get restaurants within radius using Haversine formula (BR-013)."""
-        query = """
+        """Get restaurants within radius using Haversine formula (BR-013).
+        
+        Candidates are narrowed with the indexed geohash prefix and a bounding box,
+        so the exact distance is only computed for restaurants near the point.
+        """
+        min_lat, max_lat, min_lon, max_lon = bounding_box(latitude, longitude, radius_km)
+        prefixes = geohash_cover(min_lat, max_lat, min_lon, max_lon)
+        
+        filters = ["r.latitude BETWEEN %s AND %s"]
+        filter_params = [min_lat, max_lat]
+        
+        if min_lon >= -180.0 and max_lon <= 180.0:
+            filters.append("r.longitude BETWEEN %s AND %s")
+            filter_params.extend([min_lon, max_lon])
+        
+        if prefixes:
+            filters.append("(" + " OR ".join(["r.geohash LIKE %s"] * len(prefixes)) + ")")
+            filter_params.extend(f"{prefix}%" for prefix in prefixes)
+        
+        query = f"""
         SELECT r.*, a.email, a.status,
-            (6371 * acos(cos(radians(%s)) * cos(radians(r.latitude)) * 
+            (6371 * acos(LEAST(1.0, cos(radians(%s)) * cos(radians(r.latitude)) * 
             cos(radians(r.longitude) - radians(%s)) + 
-            sin(radians(%s)) * sin(radians(r.latitude)))) AS distance_km
+            sin(radians(%s)) * sin(radians(r.latitude))))) AS distance_km
         FROM Restaurant r 
         JOIN Account a ON r.restaurant_id = a.account_id 
-        WHERE r.latitude IS NOT NULL AND r.longitude IS NOT NULL
+        WHERE {' AND '.join(filters)}
           AND a.status = 'ACTIVE'
         HAVING distance_km <= %s
         ORDER BY distance_km
         """
-        results = self.db.execute_query(query, (latitude, longitude, latitude, radius_km))
+        params = (latitude, longitude, latitude, *filter_params, radius_km)
+        results = self.db.execute_query(query, params)
         return results if results else []
     
     def update_restaurant(self, restaurant_id: int, restaurant_data: RestaurantUpdate) -> int:
@@ -341,17 +591,30 @@ class RestaurantCRUD:
             updates.append("longitude = %s")
             params.append(restaurant_data.longitude)
         
+        if restaurant_data.latitude is not None or restaurant_data.longitude is not None:
+            # Assignments run left to right, so this sees the new coordinates
+            updates.append("geohash = ST_GeoHash(longitude, latitude, %s)")
+            params.append(GEOHASH_PRECISION)
+        
         if not updates:
             return 0
         
         params.append(restaurant_id)
         query = f"UPDATE Restaurant SET {', '.join(updates)} WHERE restaurant_id = %s"
-        return self.db.execute_update(query, tuple(params))
+        rows_affected = self.db.execute_update(query, tuple(params))
+        invalidate_account(restaurant_id)
+        restaurant_index.refresh_restaurant(restaurant_id)
+        schedule_index.refresh_restaurant(restaurant_id)
+        return rows_affected
     
     def update_operating_status(self, restaurant_id: int, status: str) -> int:
         """Update restaurant operating status (BR-012)."""
         query = "UPDATE Restaurant SET operating_status = %s WHERE restaurant_id = %s"
-        return self.db.execute_update(query, (status, restaurant_id))
+        rows_affected = self.db.execute_update(query, (status, restaurant_id))
+        invalidate_account(restaurant_id)
+        restaurant_index.refresh_restaurant(restaurant_id)
+        schedule_index.refresh_restaurant(restaurant_id)
+        return rows_affected
     
     def update_restaurant_location(self, restaurant_id: int, street_address: str, city: str, 
                                    state: str, postal_code: str, country: str,
@@ -359,15 +622,24 @@ class RestaurantCRUD:
         """Update restaurant location only."""
         query = """UPDATE Restaurant 
                    SET street_address = %s, city = %s, state = %s, postal_code = %s, country = %s,
-                       latitude = %s, longitude = %s
+                       latitude = %s, longitude = %s, geohash = ST_GeoHash(%s, %s, %s)
                    WHERE restaurant_id = %s"""
-        return self.db.execute_update(query, (street_address, city, state, postal_code, country,
-                                             latitude, longitude, restaurant_id))
+        rows_affected = self.db.execute_update(query, (street_address, city, state, postal_code, country,
+                                                      latitude, longitude, longitude, latitude, GEOHASH_PRECISION,
+                                                      restaurant_id))
+        invalidate_account(restaurant_id)
+        restaurant_index.refresh_restaurant(restaurant_id)
+        schedule_index.refresh_restaurant(restaurant_id)
+        return rows_affected
     
     def delete_restaurant(self, restaurant_id: int) -> int:
         """Delete restaurant."""
         query = "DELETE FROM Restaurant WHERE restaurant_id = %s"
-        return self.db.execute_update(query, (restaurant_id,))
+        rows_affected = self.db.execute_update(query, (restaurant_id,))
+        invalidate_account(restaurant_id)
+        restaurant_index.refresh_restaurant(restaurant_id)
+        schedule_index.refresh_restaurant(restaurant_id)
+        return rows_affected
 
 
 class AddressCRUD:
@@ -1,5 +1,7 @@
 from typing import List, Optional
 from database import get_db_manager
+from delivery_zones import delivery_zone_index
+from delivery_quotes import delivery_quotes
 from models import (
     Address, AddressCreate, AddressUpdate,
     PaginationParams
@@ -18,12 +20,20 @@ class AddressCRUD:
         if address_data.is_default:
             self.unset_all_defaults(address_data.customer_id)
         
-        query = """INSERT INTO Address (customer_id, address_label, street_address, city, state, postal_code, country, is_default) 
-                   VALUES (%s, %s, %s, %s, %s, %s, %s, %s)"""
+        # Geocode from the postal code table when no coordinates are supplied
+        if address_data.latitude is None or address_data.longitude is None:
+            location = delivery_quotes.geocode(address_data.postal_code, address_data.country)
+            if location:
+                address_data = address_data.model_copy(update={"latitude": location[0], "longitude": location[1]})
+        
+        query = """INSERT INTO Address (customer_id, address_label, street_address, city, state, postal_code, country, 
+                   is_default, latitude, longitude) 
+                   VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s)"""
         return self.db.execute_update(query, (
             address_data.customer_id, address_data.address_label,
             address_data.street_address, address_data.city, address_data.state,
-            address_data.postal_code, address_data.country, address_data.is_default
+            address_data.postal_code, address_data.country, address_data.is_default,
+            address_data.latitude, address_data.longitude
         ))
     
     def get_address_by_id(self, address_id: int) -> Optional[Address]:
@@ -79,6 +89,26 @@ class AddressCRUD:
             updates.append("country = %s")
             params.append(address_data.country)
         
+        if address_data.latitude is not None:
+            updates.append("latitude = %s")
+            params.append(address_data.latitude)
+        
+        if address_data.longitude is not None:
+            updates.append("longitude = %s")
+            params.append(address_data.longitude)
+        
+        if address_data.postal_code is not None and address_data.latitude is None and address_data.longitude is None:
+            # New postal code without coordinates: re-geocode (NULL if unknown, rather than keep stale ones)
+            country = address_data.country
+            if country is None:
+                address = self.get_address_by_id(address_id)
+                country = address.country if address else None
+            location = delivery_quotes.geocode(address_data.postal_code, country)
+            updates.append("latitude = %s")
+            params.append(location[0] if location else None)
+            updates.append("longitude = %s")
+            params.append(location[1] if location else None)
+        
         if address_data.is_default is not None:
             updates.append("is_default = %s")
             params.append(address_data.is_default)
@@ -97,7 +127,9 @@ class AddressCRUD:
         params.append(address_id)
         
         query = f"UPDATE Address SET {', '.join(updates)} WHERE address_id = %s"
-        return self.db.execute_update(query, tuple(params))
+        rows_affected = self.db.execute_update(query, tuple(params))
+        delivery_zone_index.invalidate_address(address_id)
+        return rows_affected
     
     def set_default_address(self, customer_id: int, address_id: int) -> int:
         """Set a new default address (unset old default first)."""
@@ -115,7 +147,9 @@ class AddressCRUD:
     def delete_address(self, address_id: int) -> int:
         """Delete address."""
         query = "DELETE FROM Address WHERE address_id = %s"
-        return self.db.execute_update(query, (address_id,))
+        rows_affected = self.db.execute_update(query, (address_id,))
+        delivery_zone_index.invalidate_address(address_id)
+        return rows_affected
     
     def delete_addresses_by_customer(self, customer_id: int) -> int:
         """Delete all addresses for a customer."""
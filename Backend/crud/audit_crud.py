@@ -1,6 +1,7 @@
 from typing import List, Optional
 from datetime import datetime
 from database import get_db_manager
+from audit_writer import audit_event, audit_writer
 from models import AuditLog, AuditLogCreate, AuditActionEnum
 
 
@@ -22,43 +23,31 @@ class AuditLogCRUD:
         ))
     
     def log_create(self, table_name: str, record_id: int, performed_by: Optional[int],
-                   ip_address: Optional[str] = None, user_agent: Optional[str] = None) -> int:
-        """Helper method to log a CREATE action."""
-        query = """INSERT INTO AuditLog (table_name, record_id, action, performed_by, ip_address, user_agent) 
-                   VALUES (%s, %s, 'CREATE', %s, %s, %s)"""
-        return self.db.execute_update(query, (table_name, record_id, performed_by, ip_address, user_agent))
+                   ip_address: Optional[str] = None, user_agent: Optional[str] = None) -> None:
+        """Helper method to log a CREATE action (written in the background by audit_writer)."""
+        audit_writer.enqueue(audit_event(table_name, record_id, "CREATE", performed_by=performed_by,
+                                         ip_address=ip_address, user_agent=user_agent))
     
     def log_update(self, table_name: str, record_id: int, field_name: str, 
                    old_value: Optional[str], new_value: Optional[str],
                    performed_by: Optional[int], ip_address: Optional[str] = None,
-                   user_agent: Optional[str] = None) -> int:
-        """Helper method to log an UPDATE action."""
-        query = """INSERT INTO AuditLog (table_name, record_id, action, field_name, old_value, new_value, 
-                   performed_by, ip_address, user_agent) 
-                   VALUES (%s, %s, 'UPDATE', %s, %s, %s, %s, %s, %s)"""
-        return self.db.execute_update(query, (
-            table_name, record_id, field_name, old_value, new_value,
-            performed_by, ip_address, user_agent
-        ))
+                   user_agent: Optional[str] = None) -> None:
+        """Helper method to log an UPDATE action (written in the background by audit_writer)."""
+        audit_writer.enqueue(audit_event(table_name, record_id, "UPDATE", field_name, old_value, new_value,
+                                         performed_by, ip_address, user_agent))
     
     def log_delete(self, table_name: str, record_id: int, performed_by: Optional[int],
-                   ip_address: Optional[str] = None, user_agent: Optional[str] = None) -> int:
-        """Helper method to log a DELETE action."""
-        query = """INSERT INTO AuditLog (table_name, record_id, action, performed_by, ip_address, user_agent) 
-                   VALUES (%s, %s, 'DELETE', %s, %s, %s)"""
-        return self.db.execute_update(query, (table_name, record_id, performed_by, ip_address, user_agent))
+                   ip_address: Optional[str] = None, user_agent: Optional[str] = None) -> None:
+        """Helper method to log a DELETE action (written in the background by audit_writer)."""
+        audit_writer.enqueue(audit_event(table_name, record_id, "DELETE", performed_by=performed_by,
+                                         ip_address=ip_address, user_agent=user_agent))
     
     def log_status_change(self, table_name: str, record_id: int, old_status: str, 
                          new_status: str, performed_by: Optional[int],
-                         ip_address: Optional[str] = None, user_agent: Optional[str] = None) -> int:
-        """Helper method to log a STATUS_CHANGE action."""
-        query = """INSERT INTO AuditLog (table_name, record_id, action, field_name, old_value, new_value, 
-                   performed_by, ip_address, user_agent) 
-                   VALUES (%s, %s, 'STATUS_CHANGE', 'status', %s, %s, %s, %s, %s)"""
-        return self.db.execute_update(query, (
-            table_name, record_id, old_status, new_status,
-            performed_by, ip_address, user_agent
-        ))
+                         ip_address: Optional[str] = None, user_agent: Optional[str] = None) -> None:
+        """Helper method to log a STATUS_CHANGE action (written in the background by audit_writer)."""
+        audit_writer.enqueue(audit_event(table_name, record_id, "STATUS_CHANGE", "status", old_status, new_status,
+                                         performed_by, ip_address, user_agent))
     
     def get_audit_logs_for_record(self, table_name: str, record_id: int) -> List[AuditLog]:
         """Get audit logs for a specific record."""
@@ -1,8 +1,10 @@
 from typing import List, Optional
-from datetime import datetime, time
+from datetime import date, datetime, time
 from database import get_db_manager
+from schedule_index import schedule_index, DAYS_OF_WEEK
 from models import (
     BusinessHours, BusinessHoursCreate, BusinessHoursUpdate,
+    BusinessHoursException, BusinessHoursExceptionCreate, BusinessHoursTemplateDay,
     DayOfWeekEnum, PaginationParams
 )
 
@@ -17,33 +19,75 @@ class BusinessHoursCRUD:
         """Create business hours for a restaurant."""
         query = """INSERT INTO BusinessHours (restaurant_id, day_of_week, open_time, close_time, is_closed) 
                    VALUES (%s, %s, %s, %s, %s)"""
-        return self.db.execute_update(query, (
+        business_hours_id = self.db.execute_update(query, (
             hours_data.restaurant_id, hours_data.day_of_week.value,
             hours_data.open_time, hours_data.close_time, hours_data.is_closed
         ))
+        schedule_index.refresh_restaurant(hours_data.restaurant_id)
+        return business_hours_id
     
     def create_standard_hours(self, restaurant_id: int, open_time: time, close_time: time, 
                             closed_days: List[DayOfWeekEnum] = None) -> List[int]:
-        """Create standard business hours for all days of the week."""
+        """Set standard business hours for all days of the week.
+        
+        Days that already have hours are overwritten (upsert), not duplicated.
+        """
         if closed_days is None:
             closed_days = []
         
-        days = [DayOfWeekEnum.MONDAY, DayOfWeekEnum.TUESDAY, DayOfWeekEnum.WEDNESDAY, 
-                DayOfWeekEnum.THURSDAY, DayOfWeekEnum.FRIDAY, DayOfWeekEnum.SATURDAY, DayOfWeekEnum.SUNDAY]
-        
-        created_ids = []
-        for day in days:
-            is_closed = day in closed_days
-            hours_data = BusinessHoursCreate(
-                restaurant_id=restaurant_id,
+        hours = [
+            BusinessHoursTemplateDay(
                 day_of_week=day,
                 open_time=open_time,
                 close_time=close_time,
-                is_closed=is_closed
+                is_closed=day in closed_days
+            )
+            for day in DayOfWeekEnum
+        ]
+        self.bulk_upsert_business_hours([restaurant_id], hours)
+        return [row.business_hours_id for row in self.get_business_hours_by_restaurant(restaurant_id)]
+    
+    def bulk_upsert_business_hours(self, restaurant_ids: List[int], hours: List[BusinessHoursTemplateDay],
+                                   batch_size: int = 1000) -> int:
+        """Apply one weekly template to many restaurants in a single transaction.
+        
+        Rows are written with multi-row INSERT ... ON DUPLICATE KEY UPDATE batches,
+        and the schedule index is refreshed once for all restaurants at the end.
+        Returns the number of restaurant/day rows written.
+        """
+        restaurant_ids = sorted(set(restaurant_ids))
+        if not restaurant_ids or not hours:
+            return 0
+        
+        days = [entry.day_of_week for entry in hours]
+        if len(days) != len(set(days)):
+            raise ValueError("Each day of the week may appear only once in the template")
+        
+        rows = [
+            (restaurant_id, entry.day_of_week.value, entry.open_time, entry.close_time, entry.is_closed)
+            for restaurant_id in restaurant_ids
+            for entry in hours
+        ]
+        query = """INSERT INTO BusinessHours (restaurant_id, day_of_week, open_time, close_time, is_closed) 
+                   VALUES (%s, %s, %s, %s, %s) AS new
+                   ON DUPLICATE KEY UPDATE open_time = new.open_time, close_time = new.close_time,
+                       is_closed = new.is_closed"""
+        
+        with self.db.transaction() as cursor:
+            cursor.execute(
+                f"SELECT restaurant_id FROM Restaurant WHERE restaurant_id IN ({', '.join(['%s'] * len(restaurant_ids))})",
+                tuple(restaurant_ids)
             )
-            created_ids.append(self.create_business_hours(hours_data))
+            found = {row['restaurant_id'] for row in cursor.fetchall()}
+            missing = [restaurant_id for restaurant_id in restaurant_ids if restaurant_id not in found]
+            if missing:
+                raise ValueError(f"Restaurants not found: {missing}")
+            
+            for start in range(0, len(rows), batch_size):
+                cursor.executemany(query, rows[start:start + batch_size])
         
-        return created_ids
+        schedule_index.refresh_restaurants(restaurant_ids)
+        return len(rows)
     
     def get_business_hours_by_id(self, business_hours_id: int) -> Optional[BusinessHours]:
         """Get business hours by ID."""
@@ -74,35 +118,12 @@ class BusinessHoursCRUD:
         return BusinessHours(**result) if result else None
     
     def check_if_open_now(self, restaurant_id: int) -> Optional[dict]:
-        """Check if restaurant is open now."""
-        query = """
-        SELECT bh.*, 
-               CASE 
-                   WHEN bh.is_closed = 1 THEN 0
-                   WHEN CURTIME() BETWEEN bh.open_time AND bh.close_time THEN 1
-                   ELSE 0
-               END AS is_currently_open
-        FROM BusinessHours bh
-        WHERE bh.restaurant_id = %s 
-          AND bh.day_of_week = UPPER(DATE_FORMAT(NOW(), '%%W'))
-        """
-        result = self.db.execute_query(query, (restaurant_id,), fetch_one=True)
-        return result
+        """Check if restaurant is open now (answered from the schedule index)."""
+        return schedule_index.check_if_open_now(restaurant_id)
     
     def get_open_restaurants_now(self) -> List[dict]:
-        """Get all restaurants that are currently open."""
-        query = """
-        SELECT DISTINCT r.restaurant_id, r.restaurant_name
-        FROM Restaurant r
-        JOIN BusinessHours bh ON r.restaurant_id = bh.restaurant_id
-        WHERE bh.day_of_week = UPPER(DATE_FORMAT(NOW(), '%%W'))
-          AND bh.is_closed = 0
-          AND CURTIME() BETWEEN bh.open_time AND bh.close_time
-          AND r.operating_status = 'OPEN'
-        ORDER BY r.restaurant_name
-        """
-        results = self.db.execute_query(query)
-        return results if results else []
+        """Get all restaurants that are currently open (answered from the schedule index)."""
+        return schedule_index.get_open_restaurants_now()
     
     def update_business_hours(self, business_hours_id: int, hours_data: BusinessHoursUpdate) -> int:
         """Update business hours."""
@@ -126,7 +147,9 @@ class BusinessHoursCRUD:
         
         params.append(business_hours_id)
         query = f"UPDATE BusinessHours SET {', '.join(updates)} WHERE business_hours_id = %s"
-        return self.db.execute_update(query, tuple(params))
+        rows_affected = self.db.execute_update(query, tuple(params))
+        self._refresh_schedule_for(business_hours_id)
+        return rows_affected
     
     def update_hours_for_day(self, restaurant_id: int, day_of_week: DayOfWeekEnum, 
                            open_time: time, close_time: time, is_closed: bool = False) -> int:
@@ -134,59 +157,114 @@ class BusinessHoursCRUD:
         query = """UPDATE BusinessHours 
                    SET open_time = %s, close_time = %s, is_closed = %s 
                    WHERE restaurant_id = %s AND day_of_week = %s"""
-        return self.db.execute_update(query, (open_time, close_time, is_closed, restaurant_id, day_of_week.value))
+        rows_affected = self.db.execute_update(query, (open_time, close_time, is_closed, restaurant_id, day_of_week.value))
+        schedule_index.refresh_restaurant(restaurant_id)
+        return rows_affected
     
     def toggle_closed_status(self, business_hours_id: int) -> int:
         """Toggle closed status for a day."""
         query = "UPDATE BusinessHours SET is_closed = NOT is_closed WHERE business_hours_id = %s"
-        return self.db.execute_update(query, (business_hours_id,))
+        rows_affected = self.db.execute_update(query, (business_hours_id,))
+        self._refresh_schedule_for(business_hours_id)
+        return rows_affected
     
     def close_restaurant_today(self, restaurant_id: int) -> int:
-        """Mark restaurant as closed for today."""
-        query = """UPDATE BusinessHours 
-                   SET is_closed = 1 
-                   WHERE restaurant_id = %s 
-                   AND day_of_week = UPPER(DATE_FORMAT(NOW(), '%%W'))"""
-        return self.db.execute_update(query, (restaurant_id,))
+        """Mark restaurant as closed for today only (the weekly template is untouched)."""
+        return self._override_today(restaurant_id, is_closed=True, reason="Closed today")
     
     def open_restaurant_today(self, restaurant_id: int) -> int:
-        """Mark restaurant as open for today."""
-        query = """UPDATE BusinessHours 
-                   SET is_closed = 0 
-                   WHERE restaurant_id = %s 
-                   AND day_of_week = UPPER(DATE_FORMAT(NOW(), '%%W'))"""
-        return self.db.execute_update(query, (restaurant_id,))
+        """Mark restaurant as open for today only (the weekly template is untouched)."""
+        return self._override_today(restaurant_id, is_closed=False, reason="Opened today")
+    
+    def _override_today(self, restaurant_id: int, is_closed: bool, reason: str) -> int:
+        """Write today's exception from the template hours, keeping any special hours already set.
+        
+        Returns the exception id, or 0 when the restaurant has no template row for today.
+        """
+        today = date.today()
+        query = """INSERT INTO BusinessHoursException 
+                   (restaurant_id, exception_date, is_closed, open_time, close_time, reason) 
+                   SELECT * FROM (
+                       SELECT restaurant_id, %s AS exception_date, %s AS is_closed, open_time, close_time,
+                              %s AS reason
+                       FROM BusinessHours 
+                       WHERE restaurant_id = %s AND day_of_week = %s
+                   ) AS new
+                   ON DUPLICATE KEY UPDATE is_closed = new.is_closed,
+                       open_time = COALESCE(BusinessHoursException.open_time, new.open_time),
+                       close_time = COALESCE(BusinessHoursException.close_time, new.close_time),
+                       business_hours_exception_id = LAST_INSERT_ID(business_hours_exception_id)"""
+        exception_id = self.db.execute_update(query, (
+            today, is_closed, reason, restaurant_id, DAYS_OF_WEEK[today.weekday()]
+        ))
+        schedule_index.refresh_restaurant(restaurant_id)
+        return exception_id
+    
+    # Date-specific exceptions (holidays, special hours)
+    def create_exception(self, exception_data: BusinessHoursExceptionCreate) -> int:
+        """Create or replace the exception for a restaurant on one date."""
+        if not exception_data.is_closed and (exception_data.open_time is None or exception_data.close_time is None):
+            raise ValueError("open_time and close_time are required unless the restaurant is closed")
+        
+        query = """INSERT INTO BusinessHoursException 
+                   (restaurant_id, exception_date, is_closed, open_time, close_time, reason) 
+                   VALUES (%s, %s, %s, %s, %s, %s) AS new
+                   ON DUPLICATE KEY UPDATE is_closed = new.is_closed, open_time = new.open_time,
+                       close_time = new.close_time, reason = new.reason,
+                       business_hours_exception_id = LAST_INSERT_ID(business_hours_exception_id)"""
+        exception_id = self.db.execute_update(query, (
+            exception_data.restaurant_id, exception_data.exception_date, exception_data.is_closed,
+            exception_data.open_time, exception_data.close_time, exception_data.reason
+        ))
+        schedule_index.refresh_restaurant(exception_data.restaurant_id)
+        return exception_id
+    
+    def get_exception_by_id(self, exception_id: int) -> Optional[BusinessHoursException]:
+        """Get business hours exception by ID."""
+        query = "SELECT * FROM BusinessHoursException WHERE business_hours_exception_id = %s"
+        result = self.db.execute_query(query, (exception_id,), fetch_one=True)
+        return BusinessHoursException(**result) if result else None
+    
+    def get_exceptions_by_restaurant(self, restaurant_id: int, from_date: Optional[date] = None) -> List[BusinessHoursException]:
+        """Get exceptions for a restaurant from a date onwards (default today)."""
+        query = """SELECT * FROM BusinessHoursException 
+                   WHERE restaurant_id = %s AND exception_date >= %s 
+                   ORDER BY exception_date"""
+        results = self.db.execute_query(query, (restaurant_id, from_date or date.today()))
+        return [BusinessHoursException(**row) for row in results] if results else []
+    
+    def delete_exception(self, exception_id: int) -> int:
+        """Delete a business hours exception."""
+        exception = self.get_exception_by_id(exception_id)
+        if not exception:
+            return 0
+        query = "DELETE FROM BusinessHoursException WHERE business_hours_exception_id = %s"
+        rows_affected = self.db.execute_update(query, (exception_id,))
+        schedule_index.refresh_restaurant(exception.restaurant_id)
+        return rows_affected
+    
+    def _refresh_schedule_for(self, business_hours_id: int) -> None:
+        """Refresh the schedule index for the restaurant owning a business hours row."""
+        hours = self.get_business_hours_by_id(business_hours_id)
+        if hours:
+            schedule_index.refresh_restaurant(hours.restaurant_id)
     
     def delete_business_hours(self, business_hours_id: int) -> int:
         """Delete business hours."""
+        hours = self.get_business_hours_by_id(business_hours_id)
         query = "DELETE FROM BusinessHours WHERE business_hours_id = %s"
-        return self.db.execute_update(query, (business_hours_id,))
+        rows_affected = self.db.execute_update(query, (business_hours_id,))
+        if hours:
+            schedule_index.refresh_restaurant(hours.restaurant_id)
+        return rows_affected
     
     def delete_all_business_hours(self, restaurant_id: int) -> int:
         """Delete all business hours for a restaurant."""
         query = "DELETE FROM BusinessHours WHERE restaurant_id = %s"
-        return self.db.execute_update(query, (restaurant_id,))
+        rows_affected = self.db.execute_update(query, (restaurant_id,))
+        schedule_index.refresh_restaurant(restaurant_id)
+        return rows_affected
     
     def get_next_opening_time(self, restaurant_id: int) -> Optional[dict]:
-        """Get the next time the restaurant will be open."""
-        query = """
-        SELECT bh.day_of_week, bh.open_time, bh.close_time
-        FROM BusinessHours bh
-        WHERE bh.restaurant_id = %s
-          AND bh.is_closed = 0
-          AND (
-              (bh.day_of_week = UPPER(DATE_FORMAT(NOW(), '%%W')) AND bh.open_time > CURTIME())
-              OR 
-              (FIELD(bh.day_of_week, 'MONDAY', 'TUESDAY', 'WEDNESDAY', 'THURSDAY', 'FRIDAY', 'SATURDAY', 'SUNDAY') > 
-               FIELD(UPPER(DATE_FORMAT(NOW(), '%%W')), 'MONDAY', 'TUESDAY', 'WEDNESDAY', 'THURSDAY', 'FRIDAY', 'SATURDAY', 'SUNDAY'))
-          )
-        ORDER BY 
-          CASE 
-            WHEN bh.day_of_week = UPPER(DATE_FORMAT(NOW(), '%%W')) THEN 0
-            ELSE FIELD(bh.day_of_week, 'MONDAY', 'TUESDAY', 'WEDNESDAY', 'THURSDAY', 'FRIDAY', 'SATURDAY', 'SUNDAY')
-          END,
-          bh.open_time
-        LIMIT 1
-        """
-        result = self.db.execute_query(query, (restaurant_id,), fetch_one=True)
-        return result
+        """Get the next time the restaurant will be open (answered from the schedule index)."""
+        return schedule_index.get_next_opening_time(restaurant_id)
@@ -0,0 +1,78 @@
+from typing import List, Optional
+import json
+from database import get_db_manager
+from delivery_zones import delivery_zone_index, parse_polygon
+from models import DeliveryZone, DeliveryZoneCreate, DeliveryZoneUpdate
+
+
+class DeliveryZoneCRUD:
+    """CRUD operations for restaurant delivery zones (BR-013)."""
+    
+    def __init__(self):
+        self.db = get_db_manager()
+    
+    def create_delivery_zone(self, zone_data: DeliveryZoneCreate) -> int:
+        """Create a delivery zone polygon for a restaurant."""
+        polygon = parse_polygon(zone_data.polygon)
+        query = """INSERT INTO DeliveryZone (restaurant_id, zone_name, polygon, is_active) 
+                   VALUES (%s, %s, %s, %s)"""
+        delivery_zone_id = self.db.execute_update(query, (
+            zone_data.restaurant_id, zone_data.zone_name, json.dumps(polygon), zone_data.is_active
+        ))
+        delivery_zone_index.refresh_restaurant(zone_data.restaurant_id)
+        return delivery_zone_id
+    
+    def get_delivery_zone_by_id(self, delivery_zone_id: int) -> Optional[DeliveryZone]:
+        """Get delivery zone by ID."""
+        query = "SELECT * FROM DeliveryZone WHERE delivery_zone_id = %s"
+        result = self.db.execute_query(query, (delivery_zone_id,), fetch_one=True)
+        return DeliveryZone(**result) if result else None
+    
+    def get_delivery_zones_by_restaurant(self, restaurant_id: int) -> List[DeliveryZone]:
+        """Get all delivery zones for a restaurant."""
+        query = "SELECT * FROM DeliveryZone WHERE restaurant_id = %s ORDER BY zone_name"
+        results = self.db.execute_query(query, (restaurant_id,))
+        return [DeliveryZone(**row) for row in results] if results else []
+    
+    def update_delivery_zone(self, delivery_zone_id: int, zone_data: DeliveryZoneUpdate) -> int:
+        """Update delivery zone information."""
+        updates = []
+        params = []
+        
+        if zone_data.zone_name is not None:
+            updates.append("zone_name = %s")
+            params.append(zone_data.zone_name)
+        
+        if zone_data.polygon is not None:
+            updates.append("polygon = %s")
+            params.append(json.dumps(parse_polygon(zone_data.polygon)))
+        
+        if zone_data.is_active is not None:
+            updates.append("is_active = %s")
+            params.append(zone_data.is_active)
+        
+        if not updates:
+            return 0
+        
+        zone = self.get_delivery_zone_by_id(delivery_zone_id)
+        if not zone:
+            return 0
+        
+        updates.append("updated_at = CURRENT_TIMESTAMP")
+        params.append(delivery_zone_id)
+        
+        query = f"UPDATE DeliveryZone SET {', '.join(updates)} WHERE delivery_zone_id = %s"
+        rows_affected = self.db.execute_update(query, tuple(params))
+        delivery_zone_index.refresh_restaurant(zone.restaurant_id)
+        return rows_affected
+    
+    def delete_delivery_zone(self, delivery_zone_id: int) -> int:
+        """Delete delivery zone."""
+        zone = self.get_delivery_zone_by_id(delivery_zone_id)
+        if not zone:
+            return 0
+        
+        query = "DELETE FROM DeliveryZone WHERE delivery_zone_id = %s"
+        rows_affected = self.db.execute_update(query, (delivery_zone_id,))
+        delivery_zone_index.refresh_restaurant(zone.restaurant_id)
+        return rows_affected
@@ -1,42 +1,16 @@
 from typing import List, Optional
-from decimal import Decimal
-from datetime import time, timedelta
+from decimal import Decimal, ROUND_HALF_UP
 from database import get_db_manager
+from cache import menu_cache
 from models import (
     Menu, MenuCreate, MenuUpdate,
     MenuItem, MenuItemCreate, MenuItemUpdate,
-    MenuItemPriceHistory, MenuItemPriceHistoryCreate,
+    MenuItemPriceHistory, MenuItemPriceHistoryCreate, BulkPriceUpdate,
     Modifier, ModifierCreate, ModifierUpdate,
     ModifierOption, ModifierOptionCreate, ModifierOptionUpdate
 )
 
 
-def timedelta_to_time(td) -> Optional[time]:
-    """Convert timedelta to time object. Returns None if input is None."""
-    if td is None:
-        return None
-    if isinstance(td, time):
-        return td
-    if isinstance(td, timedelta):
-        total_seconds = int(td.total_seconds())
-        hours = total_seconds // 3600
-        minutes = (total_seconds % 3600) // 60
-        seconds = total_seconds % 60
-        return time(hours, minutes, seconds)
-    return None
-
-
-def convert_menu_item_row(row: dict) -> dict:
-    """Convert a menu item row from database, handling timedelta to time conversion."""
-    if row:
-        row = row.copy()
-        if 'available_from' in row:
-            row['available_from'] = timedelta_to_time(row['available_from'])
-        if 'available_until' in row:
-            row['available_until'] = timedelta_to_time(row['available_until'])
-    return row
-
-
 class MenuCRUD:
     def __init__(self):
         self.db = get_db_manager()
@@ -84,17 +58,23 @@ class MenuCRUD:
         params.append(menu_id)
         
         query = f"UPDATE Menu SET {', '.join(updates)} WHERE menu_id = %s"
-        return self.db.execute_update(query, tuple(params))
+        rows_affected = self.db.execute_update(query, tuple(params))
+        menu_cache.clear()
+        return rows_affected
     
     def toggle_menu_status(self, menu_id: int) -> int:
         """Toggle menu active status."""
         query = "UPDATE Menu SET is_active = NOT is_active, updated_at = CURRENT_TIMESTAMP WHERE menu_id = %s"
-        return self.db.execute_update(query, (menu_id,))
+        rows_affected = self.db.execute_update(query, (menu_id,))
+        menu_cache.clear()
+        return rows_affected
     
     def delete_menu(self, menu_id: int) -> int:
         """Delete menu."""
         query = "DELETE FROM Menu WHERE menu_id = %s"
-        return self.db.execute_update(query, (menu_id,))
+        rows_affected = self.db.execute_update(query, (menu_id,))
+        menu_cache.clear()
+        return rows_affected
 
 
 class MenuItemCRUD:
@@ -105,7 +85,7 @@ class MenuItemCRUD:
         """Create a new menu item (BR-016, BR-017)."""
         query = """INSERT INTO MenuItem (menu_id, name, description, price, is_available, available_from, available_until) 
                    VALUES (%s, %s, %s, %s, %s, %s, %s)"""
-        return self.db.execute_update(query, (
+        menu_item_id = self.db.execute_update(query, (
             menu_item_data.menu_id,
             menu_item_data.name,
             menu_item_data.description,
@@ -114,6 +94,8 @@ class MenuItemCRUD:
             menu_item_data.available_from,
             menu_item_data.available_until
         ))
+        menu_cache.clear()
+        return menu_item_id
     
     def get_menu_item_by_id(self, menu_item_id: int) -> Optional[MenuItem]:
         """Get menu item by ID with menu and restaurant information."""
@@ -124,19 +106,19 @@ class MenuItemCRUD:
         WHERE mi.menu_item_id = %s
         """
         result = self.db.execute_query(query, (menu_item_id,), fetch_one=True)
-        return MenuItem(**convert_menu_item_row(result)) if result else None
+        return MenuItem(**result) if result else None
     
     def get_menu_items_by_menu(self, menu_id: int) -> List[MenuItem]:
         """Get all menu items for a menu."""
         query = "SELECT * FROM MenuItem WHERE menu_id = %s ORDER BY name"
         results = self.db.execute_query(query, (menu_id,))
-        return [MenuItem(**convert_menu_item_row(row)) for row in results] if results else []
+        return [MenuItem(**row) for row in results] if results else []
     
     def get_available_menu_items_by_menu(self, menu_id: int) -> List[MenuItem]:
         """Get available menu items for a menu."""
         query = "SELECT * FROM MenuItem WHERE menu_id = %s AND is_available = 1 ORDER BY name"
         results = self.db.execute_query(query, (menu_id,))
-        return [MenuItem(**convert_menu_item_row(row)) for row in results] if results else []
+        return [MenuItem(**row) for row in results] if results else []
     
     def get_available_menu_items_with_time_check(self, menu_id: int) -> List[MenuItem]:
         """Get available menu items considering time restrictions (BR-017)."""
@@ -147,10 +129,14 @@ class MenuItemCRUD:
                      AND (available_until IS NULL OR CURTIME() <= available_until)
                    ORDER BY name"""
         results = self.db.execute_query(query, (menu_id,))
-        return [MenuItem(**convert_menu_item_row(row)) for row in results] if results else []
+        return [MenuItem(**row) for row in results] if results else []
     
     def get_menu_items_by_restaurant(self, restaurant_id: int) -> List[MenuItem]:
-        """Get all menu items for a restaurant."""
+        """Get all menu items for a restaurant (served from the menu cache when warm)."""
+        cached = menu_cache.get(restaurant_id)
+        if cached is not None:
+            return list(cached)
+        
         query = """
         SELECT mi.*, m.name as menu_name 
         FROM MenuItem mi 
@@ -159,7 +145,9 @@ class MenuItemCRUD:
         ORDER BY m.name, mi.name
         """
         results = self.db.execute_query(query, (restaurant_id,))
-        return [MenuItem(**convert_menu_item_row(row)) for row in results] if results else []
+        items = [MenuItem(**row) for row in results] if results else []
+        menu_cache.set(restaurant_id, items)
+        return list(items)
     
     def search_menu_items_by_name(self, search_term: str) -> List[MenuItem]:
         """Search menu items by name."""
@@ -172,7 +160,7 @@ class MenuItemCRUD:
         """
         search_pattern = f"%{search_term}%"
         results = self.db.execute_query(query, (search_pattern,))
-        return [MenuItem(**convert_menu_item_row(row)) for row in results] if results else []
+        return [MenuItem(**row) for row in results] if results else []
     
     def get_menu_item_with_modifiers(self, menu_item_id: int) -> Optional[dict]:
         """Get menu item with all modifiers and options."""
@@ -225,22 +213,106 @@ class MenuItemCRUD:
         params.append(menu_item_id)
         
         query = f"UPDATE MenuItem SET {', '.join(updates)} WHERE menu_item_id = %s"
-        return self.db.execute_update(query, tuple(params))
+        rows_affected = self.db.execute_update(query, tuple(params))
+        menu_cache.clear()
+        return rows_affected
     
     def update_menu_item_price(self, menu_item_id: int, new_price: float) -> int:
         """Update menu item price only."""
         query = "UPDATE MenuItem SET price = %s, updated_at = CURRENT_TIMESTAMP WHERE menu_item_id = %s"
-        return self.db.execute_update(query, (new_price, menu_item_id))
+        rows_affected = self.db.execute_update(query, (new_price, menu_item_id))
+        menu_cache.clear()
+        return rows_affected
+    
+    def bulk_update_prices(self, restaurant_id: int, price_data: BulkPriceUpdate) -> int:
+        """Reprice many menu items at once and log every change (BR-033).
+        
+        All prices are written by a single CASE update and all history rows by a
+        single multi-row insert, in one transaction. Returns the number of items
+        whose price actually changed.
+        """
+        rule_count = sum(rule is not None for rule in (price_data.percent_change, price_data.amount_change))
+        if rule_count + (1 if price_data.prices else 0) != 1:
+            raise ValueError("Provide either per-item prices or exactly one pricing rule")
+        
+        query = """SELECT mi.menu_item_id, mi.price 
+                   FROM MenuItem mi 
+                   JOIN Menu m ON mi.menu_id = m.menu_id 
+                   WHERE m.restaurant_id = %s"""
+        params = [restaurant_id]
+        
+        if price_data.menu_id is not None:
+            query += " AND mi.menu_id = %s"
+            params.append(price_data.menu_id)
+        
+        if price_data.prices:
+            item_ids = [change.menu_item_id for change in price_data.prices]
+            query += f" AND mi.menu_item_id IN ({', '.join(['%s'] * len(item_ids))})"
+            params.extend(item_ids)
+        
+        query += " FOR UPDATE"
+        
+        with self.db.transaction() as cursor:
+            cursor.execute(query, tuple(params))
+            current_prices = {row['menu_item_id']: row['price'] for row in cursor.fetchall()}
+            
+            if price_data.prices:
+                missing = [change.menu_item_id for change in price_data.prices
+                           if change.menu_item_id not in current_prices]
+                if missing:
+                    raise ValueError(f"Menu items not found for this restaurant: {missing}")
+                new_prices = {change.menu_item_id: change.new_price for change in price_data.prices}
+            elif price_data.percent_change is not None:
+                factor = 1 + price_data.percent_change / 100
+                new_prices = {item_id: price * factor for item_id, price in current_prices.items()}
+            else:
+                new_prices = {item_id: price + price_data.amount_change for item_id, price in current_prices.items()}
+            
+            changes = []
+            for item_id, new_price in new_prices.items():
+                new_price = Decimal(new_price).quantize(Decimal("0.01"), rounding=ROUND_HALF_UP)
+                if new_price <= 0:
+                    raise ValueError(f"Price for menu item {item_id} must be greater than 0")
+                if new_price != current_prices[item_id]:
+                    changes.append((item_id, current_prices[item_id], new_price))
+            
+            if not changes:
+                return 0
+            
+            case_params = []
+            for item_id, _, new_price in changes:
+                case_params.extend([item_id, new_price])
+            item_ids = [item_id for item_id, _, _ in changes]
+            
+            cursor.execute(
+                f"""UPDATE MenuItem 
+                    SET price = CASE menu_item_id {' '.join(['WHEN %s THEN %s'] * len(changes))} END, 
+                        updated_at = CURRENT_TIMESTAMP 
+                    WHERE menu_item_id IN ({', '.join(['%s'] * len(item_ids))})""",
+                tuple(case_params + item_ids)
+            )
+            cursor.executemany(
+                """INSERT INTO MenuItemPriceHistory (menu_item_id, old_price, new_price, changed_by) 
+                   VALUES (%s, %s, %s, %s)""",
+                [(item_id, old_price, new_price, price_data.changed_by) for item_id, old_price, new_price in changes]
+            )
+        
+        menu_cache.invalidate(restaurant_id)
+        return len(changes)
     
     def toggle_menu_item_availability(self, menu_item_id: int) -> int:
         """Toggle menu item availability."""
         query = "UPDATE MenuItem SET is_available = NOT is_available, updated_at = CURRENT_TIMESTAMP WHERE menu_item_id = %s"
-        return self.db.execute_update(query, (menu_item_id,))
+        rows_affected = self.db.execute_update(query, (menu_item_id,))
+        menu_cache.clear()
+        return rows_affected
     
     def delete_menu_item(self, menu_item_id: int) -> int:
         """Delete menu item."""
         query = "DELETE FROM MenuItem WHERE menu_item_id = %s"
-        return self.db.execute_update(query, (menu_item_id,))
+        rows_affected = self.db.execute_update(query, (menu_item_id,))
+        menu_cache.clear()
+        return rows_affected
 
 
 class MenuItemPriceHistoryCRUD:
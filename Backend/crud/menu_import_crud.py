@@ -0,0 +1,344 @@
+import csv
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+from database import get_db_manager
+from cache import menu_cache
+from models import (
+    MenuImport, MenuItemImport, ModifierImport, ModifierOptionImport,
+    MenuImportResult
+)
+
+
+# Flat CSV layout: one row per modifier option, parent columns repeated.
+MENU_CSV_COLUMNS = [
+    "menu_name", "menu_is_active",
+    "item_name", "item_description", "item_price", "item_is_available",
+    "item_available_from", "item_available_until",
+    "modifier_name", "modifier_min_selections", "modifier_max_selections", "modifier_is_required",
+    "option_name", "option_price_delta", "option_is_available"
+]
+
+INSERT_BATCH_SIZE = 500
+
+
+def _name_key(name: str) -> str:
+    """Normalize a name the way the case-insensitive MySQL collation compares it."""
+    return name.strip().casefold()
+
+
+def _placeholders(values) -> str:
+    return ", ".join(["%s"] * len(values))
+
+
+def _csv_bool(value: Optional[str], default: bool) -> bool:
+    if value is None or value.strip() == "":
+        return default
+    return value.strip().lower() in ("1", "true", "yes", "y")
+
+
+def _csv_value(value: Optional[str]) -> Optional[str]:
+    if value is None or value.strip() == "":
+        return None
+    return value.strip()
+
+
+def menu_to_csv_rows(menu: MenuImport) -> Iterator[List]:
+    """Flatten a menu tree into CSV rows (one per option, item or empty menu)."""
+    menu_cols = [menu.name, int(menu.is_active)]
+    if not menu.items:
+        yield menu_cols + [""] * (len(MENU_CSV_COLUMNS) - 2)
+        return
+
+    for item in menu.items:
+        item_cols = [
+            item.name, item.description or "", item.price, int(item.is_available),
+            item.available_from or "", item.available_until or ""
+        ]
+        if not item.modifiers:
+            yield menu_cols + item_cols + [""] * 7
+            continue
+        for modifier in item.modifiers:
+            modifier_cols = [
+                modifier.modifier_name, modifier.min_selections,
+                modifier.max_selections, int(modifier.is_required)
+            ]
+            if not modifier.options:
+                yield menu_cols + item_cols + modifier_cols + ["", "", ""]
+                continue
+            for option in modifier.options:
+                yield menu_cols + item_cols + modifier_cols + [
+                    option.option_name, option.price_delta, int(option.is_available)
+                ]
+
+
+def parse_menu_csv(lines: Iterable[str]) -> List[MenuImport]:
+    """Rebuild menu trees from the flat CSV layout produced by the export."""
+    menus: Dict[str, dict] = {}
+
+    for row in csv.DictReader(lines):
+        menu_name = _csv_value(row.get("menu_name"))
+        if not menu_name:
+            raise ValueError("Every CSV row needs a menu_name")
+        menu = menus.setdefault(_name_key(menu_name), {
+            "name": menu_name,
+            "is_active": _csv_bool(row.get("menu_is_active"), True),
+            "items": {}
+        })
+
+        item_name = _csv_value(row.get("item_name"))
+        if not item_name:
+            continue
+        item = menu["items"].setdefault(_name_key(item_name), {
+            "name": item_name,
+            "description": _csv_value(row.get("item_description")),
+            "price": _csv_value(row.get("item_price")),
+            "is_available": _csv_bool(row.get("item_is_available"), True),
+            "available_from": _csv_value(row.get("item_available_from")),
+            "available_until": _csv_value(row.get("item_available_until")),
+            "modifiers": {}
+        })
+
+        modifier_name = _csv_value(row.get("modifier_name"))
+        if not modifier_name:
+            continue
+        modifier = item["modifiers"].setdefault(_name_key(modifier_name), {
+            "modifier_name": modifier_name,
+            "min_selections": _csv_value(row.get("modifier_min_selections")) or 0,
+            "max_selections": _csv_value(row.get("modifier_max_selections")) or 1,
+            "is_required": _csv_bool(row.get("modifier_is_required"), False),
+            "options": []
+        })
+
+        option_name = _csv_value(row.get("option_name"))
+        if option_name:
+            modifier["options"].append({
+                "option_name": option_name,
+                "price_delta": _csv_value(row.get("option_price_delta")) or "0.00",
+                "is_available": _csv_bool(row.get("option_is_available"), True)
+            })
+
+    return [
+        MenuImport(
+            name=menu["name"],
+            is_active=menu["is_active"],
+            items=[
+                MenuItemImport(**{**item, "modifiers": list(item["modifiers"].values())})
+                for item in menu["items"].values()
+            ]
+        )
+        for menu in menus.values()
+    ]
+
+
+class MenuImportCRUD:
+    """Bulk import and export of whole menu trees (BR-016, BR-019, BR-020)."""
+
+    def __init__(self):
+        self.db = get_db_manager()
+
+    def iter_menu_tree(self, restaurant_id: int) -> Iterator[MenuImport]:
+        """Stream a restaurant's menus, one complete menu tree at a time."""
+        query = """
+        SELECT m.menu_id, m.name AS menu_name, m.is_active AS menu_is_active,
+               mi.menu_item_id, mi.name AS item_name, mi.description, mi.price, mi.is_available,
+               mi.available_from, mi.available_until,
+               md.modifier_id, md.modifier_name, md.min_selections, md.max_selections, md.is_required,
+               mo.modifier_option_id, mo.option_name, mo.price_delta, mo.is_available AS option_is_available
+        FROM Menu m
+        LEFT JOIN MenuItem mi ON mi.menu_id = m.menu_id
+        LEFT JOIN Modifier md ON md.menu_item_id = mi.menu_item_id
+        LEFT JOIN ModifierOption mo ON mo.modifier_id = md.modifier_id
+        WHERE m.restaurant_id = %s
+        ORDER BY m.menu_id, mi.menu_item_id, md.modifier_id, mo.modifier_option_id
+        """
+        menu = None
+        items: Dict[int, dict] = {}
+        modifiers: Dict[int, dict] = {}
+
+        for row in self.db.stream_query(query, (restaurant_id,)):
+            if menu is None or menu["menu_id"] != row["menu_id"]:
+                if menu is not None:
+                    yield self._build_menu(menu, items)
+                menu = {"menu_id": row["menu_id"], "name": row["menu_name"], "is_active": row["menu_is_active"]}
+                items, modifiers = {}, {}
+
+            if row["menu_item_id"] is None:
+                continue
+            item = items.get(row["menu_item_id"])
+            if item is None:
+                item = items[row["menu_item_id"]] = {
+                    "name": row["item_name"],
+                    "description": row["description"],
+                    "price": row["price"],
+                    "is_available": row["is_available"],
+                    "available_from": row["available_from"],
+                    "available_until": row["available_until"],
+                    "modifiers": []
+                }
+
+            if row["modifier_id"] is None:
+                continue
+            modifier = modifiers.get(row["modifier_id"])
+            if modifier is None:
+                modifier = modifiers[row["modifier_id"]] = {
+                    "modifier_name": row["modifier_name"],
+                    "min_selections": row["min_selections"],
+                    "max_selections": row["max_selections"],
+                    "is_required": row["is_required"],
+                    "options": []
+                }
+                item["modifiers"].append(modifier)
+
+            if row["modifier_option_id"] is not None:
+                modifier["options"].append({
+                    "option_name": row["option_name"],
+                    "price_delta": row["price_delta"],
+                    "is_available": row["option_is_available"]
+                })
+
+        if menu is not None:
+            yield self._build_menu(menu, items)
+
+    def _build_menu(self, menu: dict, items: Dict[int, dict]) -> MenuImport:
+        return MenuImport(name=menu["name"], is_active=menu["is_active"],
+                          items=[MenuItemImport(**item) for item in items.values()])
+
+    def validate_menu_import(self, menus: List[MenuImport]) -> None:
+        """In-memory uniqueness pass over the payload (BR-019, BR-020)."""
+        errors = []
+        seen_menus = set()
+
+        for menu in menus:
+            menu_key = _name_key(menu.name)
+            if menu_key in seen_menus:
+                errors.append(f"Menu '{menu.name}' appears more than once")
+            seen_menus.add(menu_key)
+
+            seen_items = set()
+            for item in menu.items:
+                item_key = _name_key(item.name)
+                if item_key in seen_items:
+                    errors.append(f"Duplicate menu item '{item.name}' in menu '{menu.name}' (BR-019)")
+                seen_items.add(item_key)
+
+                seen_modifiers = set()
+                for modifier in item.modifiers:
+                    modifier_key = _name_key(modifier.modifier_name)
+                    if modifier_key in seen_modifiers:
+                        errors.append(f"Duplicate modifier '{modifier.modifier_name}' on item '{item.name}' (BR-020)")
+                    seen_modifiers.add(modifier_key)
+
+        if errors:
+            raise ValueError("; ".join(errors))
+
+    def import_menu_tree(self, restaurant_id: int, menus: List[MenuImport]) -> MenuImportResult:
+        """Import menus, items, modifiers and options in one transaction.
+
+        Menus are matched by name; items are added to an existing menu of the same
+        name, otherwise a new menu is created. Item names must not collide with
+        items already on the menu (BR-019).
+        """
+        self.validate_menu_import(menus)
+
+        with self.db.transaction() as cursor:
+            # One set-based read of every existing menu and item name for the restaurant
+            cursor.execute("""
+                SELECT m.menu_id, m.name AS menu_name, mi.name AS item_name
+                FROM Menu m
+                LEFT JOIN MenuItem mi ON mi.menu_id = m.menu_id
+                WHERE m.restaurant_id = %s
+                ORDER BY m.menu_id
+            """, (restaurant_id,))
+            existing_menus: Dict[str, int] = {}
+            existing_items: Dict[int, set] = {}
+            for row in cursor.fetchall():
+                menu_id = existing_menus.setdefault(_name_key(row["menu_name"]), row["menu_id"])
+                if row["item_name"] is not None and menu_id == row["menu_id"]:
+                    existing_items.setdefault(menu_id, set()).add(_name_key(row["item_name"]))
+
+            conflicts = []
+            for menu in menus:
+                menu_id = existing_menus.get(_name_key(menu.name))
+                if menu_id is None:
+                    continue
+                taken = existing_items.get(menu_id, set())
+                conflicts.extend(
+                    f"Menu item '{item.name}' already exists in menu '{menu.name}' (BR-019)"
+                    for item in menu.items if _name_key(item.name) in taken
+                )
+            if conflicts:
+                raise ValueError("; ".join(conflicts))
+
+            # Menus
+            new_menus = [menu for menu in menus if _name_key(menu.name) not in existing_menus]
+            if new_menus:
+                self._insert_many(cursor,
+                    "INSERT INTO Menu (restaurant_id, name, is_active) VALUES (%s, %s, %s)",
+                    [(restaurant_id, menu.name, menu.is_active) for menu in new_menus])
+                names = [menu.name for menu in new_menus]
+                cursor.execute(
+                    f"SELECT menu_id, name FROM Menu WHERE restaurant_id = %s AND name IN ({_placeholders(names)})",
+                    (restaurant_id, *names))
+                for row in cursor.fetchall():
+                    existing_menus.setdefault(_name_key(row["name"]), row["menu_id"])
+
+            # Menu items
+            item_rows: List[Tuple[int, MenuItemImport]] = [
+                (existing_menus[_name_key(menu.name)], item)
+                for menu in menus for item in menu.items
+            ]
+            item_ids: Dict[Tuple[int, str], int] = {}
+            if item_rows:
+                self._insert_many(cursor,
+                    """INSERT INTO MenuItem (menu_id, name, description, price, is_available, available_from, available_until)
+                       VALUES (%s, %s, %s, %s, %s, %s, %s)""",
+                    [(menu_id, item.name, item.description, item.price, item.is_available,
+                      item.available_from, item.available_until) for menu_id, item in item_rows])
+                menu_ids = sorted({menu_id for menu_id, _ in item_rows})
+                cursor.execute(
+                    f"SELECT menu_item_id, menu_id, name FROM MenuItem WHERE menu_id IN ({_placeholders(menu_ids)})",
+                    tuple(menu_ids))
+                item_ids = {(row["menu_id"], _name_key(row["name"])): row["menu_item_id"] for row in cursor.fetchall()}
+
+            # Modifiers
+            modifier_rows: List[Tuple[int, ModifierImport]] = [
+                (item_ids[(menu_id, _name_key(item.name))], modifier)
+                for menu_id, item in item_rows for modifier in item.modifiers
+            ]
+            modifier_ids: Dict[Tuple[int, str], int] = {}
+            if modifier_rows:
+                self._insert_many(cursor,
+                    """INSERT INTO Modifier (menu_item_id, modifier_name, min_selections, max_selections, is_required)
+                       VALUES (%s, %s, %s, %s, %s)""",
+                    [(menu_item_id, modifier.modifier_name, modifier.min_selections,
+                      modifier.max_selections, modifier.is_required) for menu_item_id, modifier in modifier_rows])
+                menu_item_ids = sorted({menu_item_id for menu_item_id, _ in modifier_rows})
+                cursor.execute(
+                    f"SELECT modifier_id, menu_item_id, modifier_name FROM Modifier WHERE menu_item_id IN ({_placeholders(menu_item_ids)})",
+                    tuple(menu_item_ids))
+                modifier_ids = {(row["menu_item_id"], _name_key(row["modifier_name"])): row["modifier_id"]
+                                for row in cursor.fetchall()}
+
+            # Modifier options
+            option_rows: List[Tuple[int, ModifierOptionImport]] = [
+                (modifier_ids[(menu_item_id, _name_key(modifier.modifier_name))], option)
+                for menu_item_id, modifier in modifier_rows for option in modifier.options
+            ]
+            if option_rows:
+                self._insert_many(cursor,
+                    """INSERT INTO ModifierOption (modifier_id, option_name, price_delta, is_available)
+                       VALUES (%s, %s, %s, %s)""",
+                    [(modifier_id, option.option_name, option.price_delta, option.is_available)
+                     for modifier_id, option in option_rows])
+
+        menu_cache.invalidate(restaurant_id)
+        return MenuImportResult(
+            menus_created=len(new_menus),
+            menu_items_created=len(item_rows),
+            modifiers_created=len(modifier_rows),
+            modifier_options_created=len(option_rows)
+        )
+
+    def _insert_many(self, cursor, query: str, rows: List[tuple]) -> None:
+        """Insert rows with multi-row INSERT statements, in bounded batches."""
+        for start in range(0, len(rows), INSERT_BATCH_SIZE):
+            cursor.executemany(query, rows[start:start + INSERT_BATCH_SIZE])
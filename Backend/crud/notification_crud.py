@@ -0,0 +1,39 @@
+from typing import List
+from database import get_db_manager
+from models import Notification, NotificationCreate
+
+
+class NotificationCRUD:
+    """CRUD operations for customer notifications."""
+
+    def __init__(self):
+        self.db = get_db_manager()
+
+    def create_notifications(self, notifications: List[NotificationCreate], batch_size: int = 500) -> int:
+        """Insert notifications in multi-row batches; rows whose dedupe_key already exists are skipped."""
+        query = """INSERT INTO Notification (customer_id, notification_type, reference_id, dedupe_key, message)
+                   VALUES (%s, %s, %s, %s, %s)
+                   ON DUPLICATE KEY UPDATE notification_id = notification_id"""
+        rows = [
+            (notification.customer_id, notification.notification_type.value, notification.reference_id,
+             notification.dedupe_key, notification.message)
+            for notification in notifications
+        ]
+        inserted = 0
+        for start in range(0, len(rows), batch_size):
+            inserted += self.db.execute_many(query, rows[start:start + batch_size])
+        return inserted
+
+    def get_notifications_by_customer(self, customer_id: int, unread_only: bool = False) -> List[Notification]:
+        """Get a customer's notifications, newest first."""
+        query = "SELECT * FROM Notification WHERE customer_id = %s"
+        if unread_only:
+            query += " AND is_read = 0"
+        query += " ORDER BY created_at DESC"
+        results = self.db.execute_query(query, (customer_id,))
+        return [Notification(**row) for row in results] if results else []
+
+    def mark_as_read(self, notification_id: int) -> int:
+        """Mark a notification as read."""
+        query = "UPDATE Notification SET is_read = 1 WHERE notification_id = %s"
+        return self.db.execute_update(query, (notification_id,))
@@ -1,5 +1,9 @@
+from decimal import Decimal
 from typing import List, Optional
 from database import get_db_manager
+from delivery_zones import delivery_zone_index
+from delivery_quotes import delivery_quotes
+from crud.stats_crud import delete_order_with_rollup, write_order_with_rollup
 from models import (
     Order, OrderCreate, OrderUpdate, OrderStatusEnum,
     OrderItem, OrderItemCreate, OrderItemUpdate,
@@ -13,7 +17,25 @@ class OrderCRUD:
         self.db = get_db_manager()
     
     def create_order(self, order_data: OrderCreate) -> int:
-        """Create a new order (BR-021, BR-022, BR-023, BR-026)."""
+        """Create a new order (BR-021, BR-022, BR-023, BR-026).
+        
+        Orders always start as CREATED; later statuses go through
+        update_order_status so the rollups and stage timestamps follow them.
+        """
+        if order_data.status != OrderStatusEnum.CREATED:
+            raise ValueError("New orders must start in CREATED status")
+        if order_data.delivery_address_id is not None:
+            if not delivery_zone_index.can_deliver_to_address(order_data.restaurant_id, order_data.delivery_address_id):
+                raise ValueError("Restaurant does not deliver to this address")
+        elif order_data.delivery_street and delivery_zone_index.has_zones(order_data.restaurant_id):
+            raise ValueError("This restaurant only delivers to saved addresses inside its delivery zones")
+        
+        delivery_fee = self.quote_delivery_fee(order_data)
+        order_data = order_data.model_copy(update={
+            "delivery_fee": delivery_fee,
+            "total": order_data.total - order_data.delivery_fee + delivery_fee
+        })
+        
         query = """INSERT INTO `Order` (customer_id, restaurant_id, delivery_address_id, 
                    delivery_street, delivery_city, delivery_state, delivery_postal_code, delivery_country,
                    status, subtotal, tax, tax_rate, delivery_fee, service_fee, tip, discount, total, 
@@ -28,7 +50,7 @@ class OrderCRUD:
             order_data.delivery_state,
             order_data.delivery_postal_code,
             order_data.delivery_country,
-            order_data.status.value,
+            OrderStatusEnum.CREATED.value,
             order_data.subtotal,
             order_data.tax,
             order_data.tax_rate,
@@ -40,6 +62,25 @@ class OrderCRUD:
             order_data.payment_method_id
         ))
     
+    def quote_delivery_fee(self, order_data: OrderCreate) -> Decimal:
+        """Server-side delivery fee from the distance tiers.
+        
+        Orders without a destination pay nothing. When the restaurant or the
+        destination can't be located (no coordinates or postal code centroid
+        yet), no quote is possible and the client's fee is kept.
+        """
+        if order_data.delivery_address_id is None and not order_data.delivery_postal_code:
+            return Decimal("0.00")
+        quote = delivery_quotes.quote_for_order(
+            order_data.restaurant_id, order_data.delivery_address_id,
+            order_data.delivery_postal_code, order_data.delivery_country
+        )
+        if quote is None:
+            return order_data.delivery_fee
+        if not quote["deliverable"]:
+            raise ValueError(f"Delivery address is {quote['distance_km']} km away, beyond the delivery range")
+        return quote["delivery_fee"]
+    
     def get_order_by_id(self, order_id: int) -> Optional[Order]:
         """Get order by ID with full details (BR-029)."""
         query = """
@@ -180,7 +221,7 @@ class OrderCRUD:
         params.append(order_id)
         
         query = f"UPDATE `Order` SET {', '.join(updates)} WHERE order_id = %s"
-        return self.db.execute_update(query, tuple(params))
+        return write_order_with_rollup(self.db, order_id, query, tuple(params))
     
     def update_order_status(self, order_id: int, status: OrderStatusEnum) -> int:
         """Update order status with appropriate timestamp (BR-029, BR-030, BR-031)."""
@@ -197,8 +238,9 @@ class OrderCRUD:
         WHERE order_id = %s
         """
         status_value = status.value
-        return self.db.execute_update(query, (status_value, status_value, status_value, status_value, 
-                                             status_value, status_value, status_value, order_id))
+        return write_order_with_rollup(self.db, order_id, query, (status_value, status_value, status_value,
+                                                                  status_value, status_value, status_value,
+                                                                  status_value, order_id))
     
     def update_order_totals(self, order_id: int, subtotal: float, tax: float, tax_rate: Optional[float],
                            delivery_fee: float, service_fee: float, tip: float, discount: float, total: float) -> int:
@@ -208,8 +250,8 @@ class OrderCRUD:
                        service_fee = %s, tip = %s, discount = %s, total = %s, 
                        updated_at = CURRENT_TIMESTAMP 
                    WHERE order_id = %s"""
-        return self.db.execute_update(query, (subtotal, tax, tax_rate, delivery_fee, 
-                                             service_fee, tip, discount, total, order_id))
+        return write_order_with_rollup(self.db, order_id, query, (subtotal, tax, tax_rate, delivery_fee,
+                                                                  service_fee, tip, discount, total, order_id))
     
     def update_payment_status(self, order_id: int, is_paid: bool) -> int:
         """Update payment status."""
@@ -219,12 +261,11 @@ class OrderCRUD:
     def cancel_order(self, order_id: int) -> int:
         """Cancel order (BR-031)."""
         query = "UPDATE `Order` SET status = 'CANCELLED', cancelled_at = CURRENT_TIMESTAMP, updated_at = CURRENT_TIMESTAMP WHERE order_id = %s"
-        return self.db.execute_update(query, (order_id,))
+        return write_order_with_rollup(self.db, order_id, query, (order_id,))
     
     def delete_order(self, order_id: int) -> int:
         """Delete order."""
-        query = "DELETE FROM `Order` WHERE order_id = %s"
-        return self.db.execute_update(query, (order_id,))
+        return delete_order_with_rollup(self.db, order_id)
     
     def calculate_order_total(self, order_id: int) -> Optional[OrderTotalCalculation]:
         """Get order total calculation from order items."""
@@ -1,4 +1,5 @@
-from typing import List, Optional
+from datetime import date
+from typing import List, Optional, Tuple
 from database import get_db_manager
 from models import (
     PaymentMethod, PaymentMethodCreate, PaymentMethodUpdate,
@@ -6,6 +7,12 @@ from models import (
 )
 
 
+def add_months(year: int, month: int, months: int) -> Tuple[int, int]:
+    """(year, month) shifted by a number of months."""
+    index = year * 12 + (month - 1) + months
+    return index // 12, index % 12 + 1
+
+
 class PaymentMethodCRUD:
     """CRUD operations for customer payment methods (BR-008, BR-037)."""
     
@@ -53,14 +60,28 @@ class PaymentMethodCRUD:
         return [PaymentMethod(**row) for row in results] if results else []
     
     def get_expiring_cards(self, customer_id: int, months_ahead: int = 3) -> List[PaymentMethod]:
-        """Get cards expiring within specified months."""
+        """Get cards expired or expiring within specified months."""
+        today = date.today()
+        last_year, last_month = add_months(today.year, today.month, months_ahead)
+        # Compare the bare columns so idx_payment_method_expiry can be used
         query = """SELECT * FROM PaymentMethod 
                    WHERE customer_id = %s 
-                   AND payment_type = 'CARD' 
-                   AND (expiry_year < YEAR(CURDATE()) 
-                        OR (expiry_year = YEAR(CURDATE()) AND expiry_month <= MONTH(CURDATE()) + %s))
+                   AND payment_type IN ('CREDIT_CARD', 'DEBIT_CARD') 
+                   AND (expiry_year < %s OR (expiry_year = %s AND expiry_month <= %s))
                    ORDER BY expiry_year, expiry_month"""
-        results = self.db.execute_query(query, (customer_id, months_ahead))
+        results = self.db.execute_query(query, (customer_id, last_year, last_year, last_month))
+        return [PaymentMethod(**row) for row in results] if results else []
+    
+    def get_cards_expiring_in(self, expiry_year: int, expiry_month: int,
+                              after_payment_method_id: int = 0, limit: int = 500) -> List[PaymentMethod]:
+        """One keyset page of cards, across all customers, that expire in the given month."""
+        query = """SELECT * FROM PaymentMethod 
+                   WHERE expiry_year = %s AND expiry_month = %s 
+                   AND payment_method_id > %s 
+                   AND payment_type IN ('CREDIT_CARD', 'DEBIT_CARD') 
+                   ORDER BY payment_method_id 
+                   LIMIT %s"""
+        results = self.db.execute_query(query, (expiry_year, expiry_month, after_payment_method_id, limit))
         return [PaymentMethod(**row) for row in results] if results else []
     
     def update_payment_method(self, payment_method_id: int, payment_data: PaymentMethodUpdate) -> int:
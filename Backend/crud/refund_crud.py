@@ -1,6 +1,7 @@
 from typing import List, Optional
 from datetime import datetime
 from database import get_db_manager
+from crud.stats_crud import write_refund_with_rollup
 from models import (
     Refund, RefundCreate, RefundUpdate,
     RefundStatusEnum, PaginationParams
@@ -116,7 +117,7 @@ class RefundCRUD:
         
         params.append(refund_id)
         query = f"UPDATE Refund SET {', '.join(updates)} WHERE refund_id = %s"
-        return self.db.execute_update(query, tuple(params))
+        return write_refund_with_rollup(self.db, refund_id, query, tuple(params))
     
     def approve_refund(self, refund_id: int, transaction_id: Optional[int] = None) -> int:
         """Approve and process a refund."""
@@ -129,12 +130,12 @@ class RefundCRUD:
         
         params.append(refund_id)
         query = f"UPDATE Refund SET {', '.join(updates)} WHERE refund_id = %s"
-        return self.db.execute_update(query, tuple(params))
+        return write_refund_with_rollup(self.db, refund_id, query, tuple(params))
     
     def reject_refund(self, refund_id: int) -> int:
         """Reject a refund request."""
         query = "UPDATE Refund SET status = 'FAILED', processed_at = CURRENT_TIMESTAMP WHERE refund_id = %s"
-        return self.db.execute_update(query, (refund_id,))
+        return write_refund_with_rollup(self.db, refund_id, query, (refund_id,))
     
     def link_transaction(self, refund_id: int, transaction_id: int) -> int:
         """Link a refund to a transaction."""
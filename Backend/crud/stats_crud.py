@@ -0,0 +1,280 @@
+from collections import defaultdict
+from datetime import date
+from decimal import Decimal
+from typing import Dict, List, Optional, Tuple
+from database import get_db_manager
+from item_sales import SalesChange, item_sales
+from latency_sketches import fulfillment_latency, stage_samples
+from models import CustomerOrderSummary, RestaurantDailyStats
+
+# Day an order's revenue is booked on; the rebuild uses the same expression
+ORDER_STAT_DATE = "DATE(COALESCE(delivered_at, updated_at, created_at))"
+REFUND_STAT_DATE = "DATE(COALESCE(rf.processed_at, rf.requested_at))"
+
+ORDER_ROLLUP_SELECT = f"""SELECT restaurant_id, customer_id, status, total, created_at, confirmed_at, prepared_at,
+                                 ready_at, picked_up_at, delivered_at, {ORDER_STAT_DATE} AS stat_date
+                          FROM `Order` WHERE order_id = %s FOR UPDATE"""
+
+# Recomputes one customer's CustomerStats row from their delivered orders (idx_order_customer)
+CUSTOMER_STATS_REFRESH = """INSERT INTO CustomerStats (customer_id, total_orders, total_spent, last_order_date)
+                            SELECT * FROM (
+                                SELECT %s AS customer_id, COUNT(*) AS total_orders,
+                                       COALESCE(SUM(total), 0) AS total_spent, MAX(created_at) AS last_order_date
+                                FROM `Order` WHERE customer_id = %s AND status = 'DELIVERED'
+                            ) AS new
+                            ON DUPLICATE KEY UPDATE total_orders = new.total_orders,
+                                total_spent = new.total_spent, last_order_date = new.last_order_date"""
+
+REFUND_ROLLUP_SELECT = f"""SELECT o.restaurant_id, rf.status, rf.refund_amount AS total, {REFUND_STAT_DATE} AS stat_date
+                           FROM Refund rf JOIN `Order` o ON rf.order_id = o.order_id
+                           WHERE {{column}} = %s FOR UPDATE"""
+
+
+def _apply_deltas(cursor, before: Optional[dict], after: Optional[dict], counted_status: str,
+                  count_column: str, amount_column: str) -> None:
+    deltas: Dict[Tuple[int, date], List] = defaultdict(lambda: [0, Decimal("0")])
+    for row, sign in ((before, -1), (after, 1)):
+        if row and row["status"] == counted_status:
+            delta = deltas[(row["restaurant_id"], row["stat_date"])]
+            delta[0] += sign
+            delta[1] += sign * row["total"]
+
+    for (restaurant_id, stat_date), (count, amount) in deltas.items():
+        if count or amount:
+            cursor.execute(
+                f"""INSERT INTO RestaurantDailyStats (restaurant_id, stat_date, {count_column}, {amount_column})
+                    VALUES (%s, %s, %s, %s) AS new
+                    ON DUPLICATE KEY UPDATE {count_column} = {count_column} + new.{count_column},
+                        {amount_column} = {amount_column} + new.{amount_column}""",
+                (restaurant_id, stat_date, count, amount)
+            )
+
+
+def _apply_customer_change(cursor, before: Optional[dict], after: Optional[dict]) -> None:
+    was_delivered = before is not None and before["status"] == "DELIVERED"
+    is_delivered = after is not None and after["status"] == "DELIVERED"
+    if is_delivered and not was_delivered:
+        cursor.execute(
+            """INSERT INTO CustomerStats (customer_id, total_orders, total_spent, last_order_date)
+               VALUES (%s, 1, %s, %s) AS new
+               ON DUPLICATE KEY UPDATE total_orders = total_orders + 1,
+                   total_spent = total_spent + new.total_spent,
+                   last_order_date = GREATEST(COALESCE(last_order_date, new.last_order_date),
+                                              COALESCE(new.last_order_date, last_order_date))""",
+            (after["customer_id"], after["total"], after["created_at"])
+        )
+    elif was_delivered and (not is_delivered or before["total"] != after["total"]):
+        # Removing an order can change last_order_date, so recount this customer
+        cursor.execute(CUSTOMER_STATS_REFRESH, (before["customer_id"], before["customer_id"]))
+
+
+def apply_order_change(cursor, before: Optional[dict], after: Optional[dict]) -> None:
+    """Move an order's DELIVERED revenue between rollup days (BR-028) and update its customer's CustomerStats.
+
+    `before` and `after` are ORDER_ROLLUP_SELECT rows read in the transaction
+    that changed the order (after is None when it was deleted).
+    """
+    _apply_deltas(cursor, before, after, "DELIVERED", "delivered_orders", "gross_revenue")
+    _apply_customer_change(cursor, before, after)
+
+
+def apply_refund_change(cursor, before: Optional[dict], after: Optional[dict]) -> None:
+    """Move a COMPLETED refund between rollup days, like apply_order_change."""
+    _apply_deltas(cursor, before, after, "COMPLETED", "refund_count", "refunded_amount")
+
+
+def _item_sales_changes(cursor, order_id: int, before: Optional[dict], after: Optional[dict]) -> List[SalesChange]:
+    """Item counter changes for an order entering or leaving DELIVERED (or moving day)."""
+    was_delivered = before is not None and before["status"] == "DELIVERED"
+    is_delivered = after is not None and after["status"] == "DELIVERED"
+    if was_delivered == is_delivered and (not was_delivered or before["stat_date"] == after["stat_date"]):
+        return []
+
+    cursor.execute("SELECT menu_item_id, quantity, unit_price FROM OrderItem WHERE order_id = %s", (order_id,))
+    items = cursor.fetchall()
+    changes = []
+    for row, sign in ((before, -1), (after, 1)):
+        if row and row["status"] == "DELIVERED":
+            changes.extend(
+                (row["restaurant_id"], item["menu_item_id"], row["stat_date"],
+                 sign, sign * item["quantity"], sign * item["quantity"] * item["unit_price"])
+                for item in items
+            )
+    return changes
+
+
+def write_order_with_rollup(db, order_id: int, query: str, params: tuple) -> int:
+    """Run a write to one order and update the rollups in the same transaction; returns rows affected.
+
+    Item sales counters and fulfillment latency sketches are updated once the
+    transaction has committed.
+    """
+    sales, latencies = [], []
+    with db.transaction() as cursor:
+        cursor.execute(ORDER_ROLLUP_SELECT, (order_id,))
+        before = cursor.fetchone()
+        cursor.execute(query, params)
+        affected = cursor.rowcount
+        if before and affected:
+            cursor.execute(ORDER_ROLLUP_SELECT, (order_id,))
+            after = cursor.fetchone()
+            apply_order_change(cursor, before, after)
+            sales = _item_sales_changes(cursor, order_id, before, after)
+            latencies = stage_samples(after["restaurant_id"], before, after)
+    item_sales.record(sales)
+    fulfillment_latency.record(latencies)
+    return affected
+
+
+def write_refund_with_rollup(db, refund_id: int, query: str, params: tuple) -> int:
+    """Run a write to one refund and update RestaurantDailyStats in the same transaction; returns rows affected."""
+    select = REFUND_ROLLUP_SELECT.format(column="rf.refund_id")
+    with db.transaction() as cursor:
+        cursor.execute(select, (refund_id,))
+        before = cursor.fetchone()
+        cursor.execute(query, params)
+        affected = cursor.rowcount
+        if before and affected:
+            cursor.execute(select, (refund_id,))
+            apply_refund_change(cursor, before, cursor.fetchone())
+    return affected
+
+
+def delete_order_with_rollup(db, order_id: int) -> int:
+    """Delete an order, taking it and its cascaded refunds and items out of the rollups."""
+    sales = []
+    with db.transaction() as cursor:
+        cursor.execute(ORDER_ROLLUP_SELECT, (order_id,))
+        before = cursor.fetchone()
+        cursor.execute(REFUND_ROLLUP_SELECT.format(column="rf.order_id"), (order_id,))
+        refunds = cursor.fetchall()
+        if before:
+            sales = _item_sales_changes(cursor, order_id, before, None)
+        cursor.execute("DELETE FROM `Order` WHERE order_id = %s", (order_id,))
+        affected = cursor.rowcount
+        if before and affected:
+            apply_order_change(cursor, before, None)
+            for refund in refunds:
+                apply_refund_change(cursor, refund, None)
+        else:
+            sales = []
+    item_sales.record(sales)
+    return affected
+
+
+class RestaurantStatsCRUD:
+    """Per-restaurant, per-day revenue rollup (BR-028).
+
+    Rows are kept current by OrderCRUD and RefundCRUD writes; rebuild()
+    recomputes them, and MenuItemSalesDaily, from the order tables.
+    """
+
+    def __init__(self):
+        self.db = get_db_manager()
+
+    def get_daily_stats(self, restaurant_id: int, start_date: date, end_date: date) -> List[RestaurantDailyStats]:
+        """Rollup rows for a restaurant between two dates (inclusive)."""
+        query = """SELECT * FROM RestaurantDailyStats
+                   WHERE restaurant_id = %s AND stat_date BETWEEN %s AND %s
+                   ORDER BY stat_date"""
+        results = self.db.execute_query(query, (restaurant_id, start_date, end_date))
+        return [RestaurantDailyStats(**row) for row in results] if results else []
+
+    def rebuild(self, from_date: Optional[date] = None) -> int:
+        """Recompute the daily and item sales rollups from Order, OrderItem and Refund,
+        entirely or from a date on; returns rows affected."""
+        params = () if from_date is None else (from_date,)
+        order_filter = "" if from_date is None else f" AND {ORDER_STAT_DATE} >= %s"
+        refund_filter = "" if from_date is None else f" AND {REFUND_STAT_DATE} >= %s"
+
+        with self.db.transaction() as cursor:
+            if from_date is None:
+                cursor.execute("DELETE FROM RestaurantDailyStats")
+            else:
+                cursor.execute("DELETE FROM RestaurantDailyStats WHERE stat_date >= %s", params)
+
+            cursor.execute(f"""
+                INSERT INTO RestaurantDailyStats (restaurant_id, stat_date, delivered_orders, gross_revenue)
+                SELECT restaurant_id, {ORDER_STAT_DATE}, COUNT(*), SUM(total)
+                FROM `Order`
+                WHERE status = 'DELIVERED'{order_filter}
+                GROUP BY restaurant_id, {ORDER_STAT_DATE}
+            """, params)
+            written = cursor.rowcount
+
+            cursor.execute(f"""
+                INSERT INTO RestaurantDailyStats (restaurant_id, stat_date, refund_count, refunded_amount)
+                SELECT * FROM (
+                    SELECT o.restaurant_id, {REFUND_STAT_DATE} AS stat_date, COUNT(*) AS refund_count,
+                           SUM(rf.refund_amount) AS refunded_amount
+                    FROM Refund rf
+                    JOIN `Order` o ON rf.order_id = o.order_id
+                    WHERE rf.status = 'COMPLETED'{refund_filter}
+                    GROUP BY o.restaurant_id, {REFUND_STAT_DATE}
+                ) AS new
+                ON DUPLICATE KEY UPDATE refund_count = new.refund_count,
+                    refunded_amount = new.refunded_amount
+            """, params)
+            written += cursor.rowcount
+
+            if from_date is None:
+                cursor.execute("DELETE FROM MenuItemSalesDaily")
+            else:
+                cursor.execute("DELETE FROM MenuItemSalesDaily WHERE sale_date >= %s", params)
+            cursor.execute(f"""
+                INSERT INTO MenuItemSalesDaily (menu_item_id, sale_date, restaurant_id, order_count, quantity_sold, revenue)
+                SELECT oi.menu_item_id, {ORDER_STAT_DATE}, o.restaurant_id,
+                       COUNT(*), SUM(oi.quantity), SUM(oi.quantity * oi.unit_price)
+                FROM `Order` o
+                JOIN OrderItem oi ON o.order_id = oi.order_id
+                WHERE o.status = 'DELIVERED'{order_filter}
+                GROUP BY oi.menu_item_id, {ORDER_STAT_DATE}, o.restaurant_id
+            """, params)
+            written += cursor.rowcount
+        return written
+
+
+class CustomerStatsCRUD:
+    """Lifetime delivered-order stats per customer, ranked by total_spent.
+
+    Rows are kept current by OrderCRUD writes; rebuild() recomputes them from
+    Order.
+    """
+
+    def __init__(self):
+        self.db = get_db_manager()
+
+    def get_top_spenders(self, limit: int = 20, after_spent: Optional[Decimal] = None,
+                         after_customer_id: Optional[int] = None) -> List[CustomerOrderSummary]:
+        """One page of customers by total_spent (highest first).
+
+        Pass the last row's total_spent and customer_id to get the next page;
+        each page is a range scan of idx_customer_stats_spent.
+        """
+        query = """
+        SELECT s.customer_id, c.customer_name, c.phone,
+               s.total_orders, s.total_spent, s.last_order_date
+        FROM CustomerStats s
+        JOIN Customer c ON s.customer_id = c.customer_id
+        """
+        params = []
+        if after_spent is not None and after_customer_id is not None:
+            query += " WHERE s.total_spent < %s OR (s.total_spent = %s AND s.customer_id < %s)"
+            params.extend([after_spent, after_spent, after_customer_id])
+        query += " ORDER BY s.total_spent DESC, s.customer_id DESC LIMIT %s"
+        params.append(limit)
+        results = self.db.execute_query(query, tuple(params))
+        return [CustomerOrderSummary(**row) for row in results] if results else []
+
+    def rebuild(self) -> int:
+        """Recompute every customer's row from Order; returns rows affected."""
+        with self.db.transaction() as cursor:
+            cursor.execute("DELETE FROM CustomerStats")
+            cursor.execute("""
+                INSERT INTO CustomerStats (customer_id, total_orders, total_spent, last_order_date)
+                SELECT customer_id, COUNT(*), SUM(total), MAX(created_at)
+                FROM `Order`
+                WHERE status = 'DELIVERED'
+                GROUP BY customer_id
+            """)
+            return cursor.rowcount
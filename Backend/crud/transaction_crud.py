@@ -1,5 +1,6 @@
 from typing import List, Optional
 from database import get_db_manager
+from crud.stats_crud import write_refund_with_rollup
 from models import (
     Transaction, TransactionCreate, TransactionUpdate,
     Refund, RefundCreate, RefundUpdate,
@@ -159,14 +160,14 @@ class RefundCRUD:
         
         params.append(refund_id)
         query = f"UPDATE Refund SET {', '.join(updates)} WHERE refund_id = %s"
-        return self.db.execute_update(query, tuple(params))
+        return write_refund_with_rollup(self.db, refund_id, query, tuple(params))
     
     def mark_refund_completed(self, refund_id: int) -> int:
         """Mark refund as completed."""
         query = "UPDATE Refund SET status = 'COMPLETED', processed_at = CURRENT_TIMESTAMP WHERE refund_id = %s"
-        return self.db.execute_update(query, (refund_id,))
+        return write_refund_with_rollup(self.db, refund_id, query, (refund_id,))
     
     def mark_refund_failed(self, refund_id: int) -> int:
         """Mark refund as failed."""
         query = "UPDATE Refund SET status = 'FAILED', processed_at = CURRENT_TIMESTAMP WHERE refund_id = %s"
-        return self.db.execute_update(query, (refund_id,))
+        return write_refund_with_rollup(self.db, refund_id, query, (refund_id,))
@@ -1,5 +1,9 @@
+from decimal import Decimal
 from typing import List, Optional
 from database import get_db_manager
+from crud.account_crud import AccountCRUD
+from crud.stats_crud import CustomerStatsCRUD
+from item_sales import item_sales
 from models import (
     PopularMenuItem,
     CustomerOrderSummary,
@@ -12,92 +16,77 @@ class UtilityCRUD:
     
     def __init__(self):
         self.db = get_db_manager()
+        self.accounts = AccountCRUD()
+        self.customer_stats = CustomerStatsCRUD()
     
-    def get_popular_menu_items(self, restaurant_id: int, limit: int = 10) -> List[PopularMenuItem]:
-        """Get popular menu items for a restaurant (BR-028 - only from DELIVERED orders)."""
-        query = """
-        SELECT mi.menu_item_id, 
-               mi.name, 
-               mi.price,
-               COUNT(oi.order_item_id) as order_count,
-               SUM(oi.quantity) as total_quantity_sold,
-               SUM(oi.quantity * oi.unit_price) as total_revenue
-        FROM MenuItem mi 
-        LEFT JOIN OrderItem oi ON mi.menu_item_id = oi.menu_item_id 
-        LEFT JOIN `Order` o ON oi.order_id = o.order_id
-        WHERE mi.menu_id IN (SELECT menu_id FROM Menu WHERE restaurant_id = %s)
-          AND (o.status = 'DELIVERED' OR o.status IS NULL)
-        GROUP BY mi.menu_item_id, mi.name, mi.price 
-        ORDER BY order_count DESC, total_quantity_sold DESC 
-        LIMIT %s
-        """
-        results = self.db.execute_query(query, (restaurant_id, limit))
-        return [PopularMenuItem(**row) for row in results] if results else []
+    def get_popular_menu_items(self, restaurant_id: int, limit: int = 10, window: str = "all") -> List[PopularMenuItem]:
+        """Get popular menu items for a restaurant from the item sales counters (BR-028 - only from DELIVERED orders)."""
+        ranked = item_sales.top_items(restaurant_id, window, limit)
+        if not ranked:
+            return []
+        
+        placeholders = ", ".join(["%s"] * len(ranked))
+        query = f"SELECT menu_item_id, name, price FROM MenuItem WHERE menu_item_id IN ({placeholders})"
+        items = {row["menu_item_id"]: row for row in self.db.execute_query(query, tuple(item[0] for item in ranked)) or []}
+        return [
+            PopularMenuItem(
+                **items[menu_item_id],
+                order_count=order_count,
+                total_quantity_sold=quantity_sold
+            )
+            for menu_item_id, order_count, quantity_sold, _ in ranked
+            if menu_item_id in items
+        ]
     
     def get_customer_order_summary(self, customer_id: int) -> Optional[CustomerOrderSummary]:
-        """Get customer order history summary with phone."""
+        """Get customer delivered-order summary with phone (from CustomerStats)."""
         query = """
         SELECT c.customer_id,
                c.customer_name,
                c.phone,
-               COUNT(o.order_id) as total_orders,
-               COALESCE(SUM(o.total), 0) as total_spent,
-               MAX(o.created_at) as last_order_date
+               COALESCE(s.total_orders, 0) as total_orders,
+               COALESCE(s.total_spent, 0) as total_spent,
+               s.last_order_date
         FROM Customer c 
-        LEFT JOIN `Order` o ON c.customer_id = o.customer_id 
+        LEFT JOIN CustomerStats s ON c.customer_id = s.customer_id 
         WHERE c.customer_id = %s
-        GROUP BY c.customer_id, c.customer_name, c.phone
         """
         result = self.db.execute_query(query, (customer_id,), fetch_one=True)
         return CustomerOrderSummary(**result) if result else None
     
     def get_restaurant_revenue_summary(self, restaurant_id: int) -> Optional[RestaurantRevenueSummary]:
-        """Get restaurant revenue summary (BR-028 - only DELIVERED orders)."""
+        """Get restaurant revenue summary from the daily rollup (BR-028 - only DELIVERED orders)."""
         query = """
         SELECT r.restaurant_id,
                r.restaurant_name,
                r.operating_status,
-               COUNT(o.order_id) as total_orders,
-               COALESCE(SUM(o.total), 0) as total_revenue,
-               COALESCE(AVG(o.total), 0) as average_order_value
+               COALESCE(SUM(s.delivered_orders), 0) as total_orders,
+               COALESCE(SUM(s.gross_revenue), 0) as total_revenue,
+               COALESCE(SUM(s.gross_revenue) / NULLIF(SUM(s.delivered_orders), 0), 0) as average_order_value
         FROM Restaurant r 
-        LEFT JOIN `Order` o ON r.restaurant_id = o.restaurant_id 
+        LEFT JOIN RestaurantDailyStats s ON r.restaurant_id = s.restaurant_id 
         WHERE r.restaurant_id = %s 
-          AND (o.status = 'DELIVERED' OR o.status IS NULL)
         GROUP BY r.restaurant_id, r.restaurant_name, r.operating_status
         """
         result = self.db.execute_query(query, (restaurant_id,), fetch_one=True)
         return RestaurantRevenueSummary(**result) if result else None
     
-    def get_all_customer_summaries(self) -> List[CustomerOrderSummary]:
-        """Get order summaries for all customers."""
-        query = """
-        SELECT c.customer_id,
-               c.customer_name,
-               c.phone,
-               COUNT(o.order_id) as total_orders,
-               COALESCE(SUM(o.total), 0) as total_spent,
-               MAX(o.created_at) as last_order_date
-        FROM Customer c 
-        LEFT JOIN `Order` o ON c.customer_id = o.customer_id 
-        GROUP BY c.customer_id, c.customer_name, c.phone
-        ORDER BY total_spent DESC
-        """
-        results = self.db.execute_query(query)
-        return [CustomerOrderSummary(**row) for row in results] if results else []
+    def get_all_customer_summaries(self, limit: int = 20, after_spent: Optional[Decimal] = None,
+                                   after_customer_id: Optional[int] = None) -> List[CustomerOrderSummary]:
+        """Get one page of customer summaries ranked by total spent (keyset pagination)."""
+        return self.customer_stats.get_top_spenders(limit, after_spent, after_customer_id)
     
     def get_all_restaurant_summaries(self) -> List[RestaurantRevenueSummary]:
-        """Get revenue summaries for all restaurants (BR-028 - only DELIVERED orders)."""
+        """Get revenue summaries for all restaurants from the daily rollup (BR-028 - only DELIVERED orders)."""
         query = """
         SELECT r.restaurant_id,
                r.restaurant_name,
                r.operating_status,
-               COUNT(o.order_id) as total_orders,
-               COALESCE(SUM(o.total), 0) as total_revenue,
-               COALESCE(AVG(o.total), 0) as average_order_value
+               COALESCE(SUM(s.delivered_orders), 0) as total_orders,
+               COALESCE(SUM(s.gross_revenue), 0) as total_revenue,
+               COALESCE(SUM(s.gross_revenue) / NULLIF(SUM(s.delivered_orders), 0), 0) as average_order_value
         FROM Restaurant r 
-        LEFT JOIN `Order` o ON r.restaurant_id = o.restaurant_id 
-        WHERE o.status = 'DELIVERED' OR o.status IS NULL
+        LEFT JOIN RestaurantDailyStats s ON r.restaurant_id = s.restaurant_id 
         GROUP BY r.restaurant_id, r.restaurant_name, r.operating_status
         ORDER BY total_revenue DESC
         """
@@ -114,9 +103,8 @@ class UtilityCRUD:
     
     def check_account_active(self, account_id: int) -> bool:
         """Check if account is active (BR-001, BR-002, BR-003)."""
-        query = "SELECT status FROM Account WHERE account_id = %s"
-        result = self.db.execute_query(query, (account_id,), fetch_one=True)
-        return result and result['status'] == 'ACTIVE' if result else False
+        account = self.accounts.get_account_by_id(account_id)
+        return account is not None and account.status == 'ACTIVE'
     
     def validate_menu_item_uniqueness(self, menu_id: int, item_name: str, exclude_item_id: Optional[int] = None) -> bool:
         """Validate menu item name is unique within menu (BR-019)."""
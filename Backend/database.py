@@ -1,7 +1,12 @@
 from mysql.connector import pooling, Error
+from mysql.connector.constants import FieldFlag
+from mysql.connector.conversion import MySQLConverter
 from contextlib import contextmanager
-from typing import Dict, Any, List, Optional, Tuple
+from datetime import time
+from typing import Dict, Any, Iterator, List, Optional, Tuple
+import json
 import logging
+import sys
 from config import settings
 
 # Configure logging
@@ -9,6 +14,47 @@ logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
+class GrubNGoConverter(MySQLConverter):
+    """Result converter that returns column values in the types our models expect.
+
+    - TIME columns become datetime.time instead of timedelta (all our TIME
+      columns are times of day).
+    - DECIMAL coordinate columns become float; money columns stay Decimal.
+    - ENUM values are interned, since a handful of status strings repeat on
+      every row.
+    - JSON columns are decoded.
+    """
+
+    FLOAT_DECIMAL_COLUMNS = frozenset({"latitude", "longitude", "distance_km"})
+
+    def _time_to_python(self, value, dsc=None):
+        text = value.decode() if isinstance(value, (bytes, bytearray)) else str(value)
+        hms, _, fraction = text.partition(".")
+        try:
+            hours, minutes, seconds = (int(part) for part in hms.split(":"))
+        except ValueError:
+            return super()._time_to_python(value, dsc)
+        if not 0 <= hours < 24:
+            # Durations outside a single day keep the driver's timedelta
+            return super()._time_to_python(value, dsc)
+        microseconds = int(fraction.ljust(6, "0")[:6]) if fraction else 0
+        return time(hours, minutes, seconds, microseconds)
+
+    def _newdecimal_to_python(self, value, dsc=None):
+        if dsc is not None and dsc[0] in self.FLOAT_DECIMAL_COLUMNS:
+            return float(value)
+        return super()._newdecimal_to_python(value, dsc)
+
+    def _string_to_python(self, value, dsc=None):
+        result = super()._string_to_python(value, dsc)
+        if dsc is not None and isinstance(result, str) and dsc[7] & FieldFlag.ENUM:
+            return sys.intern(result)
+        return result
+
+    def _json_to_python(self, value, dsc=None):
+        return json.loads(value)
+
+
 class DatabaseManager:
     """Database connection and operations manager."""
     
@@ -23,7 +69,10 @@ class DatabaseManager:
             pool_config.update({
                 "pool_name": "grubngo_pool",
                 "pool_size": 10,
-                "pool_reset_session": True
+                "pool_reset_session": True,
+                # Custom converters are only honoured by the pure-Python protocol
+                "use_pure": True,
+                "converter_class": GrubNGoConverter
             })
             
             self.pool = pooling.MySQLConnectionPool(**pool_config)
@@ -69,6 +118,31 @@ class DatabaseManager:
             finally:
                 cursor.close()
     
+    def execute_multi(self, query: str, params: Optional[Tuple] = None) -> List[List[Dict[str, Any]]]:
+        """Run several ;-separated SELECTs on one pooled connection and return each result set.
+        
+        Statements run one after another (mysql-connector 9.2 dropped multi=True);
+        params are consumed in order by each statement's %s placeholders, so
+        statements must not contain literal semicolons.
+        """
+        statements = [statement for statement in query.split(";") if statement.strip()]
+        remaining = list(params or ())
+        with self.get_connection() as connection:
+            cursor = connection.cursor(dictionary=True)
+            try:
+                results = []
+                for statement in statements:
+                    count = statement.count("%s")
+                    cursor.execute(statement, tuple(remaining[:count]))
+                    remaining = remaining[count:]
+                    results.append(cursor.fetchall())
+                return results
+            except Error as e:
+                logger.error(f"Multi-statement query error: {e}")
+                raise
+            finally:
+                cursor.close()
+    
     def execute_update(self, query: str, params: Optional[Tuple] = None) -> int:
         """Execute an INSERT, UPDATE, or DELETE query and return affected rows."""
         with self.get_connection() as connection:
@@ -106,6 +180,43 @@ class DatabaseManager:
             finally:
                 cursor.close()
     
+    @contextmanager
+    def transaction(self):
+        """Run several statements on one connection and commit them together.
+
+        Yields a dictionary cursor; the transaction is committed when the block
+        exits normally and rolled back if it raises.
+        """
+        with self.get_connection() as connection:
+            cursor = connection.cursor(dictionary=True)
+            try:
+                yield cursor
+                connection.commit()
+            except Exception as e:
+                connection.rollback()
+                logger.error(f"Transaction error: {e}")
+                raise
+            finally:
+                cursor.close()
+    
+    def stream_query(self, query: str, params: Optional[Tuple] = None, batch_size: int = 500) -> Iterator[Dict[str, Any]]:
+        """Execute a SELECT query and yield rows in batches instead of loading them all."""
+        with self.get_connection() as connection:
+            cursor = connection.cursor(dictionary=True)
+            try:
+                cursor.execute(query, params or ())
+                while True:
+                    rows = cursor.fetchmany(batch_size)
+                    if not rows:
+                        break
+                    for row in rows:
+                        yield row
+            except Error as e:
+                logger.error(f"Streaming query error: {e}")
+                raise
+            finally:
+                cursor.close()
+    
     def test_connection(self) -> bool:
         """Test database connectivity."""
         try:
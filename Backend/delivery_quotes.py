@@ -0,0 +1,169 @@
+from decimal import Decimal
+from threading import Lock
+from typing import Dict, List, Optional, Sequence, Tuple
+import logging
+import numpy as np
+from config import settings
+from database import get_db_manager
+from delivery_zones import delivery_zone_index
+from geo import EARTH_RADIUS_KM
+from spatial_index import restaurant_index
+
+logger = logging.getLogger(__name__)
+
+
+def parse_fee_tiers(spec: str) -> List[Tuple[float, Decimal]]:
+    """Parse "max_km:fee,..." (e.g. "3:2.99,6:4.99") into tiers sorted by distance."""
+    tiers = []
+    for part in spec.split(","):
+        if not part.strip():
+            continue
+        max_km, fee = part.split(":")
+        tiers.append((float(max_km), Decimal(fee.strip())))
+    if not tiers:
+        raise ValueError("At least one delivery fee tier is required")
+    return sorted(tiers)
+
+
+def normalize_postal_code(postal_code: str) -> str:
+    return postal_code.strip().upper().replace(" ", "")
+
+
+def distance_matrix(origin_lats: np.ndarray, origin_lons: np.ndarray,
+                    dest_lats: np.ndarray, dest_lons: np.ndarray) -> np.ndarray:
+    """Haversine distances (km) between every origin (rows) and destination (columns)."""
+    lat1 = np.radians(origin_lats)[:, None]
+    lon1 = np.radians(origin_lons)[:, None]
+    lat2 = np.radians(dest_lats)[None, :]
+    lon2 = np.radians(dest_lons)[None, :]
+    a = np.sin((lat2 - lat1) / 2) ** 2 + np.cos(lat1) * np.cos(lat2) * np.sin((lon2 - lon1) / 2) ** 2
+    return 2 * EARTH_RADIUS_KM * np.arcsin(np.minimum(1.0, np.sqrt(a)))
+
+
+class DeliveryQuoteEngine:
+    """Distance-based delivery fees and ETAs computed in bulk.
+
+    Fees come from DELIVERY_FEE_TIERS (the first tier whose max distance covers
+    the trip); trips beyond the last tier are not deliverable. ETAs are the
+    preparation time plus travel at DELIVERY_SPEED_KMH. Addresses are located by
+    their stored coordinates, or the PostalCodeCentroid of their postal code.
+    """
+
+    def __init__(self):
+        self.db = get_db_manager()
+        tiers = parse_fee_tiers(settings.DELIVERY_FEE_TIERS)
+        self.tier_max_km = np.array([max_km for max_km, _ in tiers], dtype=np.float64)
+        self.tier_fees = [fee for _, fee in tiers]
+        self.max_distance_km = float(self.tier_max_km[-1])
+        self._centroids: Optional[Dict[Tuple[str, str], Tuple[float, float]]] = None
+        self._lock = Lock()
+
+    def load_centroids(self) -> None:
+        """(Re)load the postal code lookup table into memory."""
+        results = self.db.execute_query(
+            "SELECT postal_code, country, latitude, longitude FROM PostalCodeCentroid"
+        ) or []
+        centroids = {
+            (normalize_postal_code(row["postal_code"]), row["country"].upper()): (row["latitude"], row["longitude"])
+            for row in results
+        }
+        with self._lock:
+            self._centroids = centroids
+        logger.info(f"Loaded {len(centroids)} postal code centroids")
+
+    def geocode(self, postal_code: Optional[str], country: Optional[str] = "USA") -> Optional[Tuple[float, float]]:
+        """Approximate coordinates for a postal code, or None if unknown."""
+        if not postal_code:
+            return None
+        if self._centroids is None:
+            self.load_centroids()
+        return self._centroids.get((normalize_postal_code(postal_code), (country or "USA").upper()))
+
+    def address_location(self, address_id: int) -> Optional[Tuple[float, float]]:
+        """Stored coordinates of a saved address, falling back to its postal code centroid."""
+        row = self.db.execute_query(
+            "SELECT latitude, longitude, postal_code, country FROM Address WHERE address_id = %s",
+            (address_id,), fetch_one=True
+        )
+        if not row:
+            return None
+        if row["latitude"] is not None and row["longitude"] is not None:
+            return row["latitude"], row["longitude"]
+        return self.geocode(row["postal_code"], row["country"])
+
+    def quote_matrix(self, restaurant_ids: Sequence[int],
+                     destinations: Sequence[Tuple[float, float]]) -> List[List[Optional[dict]]]:
+        """Quotes for every (restaurant, destination) pair.
+
+        Rows follow restaurant_ids; a row is None for restaurants without
+        known coordinates.
+        """
+        coordinates = restaurant_index.coordinates(restaurant_ids)
+        located = [restaurant_id for restaurant_id in restaurant_ids if restaurant_id in coordinates]
+        if not located or not destinations:
+            return [None if restaurant_id not in coordinates else [] for restaurant_id in restaurant_ids]
+
+        distances = distance_matrix(
+            np.array([coordinates[restaurant_id][0] for restaurant_id in located], dtype=np.float64),
+            np.array([coordinates[restaurant_id][1] for restaurant_id in located], dtype=np.float64),
+            np.array([latitude for latitude, _ in destinations], dtype=np.float64),
+            np.array([longitude for _, longitude in destinations], dtype=np.float64)
+        )
+        tiers = np.searchsorted(self.tier_max_km, distances, side="left")
+        etas = np.ceil(settings.DELIVERY_PREP_MINUTES + distances / settings.DELIVERY_SPEED_KMH * 60).astype(int)
+
+        rows: Dict[int, List[dict]] = {}
+        for i, restaurant_id in enumerate(located):
+            rows[restaurant_id] = [
+                {
+                    "restaurant_id": restaurant_id,
+                    "distance_km": round(float(distances[i, j]), 3),
+                    "deliverable": bool(tiers[i, j] < len(self.tier_fees)),
+                    "delivery_fee": self.tier_fees[tiers[i, j]] if tiers[i, j] < len(self.tier_fees) else None,
+                    "eta_minutes": int(etas[i, j])
+                }
+                for j in range(len(destinations))
+            ]
+        return [rows.get(restaurant_id) for restaurant_id in restaurant_ids]
+
+    def quotes_for_address(self, address_id: int, restaurant_ids: Optional[Sequence[int]] = None) -> List[dict]:
+        """Quotes from many restaurants to one saved address, nearest first.
+
+        Without restaurant_ids, every open restaurant within the largest fee tier
+        is quoted (a delivery listing page). Delivery zones are applied too.
+        """
+        location = self.address_location(address_id)
+        if location is None:
+            raise ValueError("Address location is unknown")
+        if restaurant_ids is None:
+            restaurant_ids = [row["restaurant_id"] for row in restaurant_index.within_radius(*location, self.max_distance_km)]
+
+        quotes = []
+        for row in self.quote_matrix(restaurant_ids, [location]):
+            if not row:
+                continue
+            quote = row[0]
+            if quote["deliverable"] and not delivery_zone_index.can_deliver_to_address(quote["restaurant_id"], address_id):
+                quote.update(deliverable=False, delivery_fee=None)
+            quotes.append(quote)
+        return sorted(quotes, key=lambda quote: quote["distance_km"])
+
+    def quote_for_order(self, restaurant_id: int, address_id: Optional[int],
+                        postal_code: Optional[str], country: Optional[str]) -> Optional[dict]:
+        """One quote for checkout, or None if either end can't be located."""
+        if address_id is not None:
+            location = self.address_location(address_id)
+        else:
+            location = self.geocode(postal_code, country)
+        if location is None:
+            logger.warning(f"No delivery quote: location unknown for address {address_id} / postal code {postal_code}")
+            return None
+        row = self.quote_matrix([restaurant_id], [location])[0]
+        if row is None:
+            logger.warning(f"No delivery quote: restaurant {restaurant_id} has no known coordinates")
+            return None
+        return row[0] if row else None
+
+
+# Global delivery quote engine
+delivery_quotes = DeliveryQuoteEngine()
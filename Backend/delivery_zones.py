@@ -0,0 +1,178 @@
+from threading import Lock
+from typing import Dict, List, Optional, Sequence, Tuple
+import json
+import logging
+from database import get_db_manager
+
+logger = logging.getLogger(__name__)
+
+MAX_CACHED_ADDRESS_RESULTS = 100_000
+
+
+class CompiledZone:
+    """A delivery zone polygon prepared for fast point-in-polygon checks."""
+
+    __slots__ = ("delivery_zone_id", "lats", "lons", "min_lat", "max_lat", "min_lon", "max_lon")
+
+    def __init__(self, delivery_zone_id: int, polygon: Sequence[Sequence[float]]):
+        self.delivery_zone_id = delivery_zone_id
+        self.lats = tuple(float(point[0]) for point in polygon)
+        self.lons = tuple(float(point[1]) for point in polygon)
+        self.min_lat, self.max_lat = min(self.lats), max(self.lats)
+        self.min_lon, self.max_lon = min(self.lons), max(self.lons)
+
+    def contains(self, latitude: float, longitude: float) -> bool:
+        """Bounding-box prefilter, then even-odd ray casting."""
+        if not (self.min_lat <= latitude <= self.max_lat and self.min_lon <= longitude <= self.max_lon):
+            return False
+
+        inside = False
+        lats, lons = self.lats, self.lons
+        j = len(lats) - 1
+        for i in range(len(lats)):
+            if (lats[i] > latitude) != (lats[j] > latitude):
+                crossing = (lons[j] - lons[i]) * (latitude - lats[i]) / (lats[j] - lats[i]) + lons[i]
+                if longitude < crossing:
+                    inside = not inside
+            j = i
+        return inside
+
+
+def parse_polygon(polygon) -> List[Tuple[float, float]]:
+    """Validate a [[latitude, longitude], ...] polygon (JSON text or list)."""
+    if isinstance(polygon, (str, bytes)):
+        polygon = json.loads(polygon)
+    points = [(float(point[0]), float(point[1])) for point in polygon]
+    if len(points) > 1 and points[0] == points[-1]:
+        points = points[:-1]
+    if len(points) < 3:
+        raise ValueError("A delivery zone polygon needs at least 3 points")
+    for latitude, longitude in points:
+        if not (-90 <= latitude <= 90 and -180 <= longitude <= 180):
+            raise ValueError(f"Invalid polygon point ({latitude}, {longitude})")
+    return points
+
+
+class DeliveryZoneIndex:
+    """Active delivery zones compiled in memory, with per-address results cached.
+
+    Restaurants without any active zone are not restricted. Cached answers are
+    keyed by (restaurant_id, address_id) and dropped when either side changes.
+    """
+
+    def __init__(self):
+        self.db = get_db_manager()
+        self._zones: Dict[int, List[CompiledZone]] = {}
+        self._address_results: Dict[Tuple[int, int], bool] = {}
+        self._loaded = False
+        self._lock = Lock()
+
+    def load(self) -> None:
+        """(Re)compile every active delivery zone."""
+        results = self.db.execute_query(
+            "SELECT delivery_zone_id, restaurant_id, polygon FROM DeliveryZone WHERE is_active = 1"
+        ) or []
+        zones: Dict[int, List[CompiledZone]] = {}
+        for row in results:
+            zones.setdefault(row["restaurant_id"], []).append(
+                CompiledZone(row["delivery_zone_id"], parse_polygon(row["polygon"]))
+            )
+        with self._lock:
+            self._zones = zones
+            self._address_results = {}
+            self._loaded = True
+        logger.info(f"Delivery zone index loaded with {len(results)} zones")
+
+    def refresh_restaurant(self, restaurant_id: int) -> None:
+        """Recompile one restaurant's zones and drop its cached address results."""
+        if not self._loaded:
+            return
+        results = self.db.execute_query(
+            "SELECT delivery_zone_id, polygon FROM DeliveryZone WHERE restaurant_id = %s AND is_active = 1",
+            (restaurant_id,)
+        ) or []
+        compiled = [CompiledZone(row["delivery_zone_id"], parse_polygon(row["polygon"])) for row in results]
+        with self._lock:
+            zones = dict(self._zones)
+            if compiled:
+                zones[restaurant_id] = compiled
+            else:
+                zones.pop(restaurant_id, None)
+            self._zones = zones
+            self._address_results = {
+                key: value for key, value in self._address_results.items() if key[0] != restaurant_id
+            }
+
+    def invalidate_address(self, address_id: int) -> None:
+        """Drop cached results for an address whose location changed."""
+        with self._lock:
+            self._address_results = {
+                key: value for key, value in self._address_results.items() if key[1] != address_id
+            }
+
+    def _ensure_loaded(self) -> None:
+        if not self._loaded:
+            self.load()
+
+    def has_zones(self, restaurant_id: int) -> bool:
+        """Whether deliveries for this restaurant are restricted to zones."""
+        self._ensure_loaded()
+        return restaurant_id in self._zones
+
+    def covers_point(self, restaurant_id: int, latitude: float, longitude: float) -> bool:
+        """Whether any of the restaurant's zones contains the point."""
+        self._ensure_loaded()
+        zones = self._zones.get(restaurant_id)
+        if zones is None:
+            return True
+        return any(zone.contains(latitude, longitude) for zone in zones)
+
+    def _address_location(self, address_id: int) -> Optional[Tuple[float, float]]:
+        row = self.db.execute_query(
+            "SELECT latitude, longitude FROM Address WHERE address_id = %s", (address_id,), fetch_one=True
+        )
+        if not row or row["latitude"] is None or row["longitude"] is None:
+            return None
+        return row["latitude"], row["longitude"]
+
+    def can_deliver_to_address(self, restaurant_id: int, address_id: int) -> bool:
+        """Whether the restaurant delivers to a saved address (cached per address)."""
+        self._ensure_loaded()
+        if restaurant_id not in self._zones:
+            return True
+
+        key = (restaurant_id, address_id)
+        cached = self._address_results.get(key)
+        if cached is not None:
+            return cached
+
+        location = self._address_location(address_id)
+        result = location is not None and self.covers_point(restaurant_id, *location)
+        self._remember(key, result)
+        return result
+
+    def _remember(self, key: Tuple[int, int], result: bool) -> None:
+        if len(self._address_results) >= MAX_CACHED_ADDRESS_RESULTS:
+            self._address_results = {}
+        self._address_results[key] = result
+
+    def restaurants_delivering_to(self, address_id: int) -> List[int]:
+        """IDs of zoned restaurants whose zones contain a saved address."""
+        self._ensure_loaded()
+        location = self._address_location(address_id)
+        if location is None:
+            return []
+        restaurant_ids = []
+        for restaurant_id in list(self._zones):
+            key = (restaurant_id, address_id)
+            cached = self._address_results.get(key)
+            if cached is None:
+                cached = self.covers_point(restaurant_id, *location)
+                self._remember(key, cached)
+            if cached:
+                restaurant_ids.append(restaurant_id)
+        return sorted(restaurant_ids)
+
+
+# Global delivery zone index
+delivery_zone_index = DeliveryZoneIndex()
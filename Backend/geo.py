@@ -0,0 +1,101 @@
+import math
+from typing import List, Tuple
+
+EARTH_RADIUS_KM = 6371.0
+GEOHASH_PRECISION = 12
+_GEOHASH_ALPHABET = "0123456789bcdefghjkmnpqrstuvwxyz"
+
+
+def haversine_km(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
+    """Great-circle distance between two points in kilometres."""
+    phi1, phi2 = math.radians(lat1), math.radians(lat2)
+    dphi = phi2 - phi1
+    dlambda = math.radians(lon2 - lon1)
+    a = math.sin(dphi / 2) ** 2 + math.cos(phi1) * math.cos(phi2) * math.sin(dlambda / 2) ** 2
+    return 2 * EARTH_RADIUS_KM * math.asin(min(1.0, math.sqrt(a)))
+
+
+def bounding_box(latitude: float, longitude: float, radius_km: float) -> Tuple[float, float, float, float]:
+    """Return (min_lat, max_lat, min_lon, max_lon) enclosing a circle around a point.
+
+    Longitudes are not wrapped; callers should treat values outside [-180, 180]
+    as "no longitude filter".
+    """
+    lat_delta = math.degrees(radius_km / EARTH_RADIUS_KM)
+    min_lat = max(-90.0, latitude - lat_delta)
+    max_lat = min(90.0, latitude + lat_delta)
+
+    if min_lat <= -90.0 or max_lat >= 90.0:
+        return min_lat, max_lat, -180.0, 180.0
+
+    # Widest longitude reached by the circle (at the tangent points, not on this latitude)
+    ratio = math.sin(radius_km / EARTH_RADIUS_KM) / math.cos(math.radians(latitude))
+    if ratio >= 1.0:
+        return min_lat, max_lat, -180.0, 180.0
+    lon_delta = math.degrees(math.asin(ratio))
+    return min_lat, max_lat, longitude - lon_delta, longitude + lon_delta
+
+
+def encode_geohash(latitude: float, longitude: float, precision: int = GEOHASH_PRECISION) -> str:
+    """Encode a point as a geohash (same encoding as MySQL's ST_GeoHash)."""
+    lat_range = [-90.0, 90.0]
+    lon_range = [-180.0, 180.0]
+    chars = []
+    bit, ch, even = 0, 0, True
+
+    while len(chars) < precision:
+        if even:
+            mid = (lon_range[0] + lon_range[1]) / 2
+            if longitude >= mid:
+                ch |= 1 << (4 - bit)
+                lon_range[0] = mid
+            else:
+                lon_range[1] = mid
+        else:
+            mid = (lat_range[0] + lat_range[1]) / 2
+            if latitude >= mid:
+                ch |= 1 << (4 - bit)
+                lat_range[0] = mid
+            else:
+                lat_range[1] = mid
+        even = not even
+
+        if bit < 4:
+            bit += 1
+        else:
+            chars.append(_GEOHASH_ALPHABET[ch])
+            bit, ch = 0, 0
+
+    return "".join(chars)
+
+
+def _geohash_cell_size(precision: int) -> Tuple[float, float]:
+    """Return (lat_degrees, lon_degrees) covered by one geohash cell."""
+    bits = precision * 5
+    lon_bits = (bits + 1) // 2
+    lat_bits = bits // 2
+    return 180.0 / (2 ** lat_bits), 360.0 / (2 ** lon_bits)
+
+
+def geohash_cover(min_lat: float, max_lat: float, min_lon: float, max_lon: float) -> List[str]:
+    """Return geohash prefixes whose cells together cover the bounding box.
+
+    Picks the longest prefix length whose cells are at least as large as the
+    box, so the box touches at most 2x2 cells. Returns an empty list when the
+    box crosses the antimeridian or is too large to benefit from a prefix.
+    """
+    if min_lon < -180.0 or max_lon > 180.0:
+        return []
+
+    precision = 0
+    for candidate in range(GEOHASH_PRECISION, 0, -1):
+        lat_size, lon_size = _geohash_cell_size(candidate)
+        if lat_size >= (max_lat - min_lat) and lon_size >= (max_lon - min_lon):
+            precision = candidate
+            break
+
+    if precision == 0:
+        return []
+
+    corners = [(min_lat, min_lon), (min_lat, max_lon), (max_lat, min_lon), (max_lat, max_lon)]
+    return sorted({encode_geohash(lat, lon, precision) for lat, lon in corners})
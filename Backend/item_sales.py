@@ -0,0 +1,175 @@
+from datetime import date, timedelta
+from decimal import Decimal
+from threading import Lock
+from typing import Dict, Iterable, List, Optional, Tuple
+import asyncio
+import heapq
+import logging
+import time
+from config import settings
+from database import get_db_manager
+
+logger = logging.getLogger(__name__)
+
+# Sliding windows served by top_items, in days (None = all time)
+WINDOWS: Dict[str, Optional[int]] = {"all": None, "7d": 7, "30d": 30}
+MAX_WINDOW_DAYS = max(days for days in WINDOWS.values() if days)
+
+# (restaurant_id, menu_item_id, sale_date, order_count, quantity_sold, revenue)
+SalesChange = Tuple[int, int, date, int, int, Decimal]
+
+
+def _add(totals: Dict[int, List], menu_item_id: int, orders: int, quantity: int, revenue: Decimal) -> None:
+    counters = totals.setdefault(menu_item_id, [0, 0, Decimal("0")])
+    counters[0] += orders
+    counters[1] += quantity
+    counters[2] += revenue
+
+
+class _RestaurantSales:
+    def __init__(self):
+        self.all_time: Dict[int, List] = {}
+        self.daily: Dict[date, Dict[int, List]] = {}
+        self.loaded_at = time.monotonic()
+
+    def add(self, menu_item_id: int, sale_date: date, orders: int, quantity: int, revenue: Decimal) -> None:
+        _add(self.all_time, menu_item_id, orders, quantity, revenue)
+        if sale_date > date.today() - timedelta(days=MAX_WINDOW_DAYS):
+            _add(self.daily.setdefault(sale_date, {}), menu_item_id, orders, quantity, revenue)
+
+
+class ItemSalesCounters:
+    """Per-restaurant menu item sales counters for popular-item queries (BR-028).
+
+    Sales of DELIVERED orders are counted in memory by item and day, and
+    queued for MenuItemSalesDaily, which the background flusher writes in
+    batches. A restaurant's counters are loaded from that table on first use
+    and reloaded every ITEM_SALES_REFRESH_SECONDS so other workers' sales show
+    up. Top-K queries never read OrderItem.
+    """
+
+    def __init__(self):
+        self.db = get_db_manager()
+        self._restaurants: Dict[int, _RestaurantSales] = {}
+        self._pending: Dict[Tuple[int, int, date], List] = {}
+        self._lock = Lock()
+        # Held across a flush's swap and write, and across _load's read and merge
+        self._flush_lock = Lock()
+
+    def record(self, changes: Iterable[SalesChange]) -> None:
+        """Count committed sales (negative values take a sale back)."""
+        with self._lock:
+            for restaurant_id, menu_item_id, sale_date, orders, quantity, revenue in changes:
+                pending = self._pending.setdefault((restaurant_id, menu_item_id, sale_date), [0, 0, Decimal("0")])
+                pending[0] += orders
+                pending[1] += quantity
+                pending[2] += revenue
+                sales = self._restaurants.get(restaurant_id)
+                if sales is not None:
+                    sales.add(menu_item_id, sale_date, orders, quantity, revenue)
+
+    def flush(self) -> None:
+        """Write queued sales to MenuItemSalesDaily."""
+        with self._flush_lock:
+            self._flush()
+
+    def _flush(self) -> None:
+        with self._lock:
+            pending, self._pending = self._pending, {}
+        if not pending:
+            return
+
+        query = """INSERT INTO MenuItemSalesDaily (menu_item_id, sale_date, restaurant_id, order_count, quantity_sold, revenue)
+                   VALUES (%s, %s, %s, %s, %s, %s) AS new
+                   ON DUPLICATE KEY UPDATE order_count = order_count + new.order_count,
+                       quantity_sold = quantity_sold + new.quantity_sold,
+                       revenue = revenue + new.revenue"""
+        rows = [
+            (menu_item_id, sale_date, restaurant_id, orders, quantity, revenue)
+            for (restaurant_id, menu_item_id, sale_date), (orders, quantity, revenue) in pending.items()
+            if orders or quantity or revenue
+        ]
+        try:
+            self.db.execute_many(query, rows)
+        except Exception as e:
+            logger.error(f"Failed to flush item sales: {e}")
+            with self._lock:
+                # Put the work back, merging with anything queued meanwhile
+                for key, (orders, quantity, revenue) in pending.items():
+                    queued = self._pending.setdefault(key, [0, 0, Decimal("0")])
+                    queued[0] += orders
+                    queued[1] += quantity
+                    queued[2] += revenue
+
+    def _load(self, restaurant_id: int) -> _RestaurantSales:
+        since = date.today() - timedelta(days=MAX_WINDOW_DAYS - 1)
+        # No flush may commit between the read and the merge of pending sales below,
+        # or its rows would be in neither
+        with self._flush_lock:
+            # Flush first so the reload includes this worker's own sales
+            self._flush()
+            totals, daily = self.db.execute_multi(
+                """SELECT menu_item_id, SUM(order_count) AS order_count, SUM(quantity_sold) AS quantity_sold,
+                          SUM(revenue) AS revenue
+                   FROM MenuItemSalesDaily WHERE restaurant_id = %s GROUP BY menu_item_id;
+
+                   SELECT menu_item_id, sale_date, order_count, quantity_sold, revenue
+                   FROM MenuItemSalesDaily WHERE restaurant_id = %s AND sale_date >= %s""",
+                (restaurant_id, restaurant_id, since)
+            )
+            sales = _RestaurantSales()
+            for row in totals:
+                _add(sales.all_time, row["menu_item_id"], int(row["order_count"]), int(row["quantity_sold"]),
+                     row["revenue"])
+            for row in daily:
+                _add(sales.daily.setdefault(row["sale_date"], {}), row["menu_item_id"],
+                     row["order_count"], row["quantity_sold"], row["revenue"])
+
+            with self._lock:
+                # Sales recorded since the flush (or left by a failed one) are queued but not in the rows just read
+                for (pending_restaurant, menu_item_id, sale_date), (orders, quantity, revenue) in self._pending.items():
+                    if pending_restaurant == restaurant_id:
+                        sales.add(menu_item_id, sale_date, orders, quantity, revenue)
+                self._restaurants[restaurant_id] = sales
+        return sales
+
+    def top_items(self, restaurant_id: int, window: str = "all", limit: int = 10) -> List[Tuple[int, int, int, Decimal]]:
+        """Best-selling items as (menu_item_id, order_count, quantity_sold, revenue), most ordered first."""
+        if window not in WINDOWS:
+            raise ValueError(f"Window must be one of: {', '.join(WINDOWS)}")
+        sales = self._restaurants.get(restaurant_id)
+        if sales is None or time.monotonic() - sales.loaded_at > settings.ITEM_SALES_REFRESH_SECONDS:
+            sales = self._load(restaurant_id)
+
+        with self._lock:
+            days = WINDOWS[window]
+            if days is None:
+                totals = sales.all_time
+            else:
+                cutoff = date.today() - timedelta(days=days)
+                totals = {}
+                for sale_date in list(sales.daily):
+                    if sale_date <= date.today() - timedelta(days=MAX_WINDOW_DAYS):
+                        del sales.daily[sale_date]
+                    elif sale_date > cutoff:
+                        for menu_item_id, (orders, quantity, revenue) in sales.daily[sale_date].items():
+                            _add(totals, menu_item_id, orders, quantity, revenue)
+            ranked = heapq.nlargest(
+                limit,
+                ((menu_item_id, *counters) for menu_item_id, counters in totals.items() if counters[0] > 0),
+                key=lambda item: (item[1], item[2])
+            )
+        return ranked
+
+    async def run_flusher(self) -> None:
+        """Flush sales every ITEM_SALES_FLUSH_INTERVAL_SECONDS until cancelled."""
+        try:
+            while True:
+                await asyncio.sleep(settings.ITEM_SALES_FLUSH_INTERVAL_SECONDS)
+                await asyncio.to_thread(self.flush)
+        finally:
+            await asyncio.to_thread(self.flush)
+
+
+# Global item sales counters
+item_sales = ItemSalesCounters()
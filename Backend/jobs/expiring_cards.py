@@ -0,0 +1,75 @@
+"""Notify customers whose cards expire in a given month (next month by default).
+
+Run from the Backend directory, e.g. from a monthly cron entry:
+
+    python -m jobs.expiring_cards [--year 2026 --month 11] [--batch-size 500]
+
+Cards are read across all customers in keyset pages over
+idx_payment_method_expiry, and notifications are written in bulk. Each card
+gets at most one notification per expiry month, so re-running is safe.
+"""
+import argparse
+import logging
+import os
+import sys
+from datetime import date
+from typing import Optional
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from crud.notification_crud import NotificationCRUD
+from crud.payment_method_crud import PaymentMethodCRUD, add_months
+from models import NotificationCreate, NotificationTypeEnum
+
+logger = logging.getLogger(__name__)
+
+
+def sweep_expiring_cards(expiry_year: Optional[int] = None, expiry_month: Optional[int] = None,
+                         batch_size: int = 500) -> int:
+    """Create CARD_EXPIRING notifications for every card expiring in the month; returns cards seen."""
+    if expiry_year is None or expiry_month is None:
+        today = date.today()
+        expiry_year, expiry_month = add_months(today.year, today.month, 1)
+
+    payment_methods = PaymentMethodCRUD()
+    notifications = NotificationCRUD()
+    last_id = 0
+    seen = 0
+    while True:
+        cards = payment_methods.get_cards_expiring_in(expiry_year, expiry_month, last_id, batch_size)
+        if not cards:
+            break
+        notifications.create_notifications([
+            NotificationCreate(
+                customer_id=card.customer_id,
+                notification_type=NotificationTypeEnum.CARD_EXPIRING,
+                reference_id=card.payment_method_id,
+                dedupe_key=f"CARD_EXPIRING:{card.payment_method_id}:{expiry_year}-{expiry_month:02d}",
+                message=(f"Your {card.card_brand or 'card'} ending in {card.card_last_four or '****'} "
+                         f"expires {expiry_month:02d}/{expiry_year}. Please update your payment method.")
+            )
+            for card in cards
+        ], batch_size)
+        seen += len(cards)
+        last_id = cards[-1].payment_method_id
+        if len(cards) < batch_size:
+            break
+
+    logger.info(f"Expiring card sweep for {expiry_month:02d}/{expiry_year}: {seen} cards")
+    return seen
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--year", type=int, help="expiry year (default: next month's)")
+    parser.add_argument("--month", type=int, help="expiry month (default: next month)")
+    parser.add_argument("--batch-size", type=int, default=500, help="cards per keyset page")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+    seen = sweep_expiring_cards(args.year, args.month, args.batch_size)
+    print(f"{seen} expiring cards processed")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+"""Load postal code centroids and fill in missing Address coordinates.
+
+Run from the Backend directory:
+
+    python -m jobs.geocode_addresses [--centroids centroids.csv]
+
+The optional CSV has postal_code,country,latitude,longitude columns and is
+upserted into PostalCodeCentroid. Addresses without coordinates are then
+geocoded from that table in one set-based UPDATE.
+"""
+import argparse
+import csv
+import logging
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from database import get_db_manager
+from delivery_quotes import normalize_postal_code
+
+logger = logging.getLogger(__name__)
+
+
+def load_centroids(path: str, batch_size: int = 1000) -> int:
+    """Upsert centroids from a CSV file; returns rows read."""
+    db = get_db_manager()
+    query = """INSERT INTO PostalCodeCentroid (postal_code, country, latitude, longitude)
+               VALUES (%s, %s, %s, %s) AS new
+               ON DUPLICATE KEY UPDATE latitude = new.latitude, longitude = new.longitude"""
+    rows = []
+    total = 0
+    with open(path, newline="", encoding="utf-8") as handle:
+        for record in csv.DictReader(handle):
+            rows.append((
+                normalize_postal_code(record["postal_code"]),
+                (record.get("country") or "USA").upper(),
+                float(record["latitude"]),
+                float(record["longitude"])
+            ))
+            if len(rows) >= batch_size:
+                db.execute_many(query, rows)
+                total += len(rows)
+                rows = []
+    if rows:
+        db.execute_many(query, rows)
+        total += len(rows)
+    return total
+
+
+def backfill_addresses() -> int:
+    """Copy centroid coordinates onto addresses that have none; returns rows updated."""
+    query = """UPDATE Address a
+               JOIN PostalCodeCentroid p
+                 ON p.postal_code = REPLACE(UPPER(TRIM(a.postal_code)), ' ', '')
+                AND p.country = UPPER(a.country)
+               SET a.latitude = p.latitude, a.longitude = p.longitude
+               WHERE a.latitude IS NULL OR a.longitude IS NULL"""
+    return get_db_manager().execute_update(query)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--centroids", help="CSV file to load into PostalCodeCentroid first")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+    if args.centroids:
+        print(f"{load_centroids(args.centroids)} postal code centroids loaded")
+    print(f"{backfill_addresses()} addresses geocoded")
+
+
+if __name__ == "__main__":
+    main()
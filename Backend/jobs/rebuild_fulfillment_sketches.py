@@ -0,0 +1,31 @@
+"""Rebuild the FulfillmentSketch latency sketches from order stage timestamps.
+
+Run from the Backend directory after deploying the table, or to repair drift:
+
+    python -m jobs.rebuild_fulfillment_sketches
+
+Every sketch is recomputed from `Order` history. Status transitions written
+through OrderCRUD keep the sketches current afterwards.
+"""
+import argparse
+import logging
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from latency_sketches import fulfillment_latency
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--batch-size", type=int, default=5000, help="orders fetched per round trip")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+    orders = fulfillment_latency.rebuild(args.batch_size)
+    print(f"Fulfillment sketches rebuilt from {orders} orders")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,39 @@
+"""Rebuild the RestaurantDailyStats and CustomerStats rollups from orders and refunds.
+
+Run from the Backend directory after deploying the tables, or to repair drift:
+
+    python -m jobs.rebuild_restaurant_stats [--from 2026-01-01] [--skip-customers]
+
+Without --from every daily row is recomputed; with it only days on or after
+that date are replaced. CustomerStats is always recounted in full. Writes
+through OrderCRUD and RefundCRUD keep both current afterwards.
+"""
+import argparse
+import logging
+import os
+import sys
+from datetime import date
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from crud.stats_crud import CustomerStatsCRUD, RestaurantStatsCRUD
+
+logger = logging.getLogger(__name__)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--from", dest="from_date", type=date.fromisoformat,
+                        help="only rebuild days on or after this date (YYYY-MM-DD)")
+    parser.add_argument("--skip-customers", action="store_true", help="leave CustomerStats as is")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+    affected = RestaurantStatsCRUD().rebuild(args.from_date)
+    print(f"Restaurant daily stats rebuilt ({affected} rows affected)")
+    if not args.skip_customers:
+        print(f"Customer stats rebuilt ({CustomerStatsCRUD().rebuild()} customers)")
+
+
+if __name__ == "__main__":
+    main()
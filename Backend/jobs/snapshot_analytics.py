@@ -0,0 +1,37 @@
+"""Snapshot the reporting tables from MySQL into Parquet for the analytics engine.
+
+Run from the Backend directory, e.g. every few minutes from cron:
+
+    python -m jobs.snapshot_analytics [--full]
+
+Each run appends one Parquet part per table under ANALYTICS_DIR with the
+rows changed since the last run (Order by updated_at, with its items;
+Refund by processed/requested time); Restaurant and Customer are copied
+whole. --full re-copies everything and removes the older parts, which keeps
+the part count down and drops rows deleted from MySQL; run it nightly.
+"""
+import argparse
+import logging
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from analytics import AnalyticsSnapshotter
+
+logger = logging.getLogger(__name__)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--full", action="store_true", help="re-copy every row and drop older parts")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+    written = AnalyticsSnapshotter().snapshot(full=args.full)
+    for table, rows in written.items():
+        print(f"{table}: {rows} rows")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,289 @@
+from threading import Lock
+from typing import Dict, Iterable, List, Optional, Tuple
+import asyncio
+import json
+import logging
+import math
+from cache import latency_cache
+from config import settings
+from database import get_db_manager
+
+logger = logging.getLogger(__name__)
+
+# Stage name -> (start timestamp, end timestamp) on Order, as written by update_order_status
+STAGES: Dict[str, Tuple[str, str]] = {
+    "confirmation": ("created_at", "confirmed_at"),
+    "kitchen_start": ("confirmed_at", "prepared_at"),
+    "preparation": ("prepared_at", "ready_at"),
+    "pickup": ("ready_at", "picked_up_at"),
+    "delivery": ("picked_up_at", "delivered_at"),
+    "fulfillment": ("confirmed_at", "delivered_at"),
+}
+
+PERCENTILES = (0.5, 0.9, 0.99)
+
+# (restaurant_id, stage, seconds)
+LatencySample = Tuple[int, str, float]
+
+
+class DDSketch:
+    """Mergeable quantile sketch with bounded relative error (DDSketch).
+
+    Values land in logarithmic bins of ratio gamma, so any quantile is
+    returned within relative_accuracy of the true value, and two sketches
+    merge by adding bin counts. Values below min_value count as zero.
+    """
+
+    def __init__(self, relative_accuracy: float = 0.01, max_bins: int = 2048, min_value: float = 1e-3):
+        self.relative_accuracy = relative_accuracy
+        self.gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self._log_gamma = math.log(self.gamma)
+        self.max_bins = max_bins
+        self.min_value = min_value
+        self.bins: Dict[int, int] = {}
+        self.zero_count = 0
+        self.count = 0
+        self.sum = 0.0
+        self.min: Optional[float] = None
+        self.max: Optional[float] = None
+
+    def add(self, value: float, count: int = 1) -> None:
+        if value < self.min_value:
+            self.zero_count += count
+        else:
+            key = math.ceil(math.log(value) / self._log_gamma)
+            self.bins[key] = self.bins.get(key, 0) + count
+            if len(self.bins) > self.max_bins:
+                self._collapse()
+        self.count += count
+        self.sum += value * count
+        self.min = value if self.min is None else min(self.min, value)
+        self.max = value if self.max is None else max(self.max, value)
+
+    def _collapse(self) -> None:
+        # Fold the lowest bins together; only the smallest quantiles lose accuracy
+        keys = sorted(self.bins)
+        excess = keys[:len(keys) - self.max_bins + 1]
+        target = keys[len(excess)]
+        self.bins[target] += sum(self.bins.pop(key) for key in excess)
+
+    def merge(self, other: "DDSketch") -> None:
+        if other.relative_accuracy != self.relative_accuracy:
+            raise ValueError("Cannot merge sketches with different relative accuracy")
+        for key, count in other.bins.items():
+            self.bins[key] = self.bins.get(key, 0) + count
+        while len(self.bins) > self.max_bins:
+            self._collapse()
+        self.zero_count += other.zero_count
+        self.count += other.count
+        self.sum += other.sum
+        if other.min is not None:
+            self.min = other.min if self.min is None else min(self.min, other.min)
+            self.max = other.max if self.max is None else max(self.max, other.max)
+
+    def quantile(self, q: float) -> Optional[float]:
+        """Approximate value at quantile q (0..1), or None if empty."""
+        if self.count == 0:
+            return None
+        rank = q * (self.count - 1)
+        if rank < self.zero_count:
+            return 0.0
+        seen = self.zero_count
+        for key in sorted(self.bins):
+            seen += self.bins[key]
+            if seen > rank:
+                value = 2 * self.gamma ** key / (self.gamma + 1)
+                return min(max(value, self.min), self.max)
+        return self.max
+
+    def to_json(self) -> str:
+        return json.dumps({
+            "relative_accuracy": self.relative_accuracy,
+            "bins": self.bins,
+            "zero_count": self.zero_count,
+            "count": self.count,
+            "sum": self.sum,
+            "min": self.min,
+            "max": self.max
+        })
+
+    @classmethod
+    def from_json(cls, data) -> "DDSketch":
+        """Sketch from to_json output (JSON text or the decoded dict of a JSON column)."""
+        values = json.loads(data) if isinstance(data, (str, bytes)) else data
+        sketch = cls(relative_accuracy=values["relative_accuracy"])
+        sketch.bins = {int(key): count for key, count in values["bins"].items()}
+        sketch.zero_count = values["zero_count"]
+        sketch.count = values["count"]
+        sketch.sum = values["sum"]
+        sketch.min = values["min"]
+        sketch.max = values["max"]
+        return sketch
+
+
+def stage_samples(restaurant_id: int, before: Optional[dict], after: dict) -> List[LatencySample]:
+    """Stage durations completed by an order update: stages whose end timestamp was just written."""
+    samples = []
+    for stage, (start_column, end_column) in STAGES.items():
+        started, ended = after.get(start_column), after.get(end_column)
+        if started is None or ended is None:
+            continue
+        if before is not None and before.get(end_column) == ended:
+            continue
+        seconds = (ended - started).total_seconds()
+        if seconds >= 0:
+            samples.append((restaurant_id, stage, seconds))
+    return samples
+
+
+class FulfillmentLatency:
+    """Per-restaurant, per-stage fulfillment latency sketches.
+
+    Samples are added to in-memory delta sketches on each status transition
+    and merged into FulfillmentSketch rows by the background flusher, so
+    concurrent workers never overwrite each other. Percentiles come from the
+    stored sketches (merged across restaurants for the platform view) plus
+    this worker's unflushed deltas, without reading Order.
+    """
+
+    def __init__(self):
+        self.db = get_db_manager()
+        self._pending: Dict[Tuple[int, str], DDSketch] = {}
+        self._lock = Lock()
+
+    def record(self, samples: Iterable[LatencySample]) -> None:
+        with self._lock:
+            for restaurant_id, stage, seconds in samples:
+                sketch = self._pending.get((restaurant_id, stage))
+                if sketch is None:
+                    sketch = self._pending[(restaurant_id, stage)] = DDSketch()
+                sketch.add(seconds)
+
+    def flush(self) -> None:
+        """Merge queued samples into FulfillmentSketch."""
+        with self._lock:
+            pending, self._pending = self._pending, {}
+        if not pending:
+            return
+
+        try:
+            with self.db.transaction() as cursor:
+                keys = list(pending)
+                cursor.execute(
+                    "SELECT restaurant_id, stage, sketch FROM FulfillmentSketch WHERE (restaurant_id, stage) IN ("
+                    + ", ".join(["(%s, %s)"] * len(keys)) + ") FOR UPDATE",
+                    tuple(value for key in keys for value in key)
+                )
+                stored = {(row["restaurant_id"], row["stage"]): DDSketch.from_json(row["sketch"])
+                          for row in cursor.fetchall()}
+                rows = []
+                for key, delta in pending.items():
+                    sketch = stored.get(key)
+                    if sketch is None:
+                        sketch = delta
+                    else:
+                        sketch.merge(delta)
+                    rows.append((key[0], key[1], sketch.to_json(), sketch.count))
+                cursor.executemany(
+                    """INSERT INTO FulfillmentSketch (restaurant_id, stage, sketch, sample_count)
+                       VALUES (%s, %s, %s, %s) AS new
+                       ON DUPLICATE KEY UPDATE sketch = new.sketch, sample_count = new.sample_count,
+                           updated_at = CURRENT_TIMESTAMP""",
+                    rows
+                )
+            # The flushed samples are no longer pending, so drop cached sketches that lack them
+            for restaurant_id in {restaurant_id for restaurant_id, _ in pending}:
+                latency_cache.invalidate(restaurant_id)
+            latency_cache.invalidate("platform")
+        except Exception as e:
+            logger.error(f"Failed to flush fulfillment latency sketches: {e}")
+            with self._lock:
+                # Put the work back, merging with anything queued meanwhile
+                for key, delta in pending.items():
+                    queued = self._pending.get(key)
+                    if queued is not None:
+                        delta.merge(queued)
+                    self._pending[key] = delta
+
+    def _stage_sketches(self, restaurant_id: Optional[int]) -> Dict[str, DDSketch]:
+        cache_key = restaurant_id if restaurant_id is not None else "platform"
+        sketches = latency_cache.get(cache_key)
+        if sketches is None:
+            query = "SELECT restaurant_id, stage, sketch FROM FulfillmentSketch"
+            params = ()
+            if restaurant_id is not None:
+                query += " WHERE restaurant_id = %s"
+                params = (restaurant_id,)
+            sketches = {}
+            for row in self.db.execute_query(query, params) or []:
+                sketch = DDSketch.from_json(row["sketch"])
+                if row["stage"] in sketches:
+                    sketches[row["stage"]].merge(sketch)
+                else:
+                    sketches[row["stage"]] = sketch
+            latency_cache.set(cache_key, sketches)
+
+        # Copy before adding this worker's unflushed samples so the cached sketches stay as stored
+        merged = {stage: DDSketch.from_json(sketch.to_json()) for stage, sketch in sketches.items()}
+        with self._lock:
+            for (pending_restaurant, stage), delta in self._pending.items():
+                if restaurant_id is None or pending_restaurant == restaurant_id:
+                    merged.setdefault(stage, DDSketch()).merge(delta)
+        return merged
+
+    def percentiles(self, restaurant_id: Optional[int] = None) -> List[dict]:
+        """p50/p90/p99 and mean minutes per stage, for one restaurant or the whole platform."""
+        sketches = self._stage_sketches(restaurant_id)
+        stages = []
+        for stage in STAGES:
+            sketch = sketches.get(stage)
+            if sketch is None or sketch.count == 0:
+                stages.append({"stage": stage, "sample_count": 0})
+                continue
+            p50, p90, p99 = (round(sketch.quantile(q) / 60, 1) for q in PERCENTILES)
+            stages.append({
+                "stage": stage,
+                "sample_count": sketch.count,
+                "p50_minutes": p50,
+                "p90_minutes": p90,
+                "p99_minutes": p99,
+                "mean_minutes": round(sketch.sum / sketch.count / 60, 1)
+            })
+        return stages
+
+    def rebuild(self, batch_size: int = 5000) -> int:
+        """Recompute every sketch from Order history; returns orders read."""
+        columns = sorted({column for pair in STAGES.values() for column in pair})
+        query = f"SELECT restaurant_id, {', '.join(columns)} FROM `Order` WHERE confirmed_at IS NOT NULL"
+        sketches: Dict[Tuple[int, str], DDSketch] = {}
+        orders = 0
+        for row in self.db.stream_query(query, batch_size=batch_size):
+            orders += 1
+            for restaurant_id, stage, seconds in stage_samples(row["restaurant_id"], None, row):
+                sketch = sketches.get((restaurant_id, stage))
+                if sketch is None:
+                    sketch = sketches[(restaurant_id, stage)] = DDSketch()
+                sketch.add(seconds)
+
+        with self.db.transaction() as cursor:
+            cursor.execute("DELETE FROM FulfillmentSketch")
+            cursor.executemany(
+                "INSERT INTO FulfillmentSketch (restaurant_id, stage, sketch, sample_count) VALUES (%s, %s, %s, %s)",
+                [(restaurant_id, stage, sketch.to_json(), sketch.count)
+                 for (restaurant_id, stage), sketch in sketches.items()]
+            )
+        latency_cache.clear()
+        return orders
+
+    async def run_flusher(self) -> None:
+        """Flush samples every LATENCY_FLUSH_INTERVAL_SECONDS until cancelled."""
+        try:
+            while True:
+                await asyncio.sleep(settings.LATENCY_FLUSH_INTERVAL_SECONDS)
+                await asyncio.to_thread(self.flush)
+        finally:
+            await asyncio.to_thread(self.flush)
+
+
+# Global fulfillment latency sketches
+fulfillment_latency = FulfillmentLatency()
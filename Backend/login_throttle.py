@@ -0,0 +1,145 @@
+from collections import deque
+from datetime import datetime
+from threading import Lock
+from typing import Deque, Dict, Hashable, Optional, Set, Tuple
+import asyncio
+import logging
+import time
+from config import settings
+
+logger = logging.getLogger(__name__)
+
+
+class SlidingWindowLimiter:
+    """Counts events per key over the last window_seconds."""
+
+    def __init__(self, max_events: int, window_seconds: float):
+        self.max_events = max_events
+        self.window_seconds = window_seconds
+        self._events: Dict[Hashable, Deque[float]] = {}
+        self._lock = Lock()
+
+    def _trim(self, events: Deque[float], now: float) -> None:
+        cutoff = now - self.window_seconds
+        while events and events[0] <= cutoff:
+            events.popleft()
+
+    def is_limited(self, key: Hashable) -> bool:
+        with self._lock:
+            events = self._events.get(key)
+            if not events:
+                return False
+            self._trim(events, time.monotonic())
+            return len(events) >= self.max_events
+
+    def record(self, key: Hashable) -> None:
+        with self._lock:
+            events = self._events.setdefault(key, deque())
+            now = time.monotonic()
+            self._trim(events, now)
+            events.append(now)
+            # Anything beyond the limit can't change the answer
+            while len(events) > self.max_events:
+                events.popleft()
+
+    def reset(self, key: Hashable) -> None:
+        with self._lock:
+            self._events.pop(key, None)
+
+    def prune(self) -> None:
+        """Forget keys with no events left in the window."""
+        with self._lock:
+            now = time.monotonic()
+            for key in list(self._events):
+                self._trim(self._events[key], now)
+                if not self._events[key]:
+                    del self._events[key]
+
+
+class LoginThrottle:
+    """Failed-login limiting and counter bookkeeping for BR-004, held in memory.
+
+    Attempts over the per-email or per-IP limit are rejected before any SQL
+    runs. Failed-attempt increments and resets are queued and written to
+    Account in batches by the background flusher instead of one UPDATE per
+    login.
+    """
+
+    def __init__(self):
+        self.by_email = SlidingWindowLimiter(settings.LOGIN_MAX_FAILURES_PER_EMAIL, settings.LOGIN_WINDOW_SECONDS)
+        self.by_ip = SlidingWindowLimiter(settings.LOGIN_MAX_FAILURES_PER_IP, settings.LOGIN_WINDOW_SECONDS)
+        self._failures: Dict[int, Tuple[int, datetime]] = {}
+        self._resets: Set[int] = set()
+        self._lock = Lock()
+
+    @staticmethod
+    def _email_key(email: str) -> str:
+        return email.strip().casefold()
+
+    def is_blocked(self, email: str, client_ip: Optional[str]) -> bool:
+        """Whether this email or IP has used up its failed attempts."""
+        if client_ip and self.by_ip.is_limited(client_ip):
+            return True
+        return self.by_email.is_limited(self._email_key(email))
+
+    def record_failure(self, email: str, client_ip: Optional[str], account_id: Optional[int] = None) -> None:
+        """Count a failed attempt; unknown emails are limited but not persisted."""
+        self.by_email.record(self._email_key(email))
+        if client_ip:
+            self.by_ip.record(client_ip)
+        if account_id is None:
+            return
+        with self._lock:
+            count, _ = self._failures.get(account_id, (0, None))
+            self._failures[account_id] = (count + 1, datetime.now())
+            self._resets.discard(account_id)
+
+    def record_success(self, email: str, account_id: int, stored_failures: int) -> None:
+        """Clear the email window and queue a reset only if there is something to reset."""
+        self.by_email.reset(self._email_key(email))
+        with self._lock:
+            pending = self._failures.pop(account_id, None)
+            if stored_failures or pending:
+                self._resets.add(account_id)
+
+    def flush(self) -> None:
+        """Write queued increments and resets to Account."""
+        with self._lock:
+            failures, self._failures = self._failures, {}
+            resets, self._resets = self._resets, set()
+        if not failures and not resets:
+            return
+
+        # Imported here to keep this module free of CRUD dependencies at import time
+        from crud.account_crud import AccountCRUD
+        account_crud = AccountCRUD()
+        try:
+            if failures:
+                account_crud.record_failed_logins_bulk(failures)
+            if resets:
+                account_crud.reset_failed_logins_bulk(list(resets))
+        except Exception as e:
+            logger.error(f"Failed to flush login counters: {e}")
+            with self._lock:
+                # Put the work back, merging with anything queued meanwhile
+                for account_id, (count, last_attempt) in failures.items():
+                    if account_id in self._resets:
+                        continue
+                    queued_count, queued_last = self._failures.get(account_id, (0, last_attempt))
+                    self._failures[account_id] = (queued_count + count, max(queued_last, last_attempt))
+                self._resets |= {account_id for account_id in resets if account_id not in self._failures}
+
+    async def run_flusher(self) -> None:
+        """Flush counters every LOGIN_FLUSH_INTERVAL_SECONDS until cancelled."""
+        try:
+            while True:
+                await asyncio.sleep(settings.LOGIN_FLUSH_INTERVAL_SECONDS)
+                await asyncio.to_thread(self.flush)
+                self.by_email.prune()
+                self.by_ip.prune()
+        finally:
+            await asyncio.to_thread(self.flush)
+
+
+# Global login throttle
+login_throttle = LoginThrottle()
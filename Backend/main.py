@@ -2,15 +2,27 @@ from fastapi import FastAPI, HTTPException, status
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
 from contextlib import asynccontextmanager
+import asyncio
 import logging
 from database import get_db_manager
 from config import settings
+from spatial_index import restaurant_index
+from delivery_zones import delivery_zone_index
+from schedule_index import schedule_index
+from delivery_quotes import delivery_quotes
+from login_throttle import login_throttle
+from item_sales import item_sales
+from latency_sketches import fulfillment_latency
+from audit_writer import audit_writer
+from passwords import shutdown_pool
+from session_tokens import SIGNING_ENABLED
 
 # Import route modules
 from routes import (
     account_routes, menu_routes, order_routes, utility_routes,
     address_routes, payment_method_routes, business_hours_routes,
-    modifier_routes, refund_routes, auth_routes
+    modifier_routes, refund_routes, auth_routes, delivery_zone_routes,
+    report_routes
 )
 
 # Configure logging
@@ -32,10 +44,29 @@ async def lifespan(app: FastAPI):
         logger.error("Database connection failed")
         raise Exception("Could not connect to database")
     
+    if not SIGNING_ENABLED:
+        logger.error("SECRET_KEY is unset or a placeholder; logins and authenticated routes are disabled")
+    restaurant_index.load()
+    delivery_zone_index.load()
+    schedule_index.load()
+    delivery_quotes.load_centroids()
+    login_flusher = asyncio.create_task(login_throttle.run_flusher())
+    item_sales_flusher = asyncio.create_task(item_sales.run_flusher())
+    latency_flusher = asyncio.create_task(fulfillment_latency.run_flusher())
+    audit_writer.start()
+    
     yield
     
     # Shutdown
     logger.info("Shutting down GrubnGo API...")
+    for flusher in (login_flusher, item_sales_flusher, latency_flusher):
+        flusher.cancel()
+        try:
+            await flusher
+        except asyncio.CancelledError:
+            pass
+    await asyncio.to_thread(audit_writer.stop)
+    shutdown_pool()
 
 
 # Create FastAPI app
@@ -59,6 +90,8 @@ app.add_middleware(
 
 # Include route modules
 app.include_router(auth_routes.router, prefix="/api/v1/auth", tags=["Authentication"])
+# Before account routes so GET /restaurants/open-now is not taken for /restaurants/{restaurant_id}
+app.include_router(business_hours_routes.router, prefix="/api/v1", tags=["Business Hours"])
 app.include_router(account_routes.router, prefix="/api/v1", tags=["Accounts"])
 app.include_router(menu_routes.router, prefix="/api/v1", tags=["Menus"])
 app.include_router(order_routes.router, prefix="/api/v1", tags=["Orders"])
@@ -67,9 +100,10 @@ app.include_router(utility_routes.router, prefix="/api/v1", tags=["Analytics"])
 # New route modules for extended functionality
 app.include_router(address_routes.router, prefix="/api/v1", tags=["Addresses"])
 app.include_router(payment_method_routes.router, prefix="/api/v1", tags=["Payment Methods"])
-app.include_router(business_hours_routes.router, prefix="/api/v1", tags=["Business Hours"])
+app.include_router(delivery_zone_routes.router, prefix="/api/v1", tags=["Delivery Zones"])
 app.include_router(modifier_routes.router, prefix="/api/v1", tags=["Modifiers"])
 app.include_router(refund_routes.router, prefix="/api/v1", tags=["Refunds"])
+app.include_router(report_routes.router, prefix="/api/v1", tags=["Reports"])
 
 
 @app.get("/", response_model=dict)
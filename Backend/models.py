@@ -1,7 +1,7 @@
-from datetime import datetime, time
+from datetime import date, datetime, time
 from decimal import Decimal
 from enum import Enum
-from typing import Optional, List
+from typing import Any, Dict, Optional, List
 from pydantic import BaseModel, Field, EmailStr
 
 
@@ -33,6 +33,10 @@ class OperatingStatusEnum(str, Enum):
     PERMANENTLY_CLOSED = "PERMANENTLY_CLOSED"
 
 
+class NotificationTypeEnum(str, Enum):
+    CARD_EXPIRING = "CARD_EXPIRING"
+
+
 class PaymentTypeEnum(str, Enum):
     CREDIT_CARD = "CREDIT_CARD"
     DEBIT_CARD = "DEBIT_CARD"
@@ -113,6 +117,8 @@ class AddressCreate(BaseModel):
     postal_code: str
     country: str = "USA"
     is_default: bool = False
+    latitude: Optional[float] = None
+    longitude: Optional[float] = None
 
 
 class AddressUpdate(BaseModel):
@@ -123,6 +129,8 @@ class AddressUpdate(BaseModel):
     postal_code: Optional[str] = None
     country: Optional[str] = None
     is_default: Optional[bool] = None
+    latitude: Optional[float] = None
+    longitude: Optional[float] = None
 
 
 # Payment Method models
@@ -158,6 +166,41 @@ class BusinessHoursUpdate(BaseModel):
     is_closed: Optional[bool] = None
 
 
+class BusinessHoursTemplateDay(BaseModel):
+    day_of_week: DayOfWeekEnum
+    open_time: time
+    close_time: time
+    is_closed: bool = False
+
+
+class BulkBusinessHoursUpsert(BaseModel):
+    restaurant_ids: List[int]
+    hours: List[BusinessHoursTemplateDay]
+
+
+class BusinessHoursExceptionCreate(BaseModel):
+    restaurant_id: int
+    exception_date: date
+    is_closed: bool = False
+    open_time: Optional[time] = None
+    close_time: Optional[time] = None  # earlier than open_time means past midnight
+    reason: Optional[str] = None
+
+
+# Delivery Zone models
+class DeliveryZoneCreate(BaseModel):
+    restaurant_id: int
+    zone_name: str
+    polygon: List[List[float]]  # [[latitude, longitude], ...]
+    is_active: bool = True
+
+
+class DeliveryZoneUpdate(BaseModel):
+    zone_name: Optional[str] = None
+    polygon: Optional[List[List[float]]] = None
+    is_active: Optional[bool] = None
+
+
 class MenuCreate(BaseModel):
     restaurant_id: int
     name: str
@@ -324,6 +367,8 @@ class Address(BaseModel):
     postal_code: str
     country: str
     is_default: bool
+    latitude: Optional[float] = None
+    longitude: Optional[float] = None
     created_at: datetime
     updated_at: datetime
 
@@ -348,6 +393,37 @@ class PaymentMethod(BaseModel):
         from_attributes = True
 
 
+class DeliveryQuote(BaseModel):
+    restaurant_id: int
+    distance_km: float
+    deliverable: bool
+    delivery_fee: Optional[Decimal] = None
+    eta_minutes: int
+
+
+# Notification models
+class NotificationCreate(BaseModel):
+    customer_id: int
+    notification_type: NotificationTypeEnum
+    reference_id: Optional[int] = None
+    dedupe_key: str = Field(..., max_length=100)
+    message: str = Field(..., max_length=500)
+
+
+class Notification(BaseModel):
+    notification_id: int
+    customer_id: int
+    notification_type: NotificationTypeEnum
+    reference_id: Optional[int] = None
+    dedupe_key: str
+    message: str
+    is_read: bool
+    created_at: datetime
+
+    class Config:
+        from_attributes = True
+
+
 class BusinessHours(BaseModel):
     business_hours_id: int
     restaurant_id: int
@@ -360,6 +436,33 @@ class BusinessHours(BaseModel):
         from_attributes = True
 
 
+class BusinessHoursException(BaseModel):
+    business_hours_exception_id: int
+    restaurant_id: int
+    exception_date: date
+    is_closed: bool
+    open_time: Optional[time] = None
+    close_time: Optional[time] = None
+    reason: Optional[str] = None
+    created_at: datetime
+
+    class Config:
+        from_attributes = True
+
+
+class DeliveryZone(BaseModel):
+    delivery_zone_id: int
+    restaurant_id: int
+    zone_name: str
+    polygon: List[List[float]]
+    is_active: bool
+    created_at: datetime
+    updated_at: datetime
+
+    class Config:
+        from_attributes = True
+
+
 class Menu(BaseModel):
     menu_id: int
     restaurant_id: int
@@ -476,6 +579,14 @@ class CustomerOrderSummary(BaseModel):
         from_attributes = True
 
 
+class CustomerProfile(BaseModel):
+    customer: Customer
+    addresses: List[Address]
+    payment_methods: List[PaymentMethod]
+    active_orders: List[Order]
+    order_summary: CustomerOrderSummary
+
+
 class RestaurantRevenueSummary(BaseModel):
     restaurant_id: int
     restaurant_name: str
@@ -487,6 +598,64 @@ class RestaurantRevenueSummary(BaseModel):
         from_attributes = True
 
 
+class RestaurantDailyStats(BaseModel):
+    restaurant_id: int
+    stat_date: date
+    delivered_orders: int
+    gross_revenue: Decimal
+    refund_count: int
+    refunded_amount: Decimal
+
+    class Config:
+        from_attributes = True
+
+
+class TimeSeriesPoint(BaseModel):
+    bucket_start: datetime
+    value: float
+
+
+class TimeSeries(BaseModel):
+    metric: str
+    interval: str
+    restaurant_id: Optional[int] = None
+    points: List[TimeSeriesPoint]
+
+
+# Fulfillment latency models (all-time, from FulfillmentSketch)
+class StageLatency(BaseModel):
+    stage: str
+    sample_count: int
+    p50_minutes: Optional[float] = None
+    p90_minutes: Optional[float] = None
+    p99_minutes: Optional[float] = None
+    mean_minutes: Optional[float] = None
+
+
+class FulfillmentLatencyReport(BaseModel):
+    restaurant_id: Optional[int] = None
+    stages: List[StageLatency]
+
+
+# Analytics report models
+class AnalyticsReportInfo(BaseModel):
+    name: str
+    description: str
+    parameters: Dict[str, Any] = {}
+
+
+class AnalyticsQuery(BaseModel):
+    sql: str = Field(..., min_length=1)
+    max_rows: Optional[int] = Field(default=None, ge=1)
+
+
+class AnalyticsResult(BaseModel):
+    columns: List[str]
+    rows: List[List[Any]]
+    truncated: bool
+    snapshot_at: Optional[datetime] = None
+
+
 # Additional transaction and audit models
 class TransactionTypeEnum(str, Enum):
     AUTHORIZATION = "AUTHORIZATION"
@@ -568,6 +737,48 @@ class ModifierOption(BaseModel):
         from_attributes = True
 
 
+# Menu import/export models
+class ModifierOptionImport(BaseModel):
+    option_name: str
+    price_delta: Decimal = Field(default=Decimal("0.00"), decimal_places=2)
+    is_available: bool = True
+
+
+class ModifierImport(BaseModel):
+    modifier_name: str
+    min_selections: int = 0
+    max_selections: int = 1
+    is_required: bool = False
+    options: List[ModifierOptionImport] = []
+
+
+class MenuItemImport(BaseModel):
+    name: str
+    description: Optional[str] = None
+    price: Decimal = Field(..., decimal_places=2)
+    is_available: bool = True
+    available_from: Optional[time] = None
+    available_until: Optional[time] = None
+    modifiers: List[ModifierImport] = []
+
+
+class MenuImport(BaseModel):
+    name: str
+    is_active: bool = True
+    items: List[MenuItemImport] = []
+
+
+class MenuImportRequest(BaseModel):
+    menus: List[MenuImport]
+
+
+class MenuImportResult(BaseModel):
+    menus_created: int
+    menu_items_created: int
+    modifiers_created: int
+    modifier_options_created: int
+
+
 # Transaction models
 class TransactionCreate(BaseModel):
     order_id: int
@@ -676,6 +887,20 @@ class MenuItemPriceHistory(BaseModel):
         from_attributes = True
 
 
+class MenuItemPriceChange(BaseModel):
+    menu_item_id: int
+    new_price: Decimal = Field(..., gt=0, decimal_places=2)
+
+
+class BulkPriceUpdate(BaseModel):
+    """Either explicit per-item prices or a single rule applied to every matched item."""
+    prices: List[MenuItemPriceChange] = []
+    percent_change: Optional[Decimal] = None
+    amount_change: Optional[Decimal] = None
+    menu_id: Optional[int] = None
+    changed_by: Optional[int] = None
+
+
 # Order item modifier model
 class OrderItemModifierCreate(BaseModel):
     order_item_id: int
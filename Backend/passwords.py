@@ -0,0 +1,116 @@
+from concurrent.futures import ProcessPoolExecutor
+from threading import Lock
+from typing import Optional
+import asyncio
+import base64
+import hashlib
+import hmac
+import os
+from config import settings
+
+_ALGORITHM = "scrypt"
+_SALT_BYTES = 16
+_KEY_BYTES = 32
+
+_pool: Optional[ProcessPoolExecutor] = None
+_pool_lock = Lock()
+
+
+def _b64encode(data: bytes) -> str:
+    return base64.b64encode(data).decode("ascii").rstrip("=")
+
+
+def _b64decode(data: str) -> bytes:
+    return base64.b64decode(data + "=" * (-len(data) % 4))
+
+
+def _scrypt(password: str, salt: bytes, n: int, r: int, p: int) -> bytes:
+    """The CPU-heavy part; runs in a worker process."""
+    return hashlib.scrypt(password.encode(), salt=salt, n=n, r=r, p=p,
+                          maxmem=256 * n * r + 1024 * 1024, dklen=_KEY_BYTES)
+
+
+def _legacy_sha256(password: str) -> str:
+    return hashlib.sha256(password.encode()).hexdigest()
+
+
+def _is_legacy(stored_hash: str) -> bool:
+    return "$" not in stored_hash and len(stored_hash) == 64
+
+
+def get_pool() -> ProcessPoolExecutor:
+    """The shared, bounded process pool used for hashing."""
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = ProcessPoolExecutor(max_workers=settings.PASSWORD_HASH_WORKERS or os.cpu_count())
+        return _pool
+
+
+def shutdown_pool() -> None:
+    global _pool
+    with _pool_lock:
+        if _pool is not None:
+            _pool.shutdown(wait=True)
+            _pool = None
+
+
+def _format(salt: bytes, key: bytes, n: int, r: int, p: int) -> str:
+    return f"{_ALGORITHM}${n}${r}${p}${_b64encode(salt)}${_b64encode(key)}"
+
+
+def _parse(stored_hash: str):
+    algorithm, n, r, p, salt, key = stored_hash.split("$")
+    if algorithm != _ALGORITHM:
+        raise ValueError(f"Unsupported password hash algorithm: {algorithm}")
+    return int(n), int(r), int(p), _b64decode(salt), _b64decode(key)
+
+
+def needs_rehash(stored_hash: str) -> bool:
+    """Whether a stored hash is legacy SHA-256 or uses outdated cost settings."""
+    if _is_legacy(stored_hash):
+        return True
+    n, r, p, _, _ = _parse(stored_hash)
+    return (n, r, p) != (settings.PASSWORD_SCRYPT_N, settings.PASSWORD_SCRYPT_R, settings.PASSWORD_SCRYPT_P)
+
+
+def hash_password(password: str) -> str:
+    """Hash a password with scrypt in the process pool (blocking)."""
+    n, r, p = settings.PASSWORD_SCRYPT_N, settings.PASSWORD_SCRYPT_R, settings.PASSWORD_SCRYPT_P
+    salt = os.urandom(_SALT_BYTES)
+    key = get_pool().submit(_scrypt, password, salt, n, r, p).result()
+    return _format(salt, key, n, r, p)
+
+
+def verify_password(password: str, stored_hash: str) -> bool:
+    """Check a password against a scrypt or legacy SHA-256 hash (blocking).
+    
+    An unrecognized or corrupt stored hash fails verification.
+    """
+    if _is_legacy(stored_hash):
+        return hmac.compare_digest(_legacy_sha256(password), stored_hash)
+    try:
+        n, r, p, salt, key = _parse(stored_hash)
+    except ValueError:
+        return False
+    return hmac.compare_digest(get_pool().submit(_scrypt, password, salt, n, r, p).result(), key)
+
+
+async def hash_password_async(password: str) -> str:
+    """hash_password without blocking the event loop."""
+    n, r, p = settings.PASSWORD_SCRYPT_N, settings.PASSWORD_SCRYPT_R, settings.PASSWORD_SCRYPT_P
+    salt = os.urandom(_SALT_BYTES)
+    key = await asyncio.get_running_loop().run_in_executor(get_pool(), _scrypt, password, salt, n, r, p)
+    return _format(salt, key, n, r, p)
+
+
+async def verify_password_async(password: str, stored_hash: str) -> bool:
+    """verify_password without blocking the event loop."""
+    if _is_legacy(stored_hash):
+        return hmac.compare_digest(_legacy_sha256(password), stored_hash)
+    try:
+        n, r, p, salt, key = _parse(stored_hash)
+    except ValueError:
+        return False
+    computed = await asyncio.get_running_loop().run_in_executor(get_pool(), _scrypt, password, salt, n, r, p)
+    return hmac.compare_digest(computed, key)
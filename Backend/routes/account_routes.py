@@ -1,12 +1,14 @@
-from fastapi import APIRouter, HTTPException, status
+from fastapi import APIRouter, HTTPException, Query, status
 from typing import List
 from models import (
     Account, AccountResponse, AccountCreate, AccountUpdate,
-    Customer, CustomerCreate, CustomerUpdate,
+    Customer, CustomerCreate, CustomerUpdate, CustomerProfile,
     Restaurant, RestaurantCreate, RestaurantUpdate,
     PaginationParams
 )
 from crud.account_crud import AccountCRUD, CustomerCRUD, RestaurantCRUD
+from passwords import hash_password_async
+from spatial_index import restaurant_index
 
 router = APIRouter()
 
@@ -21,7 +23,8 @@ restaurant_crud = RestaurantCRUD()
 async def create_account(account_data: AccountCreate):
     """Create a new account."""
     try:
-        account_id = account_crud.create_account(account_data)
+        password_hash = await hash_password_async(account_data.password)
+        account_id = account_crud.create_account(account_data, password_hash=password_hash)
         return {"account_id": account_id, "message": "Account created successfully"}
     except Exception as e:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
@@ -61,7 +64,8 @@ async def get_accounts_paginated(limit: int = 20, offset: int = 0):
 @router.put("/accounts/{account_id}", response_model=dict)
 async def update_account(account_id: int, account_data: AccountUpdate):
     """Update account information."""
-    rows_affected = account_crud.update_account(account_id, account_data)
+    password_hash = await hash_password_async(account_data.password) if account_data.password is not None else None
+    rows_affected = account_crud.update_account(account_id, account_data, password_hash)
     if rows_affected == 0:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Account not found or no changes made")
     return {"message": "Account updated successfully"}
@@ -70,7 +74,7 @@ async def update_account(account_id: int, account_data: AccountUpdate):
 @router.put("/accounts/{account_id}/password", response_model=dict)
 async def update_password(account_id: int, new_password: str):
     """Update account password."""
-    rows_affected = account_crud.update_password(account_id, new_password)
+    rows_affected = account_crud.update_password(account_id, new_password, await hash_password_async(new_password))
     if rows_affected == 0:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Account not found")
     return {"message": "Password updated successfully"}
@@ -105,6 +109,15 @@ async def get_customer(customer_id: int):
     return customer
 
 
+@router.get("/customers/{customer_id}/profile", response_model=CustomerProfile)
+async def get_customer_profile(customer_id: int):
+    """Get the customer's account page: profile, addresses, payment methods, active orders and summary."""
+    profile = customer_crud.get_customer_profile(customer_id)
+    if not profile:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Customer not found")
+    return profile
+
+
 @router.get("/customers/email/{email}", response_model=Customer)
 async def get_customer_by_email(email: str):
     """Get customer by email."""
@@ -179,6 +192,24 @@ async def get_open_restaurants():
     return restaurant_crud.get_open_restaurants()
 
 
+@router.get("/restaurants/nearest/", response_model=List[dict])
+async def get_nearest_restaurants(latitude: float = Query(..., ge=-90, le=90),
+                                  longitude: float = Query(..., ge=-180, le=180),
+                                  k: int = Query(10, ge=1, le=100),
+                                  open_only: bool = True):
+    """Get the k restaurants nearest to a point (served from the in-memory index)."""
+    return restaurant_index.nearest(latitude, longitude, k, open_only)
+
+
+@router.get("/restaurants/nearby/", response_model=List[dict])
+async def get_nearby_restaurants(latitude: float = Query(..., ge=-90, le=90),
+                                 longitude: float = Query(..., ge=-180, le=180),
+                                 radius_km: float = Query(5.0, gt=0, le=200),
+                                 open_only: bool = True):
+    """Get restaurants within a radius of a point (served from the in-memory index)."""
+    return restaurant_index.within_radius(latitude, longitude, radius_km, open_only)
+
+
 @router.put("/restaurants/{restaurant_id}", response_model=dict)
 async def update_restaurant(restaurant_id: int, restaurant_data: RestaurantUpdate):
     """Update restaurant information."""
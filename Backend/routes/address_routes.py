@@ -1,8 +1,9 @@
-from fastapi import APIRouter, HTTPException, status, Depends
+from fastapi import APIRouter, HTTPException, Query, status, Depends
 from typing import List, Optional
 from crud.address_crud import AddressCRUD
+from delivery_quotes import delivery_quotes
 from models import (
-    Address, AddressCreate, AddressUpdate,
+    Address, AddressCreate, AddressUpdate, DeliveryQuote,
     PaginationParams
 )
 
@@ -37,6 +38,21 @@ async def get_address(address_id: int):
     return address
 
 
+@router.get("/addresses/{address_id}/delivery-quotes", response_model=List[DeliveryQuote])
+async def get_delivery_quotes(address_id: int, restaurant_ids: Optional[List[int]] = Query(None)):
+    """Distance, delivery fee and ETA from restaurants to an address, nearest first.
+    
+    Without restaurant_ids, quotes every open restaurant within delivery range.
+    """
+    try:
+        return delivery_quotes.quotes_for_address(address_id, restaurant_ids)
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Failed to quote delivery: {str(e)}"
+        )
+
+
 @router.get("/customers/{customer_id}/addresses", response_model=List[Address])
 async def get_customer_addresses(customer_id: int):
     """Get all addresses for a customer."""
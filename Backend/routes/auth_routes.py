@@ -1,16 +1,18 @@
-from fastapi import APIRouter, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Request, status
 from pydantic import BaseModel, EmailStr
 from typing import Optional
-from models import RoleEnum
-from crud.account_crud import AccountCRUD, CustomerCRUD, RestaurantCRUD
-import hashlib
+from models import (
+    RoleEnum, CustomerCreate, RestaurantCreate, AddressCreate, OperatingStatusEnum
+)
+from crud.account_crud import AccountCRUD
+from login_throttle import login_throttle
+from passwords import hash_password_async, needs_rehash, verify_password_async
+from session_tokens import SessionClaims, get_current_session, issue_token, revoked_sessions
 
 router = APIRouter()
 
 # Initialize CRUD instances
 account_crud = AccountCRUD()
-customer_crud = CustomerCRUD()
-restaurant_crud = RestaurantCRUD()
 
 
 class LoginRequest(BaseModel):
@@ -36,6 +38,9 @@ class LoginResponse(BaseModel):
     email: str
     role: str
     message: str
+    access_token: str
+    token_type: str = "bearer"
+    expires_at: int
 
 
 class RegisterResponse(BaseModel):
@@ -45,19 +50,22 @@ class RegisterResponse(BaseModel):
     message: str
 
 
-def _hash_password(password: str) -> str:
-    """Hash password using SHA-256."""
-    return hashlib.sha256(password.encode()).hexdigest()
-
-
 @router.post("/login", response_model=LoginResponse)
-async def login(credentials: LoginRequest):
+async def login(credentials: LoginRequest, request: Request):
     """Authenticate user and return account information."""
     try:
+        client_ip = request.client.host if request.client else None
+        if login_throttle.is_blocked(credentials.email, client_ip):
+            raise HTTPException(
+                status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+                detail="Too many failed login attempts, try again later"
+            )
+        
         # Get account by email
         account = account_crud.get_account_by_email(credentials.email)
         
         if not account:
+            login_throttle.record_failure(credentials.email, client_ip)
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
                 detail="Invalid email or password"
@@ -71,23 +79,29 @@ async def login(credentials: LoginRequest):
             )
         
         # Verify password
-        password_hash = _hash_password(credentials.password)
-        if password_hash != account.password_hash:
+        if not await verify_password_async(credentials.password, account.password_hash):
             # Record failed login attempt
-            account_crud.record_failed_login(account.account_id)
+            login_throttle.record_failure(credentials.email, client_ip, account.account_id)
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
                 detail="Invalid email or password"
             )
         
         # Reset failed login attempts on successful login
-        account_crud.reset_failed_logins(account.account_id)
+        login_throttle.record_success(credentials.email, account.account_id, account.failed_login_attempts)
+        
+        # Upgrade legacy SHA-256 or outdated-cost hashes while we have the plaintext
+        if needs_rehash(account.password_hash):
+            account_crud.set_password_hash(account.account_id, await hash_password_async(credentials.password))
         
+        token, claims = issue_token(account.account_id, account.role.value)
         return LoginResponse(
             account_id=account.account_id,
             email=account.email,
             role=account.role,
-            message="Login successful"
+            message="Login successful",
+            access_token=token,
+            expires_at=claims.expires_at
         )
     
     except HTTPException:
@@ -99,6 +113,19 @@ async def login(credentials: LoginRequest):
         )
 
 
+@router.get("/me", response_model=SessionClaims)
+async def get_me(session: SessionClaims = Depends(get_current_session)):
+    """Return the caller's session claims (no database lookup)."""
+    return session
+
+
+@router.post("/logout", response_model=dict)
+async def logout(session: SessionClaims = Depends(get_current_session)):
+    """Revoke the caller's session token."""
+    revoked_sessions.revoke_session(session)
+    return {"message": "Logout successful"}
+
+
 @router.post("/register", response_model=RegisterResponse, status_code=status.HTTP_201_CREATED)
 async def register(user_data: RegisterRequest):
     """Register a new user (customer or restaurant)."""
@@ -113,36 +140,25 @@ async def register(user_data: RegisterRequest):
         
         role_enum = RoleEnum(role_str)
         
-        # Check if email already exists
-        existing_account = account_crud.get_account_by_email(user_data.email)
-        if existing_account:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="Email already registered"
-            )
-        
-        # Create account
-        from models import AccountCreate
-        account_data = AccountCreate(
-            email=user_data.email,
-            password=user_data.password,
-            role=role_enum
-        )
-        account_id = account_crud.create_account(account_data)
-        
-        # Create customer or restaurant profile
+        address_data = None
         if role_enum == RoleEnum.CUSTOMER:
-            from models import CustomerCreate
-            customer_data = CustomerCreate(
+            profile = CustomerCreate(
                 customer_name=user_data.name,
                 phone=user_data.phone
             )
-            customer_crud.create_customer(account_id, customer_data)
-        
-        elif role_enum == RoleEnum.RESTAURANT:
-            from models import RestaurantCreate, OperatingStatusEnum
+            if user_data.streetAddress:
+                # Saved as the customer's default address; customer_id is set on insert
+                address_data = AddressCreate(
+                    customer_id=0,
+                    street_address=user_data.streetAddress,
+                    city=user_data.city or "",
+                    state=user_data.state or "",
+                    postal_code=user_data.postalCode or "",
+                    is_default=True
+                )
+        else:
             # For restaurant registration with address info
-            restaurant_data = RestaurantCreate(
+            profile = RestaurantCreate(
                 restaurant_name=user_data.name,
                 contact_phone=user_data.phone,
                 contact_email=user_data.email,
@@ -155,7 +171,11 @@ async def register(user_data: RegisterRequest):
                 latitude=None,
                 longitude=None
             )
-            restaurant_crud.create_restaurant(account_id, restaurant_data)
+        
+        password_hash = await hash_password_async(user_data.password)
+        account_id = account_crud.register_account(
+            user_data.email, password_hash, role_enum, profile, address_data
+        )
         
         return RegisterResponse(
             account_id=account_id,
@@ -166,6 +186,11 @@ async def register(user_data: RegisterRequest):
     
     except HTTPException:
         raise
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
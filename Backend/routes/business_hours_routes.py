@@ -1,9 +1,10 @@
 from fastapi import APIRouter, HTTPException, status
 from typing import List, Optional
-from datetime import time
+from datetime import date, time
 from crud.business_hours_crud import BusinessHoursCRUD
 from models import (
     BusinessHours, BusinessHoursCreate, BusinessHoursUpdate,
+    BusinessHoursException, BusinessHoursExceptionCreate, BulkBusinessHoursUpsert,
     DayOfWeekEnum, PaginationParams
 )
 
@@ -49,6 +50,23 @@ async def create_standard_hours(
         )
 
 
+@router.put("/business-hours/bulk", response_model=dict)
+async def bulk_upsert_business_hours(bulk_data: BulkBusinessHoursUpsert):
+    """Apply one weekly hours template to many restaurants at once."""
+    try:
+        rows_written = business_hours_crud.bulk_upsert_business_hours(bulk_data.restaurant_ids, bulk_data.hours)
+        return {
+            "message": "Business hours saved successfully",
+            "restaurants": len(set(bulk_data.restaurant_ids)),
+            "rows_written": rows_written
+        }
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Failed to save business hours: {str(e)}"
+        )
+
+
 @router.get("/business-hours/{business_hours_id}", response_model=BusinessHours)
 async def get_business_hours(business_hours_id: int):
     """Get business hours by ID."""
@@ -175,8 +193,8 @@ async def toggle_closed_status(business_hours_id: int):
 async def close_restaurant_today(restaurant_id: int):
     """Mark restaurant as closed for today."""
     try:
-        rows_affected = business_hours_crud.close_restaurant_today(restaurant_id)
-        if rows_affected == 0:
+        exception_id = business_hours_crud.close_restaurant_today(restaurant_id)
+        if exception_id == 0:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="Restaurant business hours not found for today"
@@ -195,8 +213,8 @@ async def close_restaurant_today(restaurant_id: int):
 async def open_restaurant_today(restaurant_id: int):
     """Mark restaurant as open for today."""
     try:
-        rows_affected = business_hours_crud.open_restaurant_today(restaurant_id)
-        if rows_affected == 0:
+        exception_id = business_hours_crud.open_restaurant_today(restaurant_id)
+        if exception_id == 0:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="Restaurant business hours not found for today"
@@ -211,6 +229,38 @@ async def open_restaurant_today(restaurant_id: int):
         )
 
 
+@router.post("/restaurants/{restaurant_id}/business-hours/exceptions", response_model=dict, status_code=status.HTTP_201_CREATED)
+async def create_business_hours_exception(restaurant_id: int, exception_data: BusinessHoursExceptionCreate):
+    """Set special hours or a closure for one date (replaces any existing exception for that date)."""
+    try:
+        exception_data.restaurant_id = restaurant_id
+        exception_id = business_hours_crud.create_exception(exception_data)
+        return {"message": "Business hours exception saved successfully", "business_hours_exception_id": exception_id}
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Failed to save business hours exception: {str(e)}"
+        )
+
+
+@router.get("/restaurants/{restaurant_id}/business-hours/exceptions", response_model=List[BusinessHoursException])
+async def get_business_hours_exceptions(restaurant_id: int, from_date: Optional[date] = None):
+    """Get upcoming business hours exceptions for a restaurant."""
+    return business_hours_crud.get_exceptions_by_restaurant(restaurant_id, from_date)
+
+
+@router.delete("/business-hours/exceptions/{exception_id}", response_model=dict)
+async def delete_business_hours_exception(exception_id: int):
+    """Delete a business hours exception."""
+    rows_affected = business_hours_crud.delete_exception(exception_id)
+    if rows_affected == 0:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Business hours exception not found"
+        )
+    return {"message": "Business hours exception deleted successfully"}
+
+
 @router.get("/restaurants/{restaurant_id}/next-opening", response_model=dict)
 async def get_next_opening_time(restaurant_id: int):
     """Get the next time the restaurant will be open."""
@@ -0,0 +1,77 @@
+from fastapi import APIRouter, HTTPException, status
+from typing import List
+from crud.delivery_zone_crud import DeliveryZoneCRUD
+from delivery_zones import delivery_zone_index
+from models import DeliveryZone, DeliveryZoneCreate, DeliveryZoneUpdate
+
+router = APIRouter()
+delivery_zone_crud = DeliveryZoneCRUD()
+
+
+@router.post("/restaurants/{restaurant_id}/delivery-zones", response_model=dict, status_code=status.HTTP_201_CREATED)
+async def create_delivery_zone(restaurant_id: int, zone_data: DeliveryZoneCreate):
+    """Create a delivery zone polygon for a restaurant."""
+    try:
+        zone_data.restaurant_id = restaurant_id
+        delivery_zone_id = delivery_zone_crud.create_delivery_zone(zone_data)
+        return {"message": "Delivery zone created successfully", "delivery_zone_id": delivery_zone_id}
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Failed to create delivery zone: {str(e)}"
+        )
+
+
+@router.get("/restaurants/{restaurant_id}/delivery-zones", response_model=List[DeliveryZone])
+async def get_restaurant_delivery_zones(restaurant_id: int):
+    """Get all delivery zones for a restaurant."""
+    return delivery_zone_crud.get_delivery_zones_by_restaurant(restaurant_id)
+
+
+@router.get("/delivery-zones/{delivery_zone_id}", response_model=DeliveryZone)
+async def get_delivery_zone(delivery_zone_id: int):
+    """Get delivery zone by ID."""
+    zone = delivery_zone_crud.get_delivery_zone_by_id(delivery_zone_id)
+    if not zone:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Delivery zone not found")
+    return zone
+
+
+@router.put("/delivery-zones/{delivery_zone_id}", response_model=dict)
+async def update_delivery_zone(delivery_zone_id: int, zone_data: DeliveryZoneUpdate):
+    """Update a delivery zone."""
+    try:
+        rows_affected = delivery_zone_crud.update_delivery_zone(delivery_zone_id, zone_data)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    if rows_affected == 0:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Delivery zone not found or no changes made")
+    return {"message": "Delivery zone updated successfully"}
+
+
+@router.delete("/delivery-zones/{delivery_zone_id}", response_model=dict)
+async def delete_delivery_zone(delivery_zone_id: int):
+    """Delete a delivery zone."""
+    rows_affected = delivery_zone_crud.delete_delivery_zone(delivery_zone_id)
+    if rows_affected == 0:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Delivery zone not found")
+    return {"message": "Delivery zone deleted successfully"}
+
+
+@router.get("/restaurants/{restaurant_id}/delivers-to/{address_id}", response_model=dict)
+async def check_delivery_to_address(restaurant_id: int, address_id: int):
+    """Check whether a restaurant delivers to a saved address."""
+    return {
+        "restaurant_id": restaurant_id,
+        "address_id": address_id,
+        "can_deliver": delivery_zone_index.can_deliver_to_address(restaurant_id, address_id)
+    }
+
+
+@router.get("/addresses/{address_id}/delivering-restaurants", response_model=dict)
+async def get_restaurants_delivering_to_address(address_id: int):
+    """Get zoned restaurants whose delivery zones contain a saved address."""
+    return {
+        "address_id": address_id,
+        "restaurant_ids": delivery_zone_index.restaurants_delivering_to(address_id)
+    }
@@ -1,16 +1,22 @@
-from fastapi import APIRouter, HTTPException, status
+from fastapi import APIRouter, HTTPException, Query, Request, status
+from fastapi.responses import StreamingResponse
 from typing import List
+import csv
+import io
 from models import (
     Menu, MenuCreate, MenuUpdate,
-    MenuItem, MenuItemCreate, MenuItemUpdate
+    MenuItem, MenuItemCreate, MenuItemUpdate, BulkPriceUpdate,
+    MenuImportRequest, MenuImportResult
 )
 from crud.menu_crud import MenuCRUD, MenuItemCRUD
+from crud.menu_import_crud import MenuImportCRUD, MENU_CSV_COLUMNS, menu_to_csv_rows, parse_menu_csv
 
 router = APIRouter()
 
 # Initialize CRUD instances
 menu_crud = MenuCRUD()
 menu_item_crud = MenuItemCRUD()
+menu_import_crud = MenuImportCRUD()
 
 
 # Menu routes
@@ -139,6 +145,18 @@ async def update_menu_item_price(menu_item_id: int, new_price: float):
     return {"message": "Menu item price updated successfully"}
 
 
+@router.put("/restaurants/{restaurant_id}/menu-items/prices", response_model=dict)
+async def bulk_update_menu_item_prices(restaurant_id: int, price_data: BulkPriceUpdate):
+    """Reprice many menu items with explicit prices or a percent/amount rule."""
+    try:
+        items_updated = menu_item_crud.bulk_update_prices(restaurant_id, price_data)
+        return {"items_updated": items_updated, "message": "Menu item prices updated successfully"}
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=f"Failed to update prices: {str(e)}")
+
+
 @router.put("/menu-items/{menu_item_id}/toggle-availability", response_model=dict)
 async def toggle_menu_item_availability(menu_item_id: int):
     """Toggle menu item availability."""
@@ -155,3 +173,60 @@ async def delete_menu_item(menu_item_id: int):
     if rows_affected == 0:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Menu item not found")
     return {"message": "Menu item deleted successfully"}
+
+
+# Bulk menu import/export routes
+def _export_menu_json(restaurant_id: int):
+    yield '{"menus": ['
+    for index, menu in enumerate(menu_import_crud.iter_menu_tree(restaurant_id)):
+        yield ("," if index else "") + menu.model_dump_json()
+    yield ']}'
+
+
+def _export_menu_csv(restaurant_id: int):
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(MENU_CSV_COLUMNS)
+    for menu in menu_import_crud.iter_menu_tree(restaurant_id):
+        for row in menu_to_csv_rows(menu):
+            writer.writerow(row)
+        yield buffer.getvalue()
+        buffer.seek(0)
+        buffer.truncate(0)
+    if buffer.tell():
+        yield buffer.getvalue()
+
+
+@router.get("/restaurants/{restaurant_id}/menu/export/")
+async def export_restaurant_menu(restaurant_id: int, format: str = Query("json", pattern="^(json|csv)$")):
+    """Stream a restaurant's full menu tree as JSON or CSV."""
+    if format == "csv":
+        return StreamingResponse(
+            _export_menu_csv(restaurant_id), media_type="text/csv",
+            headers={"Content-Disposition": f"attachment; filename=menu_{restaurant_id}.csv"}
+        )
+    return StreamingResponse(_export_menu_json(restaurant_id), media_type="application/json")
+
+
+@router.post("/restaurants/{restaurant_id}/menu/import/", response_model=MenuImportResult, status_code=status.HTTP_201_CREATED)
+async def import_restaurant_menu(restaurant_id: int, import_data: MenuImportRequest):
+    """Import menus, items, modifiers and options from a JSON menu tree."""
+    try:
+        return menu_import_crud.import_menu_tree(restaurant_id, import_data.menus)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=f"Failed to import menu: {str(e)}")
+
+
+@router.post("/restaurants/{restaurant_id}/menu/import/csv/", response_model=MenuImportResult, status_code=status.HTTP_201_CREATED)
+async def import_restaurant_menu_csv(restaurant_id: int, request: Request):
+    """Import a menu tree from a CSV body in the export layout."""
+    try:
+        body = (await request.body()).decode("utf-8-sig")
+        menus = parse_menu_csv(io.StringIO(body, newline=""))
+        return menu_import_crud.import_menu_tree(restaurant_id, menus)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=f"Failed to import menu: {str(e)}")
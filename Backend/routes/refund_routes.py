@@ -2,6 +2,7 @@ from fastapi import APIRouter, HTTPException, status
 from typing import List, Optional
 from datetime import datetime
 from crud.refund_crud import RefundCRUD
+from cache import report_cache
 from models import (
     Refund, RefundCreate, RefundUpdate,
     RefundStatusEnum, PaginationParams
@@ -26,6 +27,35 @@ async def create_refund(order_id: int, refund_data: RefundCreate, requested_by:
         )
 
 
+@router.get("/refunds/statistics", response_model=dict)
+async def get_refund_statistics(start_date: Optional[datetime] = None, end_date: Optional[datetime] = None):
+    """Get refund statistics for a date range (cached; up to REPORT_CACHE_TTL_SECONDS old)."""
+    try:
+        return await report_cache.get(
+            ("refund_statistics", start_date, end_date),
+            lambda: refund_crud.get_refund_statistics(start_date, end_date)
+        )
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Failed to retrieve refund statistics: {str(e)}"
+        )
+
+
+@router.get("/refunds/pending", response_model=List[Refund])
+async def get_pending_refunds(limit: int = 20, offset: int = 0):
+    """Get all pending refunds."""
+    try:
+        pagination = PaginationParams(limit=limit, offset=offset)
+        refunds = refund_crud.get_pending_refunds(pagination)
+        return refunds
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Failed to retrieve pending refunds: {str(e)}"
+        )
+
+
 @router.get("/refunds/{refund_id}", response_model=Refund)
 async def get_refund(refund_id: int):
     """Get refund by ID."""
@@ -65,20 +95,6 @@ async def get_refunds_by_status(status: RefundStatusEnum, limit: int = 20, offse
         )
 
 
-@router.get("/refunds/pending", response_model=List[Refund])
-async def get_pending_refunds(limit: int = 20, offset: int = 0):
-    """Get all pending refunds."""
-    try:
-        pagination = PaginationParams(limit=limit, offset=offset)
-        refunds = refund_crud.get_pending_refunds(pagination)
-        return refunds
-    except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail=f"Failed to retrieve pending refunds: {str(e)}"
-        )
-
-
 @router.get("/customers/{customer_id}/refunds", response_model=List[dict])
 async def get_customer_refunds(customer_id: int, limit: int = 20, offset: int = 0):
     """Get refunds for a customer with order details."""
@@ -200,19 +216,6 @@ async def link_transaction_to_refund(refund_id: int, transaction_id: int):
         )
 
 
-@router.get("/refunds/statistics", response_model=dict)
-async def get_refund_statistics(start_date: Optional[datetime] = None, end_date: Optional[datetime] = None):
-    """Get refund statistics for a date range."""
-    try:
-        statistics = refund_crud.get_refund_statistics(start_date, end_date)
-        return statistics
-    except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail=f"Failed to retrieve refund statistics: {str(e)}"
-        )
-
-
 @router.delete("/refunds/{refund_id}", response_model=dict)
 async def delete_refund(refund_id: int):
     """Delete a refund (only allowed for PENDING status)."""
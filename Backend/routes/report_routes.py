@@ -0,0 +1,53 @@
+from fastapi import APIRouter, Depends, HTTPException, status
+from typing import List, Optional
+import asyncio
+from analytics import REPORTS, analytics_engine
+from models import AnalyticsQuery, AnalyticsReportInfo, AnalyticsResult
+from session_tokens import require_admin
+
+# Reports read the Parquet snapshots through DuckDB, never the primary MySQL
+router = APIRouter(dependencies=[Depends(require_admin)])
+
+
+@router.get("/reports", response_model=List[AnalyticsReportInfo])
+async def list_reports():
+    """List the predefined analytics reports and their parameters."""
+    return [
+        AnalyticsReportInfo(name=name, description=report["description"], parameters=report["parameters"])
+        for name, report in REPORTS.items()
+    ]
+
+
+@router.get("/reports/{report_name}", response_model=AnalyticsResult)
+async def run_report(report_name: str, days: Optional[int] = None, limit: Optional[int] = None):
+    """Run a predefined report against the latest analytics snapshot."""
+    if report_name not in REPORTS:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Report not found")
+
+    parameters = {key: value for key, value in (("days", days), ("limit", limit)) if value is not None}
+    try:
+        return await asyncio.to_thread(analytics_engine.run_report, report_name, parameters)
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Failed to run report: {str(e)}"
+        )
+
+
+@router.post("/reports/query", response_model=AnalyticsResult)
+async def run_query(query: AnalyticsQuery):
+    """Run an ad-hoc read-only SELECT over the snapshot tables.
+
+    Tables: orders, order_items, refunds, restaurants, customers.
+    """
+    try:
+        return await asyncio.to_thread(analytics_engine.query, query.sql, None, query.max_rows)
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Failed to run query: {str(e)}"
+        )
@@ -1,25 +1,41 @@
 from fastapi import APIRouter, HTTPException, status
-from typing import List
+from datetime import date, datetime, timedelta
+from decimal import Decimal
+from typing import List, Optional
+import asyncio
 from models import (
     PopularMenuItem,
     CustomerOrderSummary,
-    RestaurantRevenueSummary
+    RestaurantRevenueSummary,
+    RestaurantDailyStats,
+    TimeSeries,
+    TimeSeriesPoint,
+    FulfillmentLatencyReport
 )
 from crud.utility_crud import UtilityCRUD
+from crud.stats_crud import RestaurantStatsCRUD
+from item_sales import WINDOWS
+from timeseries import order_metrics
+from latency_sketches import fulfillment_latency
+from cache import account_cache, latency_cache, menu_cache, profile_cache, report_cache
 
 router = APIRouter()
 
 # Initialize CRUD instance
 utility_crud = UtilityCRUD()
+stats_crud = RestaurantStatsCRUD()
 
 
 @router.get("/restaurants/{restaurant_id}/popular-items/", response_model=List[PopularMenuItem])
-async def get_popular_menu_items(restaurant_id: int, limit: int = 10):
-    """Get popular menu items for a restaurant (most ordered)."""
+async def get_popular_menu_items(restaurant_id: int, limit: int = 10, window: str = "all"):
+    """Get popular menu items for a restaurant (most ordered), all time or over the last 7 or 30 days."""
     if limit <= 0 or limit > 50:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Limit must be between 1 and 50")
+    if window not in WINDOWS:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST,
+                            detail=f"Window must be one of: {', '.join(WINDOWS)}")
     
-    return utility_crud.get_popular_menu_items(restaurant_id, limit)
+    return utility_crud.get_popular_menu_items(restaurant_id, limit, window)
 
 
 @router.get("/customers/{customer_id}/summary/", response_model=CustomerOrderSummary)
@@ -40,13 +56,83 @@ async def get_restaurant_revenue_summary(restaurant_id: int):
     return summary
 
 
+@router.get("/restaurants/{restaurant_id}/daily-stats/", response_model=List[RestaurantDailyStats])
+async def get_restaurant_daily_stats(restaurant_id: int, start_date: Optional[date] = None,
+                                     end_date: Optional[date] = None):
+    """Get per-day delivered revenue and refunds for a restaurant (last 30 days by default)."""
+    end_date = end_date or date.today()
+    start_date = start_date or end_date - timedelta(days=29)
+    if start_date > end_date:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="start_date must not be after end_date")
+    
+    return stats_crud.get_daily_stats(restaurant_id, start_date, end_date)
+
+
 @router.get("/customers/summaries/", response_model=List[CustomerOrderSummary])
-async def get_all_customer_summaries():
-    """Get order summaries for all customers."""
-    return utility_crud.get_all_customer_summaries()
+async def get_all_customer_summaries(limit: int = 20, after_spent: Optional[Decimal] = None,
+                                     after_customer_id: Optional[int] = None):
+    """Get customers ranked by total spent, one page at a time.
+    
+    For the next page pass the last row's total_spent and customer_id as
+    after_spent and after_customer_id. Pages are cached for up to
+    REPORT_CACHE_TTL_SECONDS.
+    """
+    if limit <= 0 or limit > 100:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Limit must be between 1 and 100")
+    if (after_spent is None) != (after_customer_id is None):
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST,
+                            detail="after_spent and after_customer_id must be given together")
+    
+    return await report_cache.get(
+        ("customer_summaries", limit, after_spent, after_customer_id),
+        lambda: utility_crud.get_all_customer_summaries(limit, after_spent, after_customer_id)
+    )
 
 
 @router.get("/restaurants/revenue-summaries/", response_model=List[RestaurantRevenueSummary])
 async def get_all_restaurant_summaries():
-    """Get revenue summaries for all restaurants."""
-    return utility_crud.get_all_restaurant_summaries()
+    """Get revenue summaries for all restaurants (cached; up to REPORT_CACHE_TTL_SECONDS old)."""
+    return await report_cache.get(("restaurant_summaries",), utility_crud.get_all_restaurant_summaries)
+
+
+@router.get("/metrics/timeseries/{metric}", response_model=TimeSeries)
+async def get_order_timeseries(metric: str, interval: str = "1h", start: Optional[datetime] = None,
+                               end: Optional[datetime] = None, restaurant_id: Optional[int] = None):
+    """Orders, revenue or cancellations per 5m/1h/1d bucket, for one restaurant or platform-wide."""
+    try:
+        points = await asyncio.to_thread(order_metrics.series, metric, interval, start, end, restaurant_id)
+        return TimeSeries(
+            metric=metric,
+            interval=interval,
+            restaurant_id=restaurant_id,
+            points=[TimeSeriesPoint(bucket_start=bucket_start, value=value) for bucket_start, value in points]
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+
+@router.get("/restaurants/{restaurant_id}/fulfillment-latency/", response_model=FulfillmentLatencyReport)
+async def get_restaurant_fulfillment_latency(restaurant_id: int):
+    """Get p50/p90/p99 minutes per fulfillment stage for a restaurant."""
+    return FulfillmentLatencyReport(
+        restaurant_id=restaurant_id,
+        stages=fulfillment_latency.percentiles(restaurant_id)
+    )
+
+
+@router.get("/metrics/fulfillment-latency/", response_model=FulfillmentLatencyReport)
+async def get_platform_fulfillment_latency():
+    """Get p50/p90/p99 minutes per fulfillment stage across all restaurants."""
+    return FulfillmentLatencyReport(stages=fulfillment_latency.percentiles())
+
+
+@router.get("/cache/stats", response_model=dict)
+async def get_cache_stats():
+    """Hit/miss counters and sizes for the in-process lookup caches."""
+    return {
+        "accounts": account_cache.stats(),
+        "menus": menu_cache.stats(),
+        "customer_profiles": profile_cache.stats(),
+        "fulfillment_latency": latency_cache.stats(),
+        "reports": report_cache.stats()
+    }
@@ -0,0 +1,271 @@
+from bisect import bisect_right
+from datetime import date, datetime, time, timedelta
+from threading import Lock
+from typing import Dict, List, Optional, Tuple
+import logging
+from database import get_db_manager
+
+logger = logging.getLogger(__name__)
+
+MINUTES_PER_DAY = 1440
+DAYS_OF_WEEK = ["MONDAY", "TUESDAY", "WEDNESDAY", "THURSDAY", "FRIDAY", "SATURDAY", "SUNDAY"]
+NEXT_OPENING_SEARCH_DAYS = 14
+
+
+def _minutes(value: time) -> int:
+    return value.hour * 60 + value.minute
+
+
+def _time_of_day(minute: int) -> time:
+    minute %= MINUTES_PER_DAY
+    return time(minute // 60, minute % 60)
+
+
+def window_minutes(open_time: time, close_time: time) -> Tuple[int, int]:
+    """[start, end) minutes from midnight for one opening window.
+
+    A close_time earlier than open_time runs past midnight (end > 1440);
+    equal times mean open all day.
+    """
+    start = _minutes(open_time)
+    length = (_minutes(close_time) - start) % MINUTES_PER_DAY or MINUTES_PER_DAY
+    return start, start + length
+
+
+def merge_intervals(intervals: List[Tuple[int, int]]) -> List[Tuple[int, int]]:
+    """Sort and merge overlapping or touching [start, end) intervals."""
+    merged: List[Tuple[int, int]] = []
+    for start, end in sorted(intervals):
+        if merged and start <= merged[-1][1]:
+            merged[-1] = (merged[-1][0], max(merged[-1][1], end))
+        else:
+            merged.append((start, end))
+    return merged
+
+
+class _CompiledDay:
+    """One restaurant's opening intervals for one calendar date."""
+
+    __slots__ = ("windows", "starts", "ends")
+
+    def __init__(self, windows: List[Tuple[int, int]], spill: List[Tuple[int, int]]):
+        # Windows opening on this date (may run past midnight)
+        self.windows = windows
+        intervals = merge_intervals([(start, min(end, MINUTES_PER_DAY)) for start, end in windows] + spill)
+        self.starts = [start for start, _ in intervals]
+        self.ends = [end for _, end in intervals]
+
+    def is_open_at(self, minute: int) -> bool:
+        position = bisect_right(self.starts, minute) - 1
+        return position >= 0 and minute < self.ends[position]
+
+
+class _RestaurantSchedule:
+    __slots__ = ("restaurant_name", "operating_status", "hours", "exceptions")
+
+    def __init__(self, restaurant_name: str, operating_status: str,
+                 hours_rows: List[dict], exception_rows: List[dict]):
+        self.restaurant_name = restaurant_name
+        self.operating_status = operating_status
+        self.hours = {row["day_of_week"]: row for row in hours_rows}
+        self.exceptions = {row["exception_date"]: row for row in exception_rows}
+
+    def windows_for(self, day: date) -> List[Tuple[int, int]]:
+        """Opening windows that start on a date: the exception if any, else the weekly template."""
+        row = self.exceptions.get(day) or self.hours.get(DAYS_OF_WEEK[day.weekday()])
+        if row is None or row["is_closed"] or row["open_time"] is None or row["close_time"] is None:
+            return []
+        return [window_minutes(row["open_time"], row["close_time"])]
+
+
+class ScheduleIndex:
+    """Opening hours for every restaurant, compiled per calendar date (BR-012).
+
+    The weekly BusinessHours template and date-specific BusinessHoursException
+    rows are merged into sorted intervals once per restaurant per date and
+    cached, so open-now and next-opening checks need no SQL. Loaded at startup
+    and refreshed per restaurant by BusinessHoursCRUD and RestaurantCRUD writes.
+    """
+
+    def __init__(self):
+        self.db = get_db_manager()
+        self._schedules: Dict[int, _RestaurantSchedule] = {}
+        self._days: Dict[Tuple[int, date], _CompiledDay] = {}
+        self._days_for: Optional[date] = None
+        self._open_now: Optional[Tuple[datetime, List[dict]]] = None
+        self._loaded = False
+        self._lock = Lock()
+
+    def load(self) -> None:
+        """(Re)build the schedule for every restaurant."""
+        restaurants = self.db.execute_query(
+            "SELECT restaurant_id, restaurant_name, operating_status FROM Restaurant"
+        ) or []
+        hours = self.db.execute_query("SELECT * FROM BusinessHours") or []
+        exceptions = self.db.execute_query(
+            "SELECT * FROM BusinessHoursException WHERE exception_date >= %s",
+            (date.today() - timedelta(days=1),)
+        ) or []
+
+        hours_by_restaurant: Dict[int, List[dict]] = {}
+        for row in hours:
+            hours_by_restaurant.setdefault(row["restaurant_id"], []).append(row)
+        exceptions_by_restaurant: Dict[int, List[dict]] = {}
+        for row in exceptions:
+            exceptions_by_restaurant.setdefault(row["restaurant_id"], []).append(row)
+
+        schedules = {
+            row["restaurant_id"]: _RestaurantSchedule(
+                row["restaurant_name"], row["operating_status"],
+                hours_by_restaurant.get(row["restaurant_id"], []),
+                exceptions_by_restaurant.get(row["restaurant_id"], [])
+            )
+            for row in restaurants
+        }
+        with self._lock:
+            self._schedules = schedules
+            self._days = {}
+            self._open_now = None
+            self._loaded = True
+        logger.info(f"Schedule index loaded for {len(schedules)} restaurants")
+
+    def refresh_restaurant(self, restaurant_id: int) -> None:
+        """Re-read one restaurant's status, weekly hours and exceptions."""
+        self.refresh_restaurants([restaurant_id])
+
+    def refresh_restaurants(self, restaurant_ids: List[int]) -> None:
+        """Re-read several restaurants with one query per table and swap them in together."""
+        if not self._loaded or not restaurant_ids:
+            return
+        restaurant_ids = sorted(set(restaurant_ids))
+        placeholders = ", ".join(["%s"] * len(restaurant_ids))
+        restaurants = self.db.execute_query(
+            f"SELECT restaurant_id, restaurant_name, operating_status FROM Restaurant WHERE restaurant_id IN ({placeholders})",
+            tuple(restaurant_ids)
+        ) or []
+        hours = self.db.execute_query(
+            f"SELECT * FROM BusinessHours WHERE restaurant_id IN ({placeholders})", tuple(restaurant_ids)
+        ) or []
+        exceptions = self.db.execute_query(
+            f"SELECT * FROM BusinessHoursException WHERE restaurant_id IN ({placeholders}) AND exception_date >= %s",
+            (*restaurant_ids, date.today() - timedelta(days=1))
+        ) or []
+
+        hours_by_restaurant: Dict[int, List[dict]] = {}
+        for row in hours:
+            hours_by_restaurant.setdefault(row["restaurant_id"], []).append(row)
+        exceptions_by_restaurant: Dict[int, List[dict]] = {}
+        for row in exceptions:
+            exceptions_by_restaurant.setdefault(row["restaurant_id"], []).append(row)
+        found = {row["restaurant_id"]: row for row in restaurants}
+
+        refreshed = set(restaurant_ids)
+        with self._lock:
+            schedules = dict(self._schedules)
+            for restaurant_id in restaurant_ids:
+                restaurant = found.get(restaurant_id)
+                if restaurant:
+                    schedules[restaurant_id] = _RestaurantSchedule(
+                        restaurant["restaurant_name"], restaurant["operating_status"],
+                        hours_by_restaurant.get(restaurant_id, []),
+                        exceptions_by_restaurant.get(restaurant_id, [])
+                    )
+                else:
+                    schedules.pop(restaurant_id, None)
+            self._schedules = schedules
+            self._days = {key: day for key, day in self._days.items() if key[0] not in refreshed}
+            self._open_now = None
+
+    def _get_schedules(self) -> Dict[int, _RestaurantSchedule]:
+        if not self._loaded:
+            self.load()
+        return self._schedules
+
+    def _compiled_day(self, restaurant_id: int, schedule: _RestaurantSchedule, day: date) -> _CompiledDay:
+        today = date.today()
+        if self._days_for != today:
+            # Drop compiled days that can no longer be asked for
+            self._days = {key: value for key, value in self._days.items() if key[1] >= today - timedelta(days=1)}
+            self._days_for = today
+
+        key = (restaurant_id, day)
+        compiled = self._days.get(key)
+        if compiled is None:
+            previous = schedule.windows_for(day - timedelta(days=1))
+            spill = [(0, end - MINUTES_PER_DAY) for _, end in previous if end > MINUTES_PER_DAY]
+            compiled = self._days[key] = _CompiledDay(schedule.windows_for(day), spill)
+        return compiled
+
+    def is_open_at(self, restaurant_id: int, moment: datetime) -> bool:
+        """Whether a restaurant's hours cover a local datetime."""
+        schedule = self._get_schedules().get(restaurant_id)
+        if schedule is None:
+            return False
+        day = self._compiled_day(restaurant_id, schedule, moment.date())
+        return day.is_open_at(moment.hour * 60 + moment.minute)
+
+    def check_if_open_now(self, restaurant_id: int, now: Optional[datetime] = None) -> Optional[dict]:
+        """Today's effective hours plus whether the restaurant is open right now."""
+        now = now or datetime.now()
+        schedule = self._get_schedules().get(restaurant_id)
+        if schedule is None:
+            return None
+        today = now.date()
+        row = schedule.exceptions.get(today) or schedule.hours.get(DAYS_OF_WEEK[today.weekday()])
+        if row is None:
+            return None
+        return {
+            **row,
+            "day_of_week": DAYS_OF_WEEK[today.weekday()],
+            "is_exception": today in schedule.exceptions,
+            "is_currently_open": int(self.is_open_at(restaurant_id, now))
+        }
+
+    def get_open_restaurants_now(self, now: Optional[datetime] = None) -> List[dict]:
+        """All OPEN restaurants inside an opening window right now.
+
+        The result is reused for the rest of the current minute.
+        """
+        now = (now or datetime.now()).replace(second=0, microsecond=0)
+        cached = self._open_now
+        if cached is not None and cached[0] == now:
+            return list(cached[1])
+
+        open_restaurants = sorted(
+            (
+                {"restaurant_id": restaurant_id, "restaurant_name": schedule.restaurant_name}
+                for restaurant_id, schedule in self._get_schedules().items()
+                if schedule.operating_status == "OPEN" and self.is_open_at(restaurant_id, now)
+            ),
+            key=lambda row: row["restaurant_name"]
+        )
+        self._open_now = (now, open_restaurants)
+        return list(open_restaurants)
+
+    def get_next_opening_time(self, restaurant_id: int, now: Optional[datetime] = None) -> Optional[dict]:
+        """The next window that opens after now, looking up to two weeks ahead."""
+        now = now or datetime.now()
+        schedule = self._get_schedules().get(restaurant_id)
+        if schedule is None:
+            return None
+
+        for offset in range(NEXT_OPENING_SEARCH_DAYS):
+            day = now.date() + timedelta(days=offset)
+            compiled = self._compiled_day(restaurant_id, schedule, day)
+            for start, end in compiled.windows:
+                opens_at = datetime.combine(day, _time_of_day(start))
+                if opens_at <= now or self.is_open_at(restaurant_id, opens_at - timedelta(minutes=1)):
+                    # Already past, or just a continuation of an earlier window
+                    continue
+                return {
+                    "day_of_week": DAYS_OF_WEEK[day.weekday()],
+                    "date": day,
+                    "open_time": _time_of_day(start),
+                    "close_time": _time_of_day(end),
+                    "minutes_until_open": int((opens_at - now).total_seconds() // 60)
+                }
+        return None
+
+
+# Global schedule index
+schedule_index = ScheduleIndex()
@@ -0,0 +1,135 @@
+from threading import Lock
+from typing import Dict, Optional
+import secrets
+import time
+from fastapi import Depends, HTTPException, status
+from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
+from itsdangerous import BadSignature, URLSafeSerializer
+from pydantic import BaseModel
+from config import settings
+
+# Defaults and documented placeholders; tokens signed with these could be forged by anyone
+_PLACEHOLDER_SECRET_KEYS = {"", "fallback-secret-key", "your-secret-key-here"}
+SIGNING_ENABLED = settings.SECRET_KEY not in _PLACEHOLDER_SECRET_KEYS
+_serializer = URLSafeSerializer(settings.SECRET_KEY, salt="grubngo-session") if SIGNING_ENABLED else None
+_bearer = HTTPBearer(auto_error=False)
+
+
+class SessionClaims(BaseModel):
+    account_id: int
+    role: str
+    issued_at: int
+    expires_at: int
+    session_id: str
+
+
+class RevocationList:
+    """Revoked session ids and per-account cut-offs, kept only until the tokens expire.
+
+    Held in process memory, so a revocation is seen by the worker that made it;
+    token lifetimes are kept short to bound the window elsewhere.
+    """
+
+    def __init__(self):
+        self._sessions: Dict[str, int] = {}
+        self._accounts: Dict[int, int] = {}
+        self._lock = Lock()
+
+    def revoke_session(self, claims: SessionClaims) -> None:
+        with self._lock:
+            self._prune()
+            self._sessions[claims.session_id] = claims.expires_at
+
+    def revoke_account(self, account_id: int) -> None:
+        """Invalidate every token issued to an account up to now."""
+        with self._lock:
+            self._prune()
+            self._accounts[account_id] = int(time.time())
+
+    def is_revoked(self, claims: SessionClaims) -> bool:
+        if claims.session_id in self._sessions:
+            return True
+        cutoff = self._accounts.get(claims.account_id)
+        return cutoff is not None and claims.issued_at <= cutoff
+
+    def _prune(self) -> None:
+        now = int(time.time())
+        self._sessions = {key: expires for key, expires in self._sessions.items() if expires > now}
+        self._accounts = {
+            key: cutoff for key, cutoff in self._accounts.items()
+            if cutoff + settings.SESSION_TTL_SECONDS > now
+        }
+
+
+# Global revocation list
+revoked_sessions = RevocationList()
+
+
+def issue_token(account_id: int, role: str) -> tuple:
+    """Sign a new session token; returns (token, claims)."""
+    if not SIGNING_ENABLED:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Sessions are disabled until SECRET_KEY is configured"
+        )
+    now = int(time.time())
+    claims = SessionClaims(
+        account_id=account_id,
+        role=role,
+        issued_at=now,
+        expires_at=now + settings.SESSION_TTL_SECONDS,
+        session_id=secrets.token_urlsafe(12)
+    )
+    payload = {"sub": claims.account_id, "role": claims.role, "iat": claims.issued_at,
+               "exp": claims.expires_at, "jti": claims.session_id}
+    return _serializer.dumps(payload), claims
+
+
+def verify_token(token: str) -> Optional[SessionClaims]:
+    """Check signature, expiry and revocation without touching the database."""
+    if not SIGNING_ENABLED:
+        return None
+    try:
+        payload = _serializer.loads(token)
+        claims = SessionClaims(
+            account_id=payload["sub"],
+            role=payload["role"],
+            issued_at=payload["iat"],
+            expires_at=payload["exp"],
+            session_id=payload["jti"]
+        )
+    except (BadSignature, KeyError, TypeError, ValueError):
+        return None
+    if claims.expires_at <= time.time() or revoked_sessions.is_revoked(claims):
+        return None
+    return claims
+
+
+async def get_current_session(
+    credentials: Optional[HTTPAuthorizationCredentials] = Depends(_bearer)
+) -> SessionClaims:
+    """FastAPI dependency resolving the bearer token to its session claims."""
+    if not SIGNING_ENABLED:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Sessions are disabled until SECRET_KEY is configured"
+        )
+    claims = verify_token(credentials.credentials) if credentials else None
+    if claims is None:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Invalid or expired session token",
+            headers={"WWW-Authenticate": "Bearer"}
+        )
+    return claims
+
+
+async def require_admin(session: SessionClaims = Depends(get_current_session)) -> SessionClaims:
+    """FastAPI dependency allowing only accounts listed in ADMIN_ACCOUNT_IDS.
+    
+    get_current_session refuses every request while SECRET_KEY is unset, so
+    admin access always rests on a token signed with the real key.
+    """
+    if session.account_id not in settings.ADMIN_ACCOUNT_IDS:
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Admin access required")
+    return session
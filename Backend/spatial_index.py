@@ -0,0 +1,162 @@
+from bisect import bisect_left, bisect_right
+from threading import Lock
+from typing import Dict, List, Optional, Sequence, Tuple
+import logging
+import math
+import numpy as np
+from database import get_db_manager
+from geo import EARTH_RADIUS_KM
+
+logger = logging.getLogger(__name__)
+
+_INDEX_COLUMNS = """r.restaurant_id, r.restaurant_name, r.operating_status, r.city, r.state,
+                    r.latitude, r.longitude"""
+
+
+class _Snapshot:
+    """Immutable, latitude-sorted coordinate arrays for one version of the index."""
+
+    def __init__(self, entries: Dict[int, dict]):
+        rows = sorted(entries.values(), key=lambda row: row["latitude"])
+        self.rows = rows
+        self.latitudes = [row["latitude"] for row in rows]
+        self.lat_rad = np.radians(np.array(self.latitudes, dtype=np.float64))
+        self.lon_rad = np.radians(np.array([row["longitude"] for row in rows], dtype=np.float64))
+        self.is_open = np.array([row["operating_status"] == "OPEN" for row in rows], dtype=bool)
+
+    def band(self, latitude: float, radius_km: float) -> slice:
+        """Slice of rows whose latitude is within radius_km of the given latitude."""
+        delta = math.degrees(radius_km / EARTH_RADIUS_KM)
+        return slice(bisect_left(self.latitudes, latitude - delta), bisect_right(self.latitudes, latitude + delta))
+
+    def distances(self, latitude: float, longitude: float, rows: slice) -> np.ndarray:
+        """Vectorized Haversine distance (km) from a point to a slice of rows."""
+        lat = math.radians(latitude)
+        lon = math.radians(longitude)
+        dlat = self.lat_rad[rows] - lat
+        dlon = self.lon_rad[rows] - lon
+        a = np.sin(dlat / 2) ** 2 + math.cos(lat) * np.cos(self.lat_rad[rows]) * np.sin(dlon / 2) ** 2
+        return 2 * EARTH_RADIUS_KM * np.arcsin(np.minimum(1.0, np.sqrt(a)))
+
+
+class RestaurantSpatialIndex:
+    """In-process index of active restaurants' coordinates for k-NN and radius queries (BR-013).
+
+    Rows are kept sorted by latitude, so a query only computes distances for the
+    latitude band that can contain matches. Writers build a new snapshot and swap
+    it in; readers never lock.
+    """
+
+    def __init__(self):
+        self.db = get_db_manager()
+        self._entries: Dict[int, dict] = {}
+        self._snapshot: Optional[_Snapshot] = None
+        self._lock = Lock()
+
+    def load(self) -> None:
+        """(Re)build the index from every active restaurant with coordinates."""
+        query = f"""
+        SELECT {_INDEX_COLUMNS}
+        FROM Restaurant r
+        JOIN Account a ON r.restaurant_id = a.account_id
+        WHERE r.latitude IS NOT NULL AND r.longitude IS NOT NULL
+          AND a.status = 'ACTIVE'
+        """
+        results = self.db.execute_query(query) or []
+        with self._lock:
+            self._entries = {row["restaurant_id"]: row for row in results}
+            self._snapshot = _Snapshot(self._entries)
+        logger.info(f"Restaurant spatial index loaded with {len(results)} restaurants")
+
+    def refresh_restaurant(self, restaurant_id: int) -> None:
+        """Re-read one restaurant and update (or drop) its index entry."""
+        if self._snapshot is None:
+            return
+        query = f"""
+        SELECT {_INDEX_COLUMNS}
+        FROM Restaurant r
+        JOIN Account a ON r.restaurant_id = a.account_id
+        WHERE r.restaurant_id = %s
+          AND r.latitude IS NOT NULL AND r.longitude IS NOT NULL
+          AND a.status = 'ACTIVE'
+        """
+        row = self.db.execute_query(query, (restaurant_id,), fetch_one=True)
+        if not row and restaurant_id not in self._entries:
+            return
+        with self._lock:
+            entries = dict(self._entries)
+            if row:
+                entries[restaurant_id] = row
+            else:
+                entries.pop(restaurant_id, None)
+            self._entries = entries
+            self._snapshot = _Snapshot(entries)
+
+    def _get_snapshot(self) -> _Snapshot:
+        if self._snapshot is None:
+            self.load()
+        return self._snapshot
+
+    def coordinates(self, restaurant_ids: Sequence[int]) -> Dict[int, Tuple[float, float]]:
+        """(latitude, longitude) of the given restaurants that are in the index."""
+        if self._snapshot is None:
+            self.load()
+        entries = self._entries
+        return {
+            restaurant_id: (entries[restaurant_id]["latitude"], entries[restaurant_id]["longitude"])
+            for restaurant_id in restaurant_ids if restaurant_id in entries
+        }
+
+    def _results(self, snapshot: _Snapshot, rows: slice, positions: np.ndarray, distances: np.ndarray) -> List[dict]:
+        offset = rows.start or 0
+        return [
+            {**snapshot.rows[offset + int(position)], "distance_km": round(float(distances[position]), 3)}
+            for position in positions
+        ]
+
+    def within_radius(self, latitude: float, longitude: float, radius_km: float,
+                      open_only: bool = True) -> List[dict]:
+        """Restaurants within radius_km of a point, nearest first."""
+        snapshot = self._get_snapshot()
+        rows = snapshot.band(latitude, radius_km)
+        distances = snapshot.distances(latitude, longitude, rows)
+        mask = distances <= radius_km
+        if open_only:
+            mask &= snapshot.is_open[rows]
+        positions = np.flatnonzero(mask)
+        positions = positions[np.argsort(distances[positions], kind="stable")]
+        return self._results(snapshot, rows, positions, distances)
+
+    def nearest(self, latitude: float, longitude: float, k: int = 10,
+                open_only: bool = True, start_radius_km: float = 2.0) -> List[dict]:
+        """The k restaurants nearest to a point.
+
+        The search radius doubles until the latitude band holds at least k matches
+        inside the radius (or covers the whole index), so the exact k nearest are
+        always within the final band.
+        """
+        snapshot = self._get_snapshot()
+        if k <= 0 or not snapshot.rows:
+            return []
+
+        radius_km = start_radius_km
+        max_radius_km = math.pi * EARTH_RADIUS_KM
+        while True:
+            rows = snapshot.band(latitude, radius_km)
+            distances = snapshot.distances(latitude, longitude, rows)
+            mask = distances <= radius_km
+            if open_only:
+                mask &= snapshot.is_open[rows]
+            positions = np.flatnonzero(mask)
+            if len(positions) >= k or radius_km >= max_radius_km:
+                break
+            radius_km *= 2
+
+        if len(positions) > k:
+            positions = positions[np.argpartition(distances[positions], k - 1)[:k]]
+        positions = positions[np.argsort(distances[positions], kind="stable")]
+        return self._results(snapshot, rows, positions, distances)
+
+
+# Global restaurant spatial index
+restaurant_index = RestaurantSpatialIndex()
@@ -0,0 +1,145 @@
+from collections import OrderedDict
+from datetime import datetime, timedelta
+from threading import Lock
+from typing import Dict, List, Optional, Tuple
+import logging
+import time
+import numpy as np
+from config import settings
+from database import get_db_manager
+
+logger = logging.getLogger(__name__)
+
+# Bucket width and default lookback per interval
+INTERVALS: Dict[str, Tuple[int, timedelta]] = {
+    "5m": (300, timedelta(days=1)),
+    "1h": (3600, timedelta(days=7)),
+    "1d": (86400, timedelta(days=90)),
+}
+
+# Columns of the per-bucket value array
+METRICS = {"orders": 0, "revenue": 1, "cancellations": 2}
+
+MAX_POINTS = 5000
+MAX_SERIES = 1000
+_EPOCH = np.datetime64("1970-01-01T00:00:00", "s")
+_STREAM_CHUNK = 5000
+
+
+def _to_seconds(moment: datetime) -> int:
+    """Naive datetime to seconds since 1970-01-01 without applying a time zone (matches DATETIME columns)."""
+    return int((np.datetime64(moment, "s") - _EPOCH).astype(np.int64))
+
+
+def _from_seconds(seconds: int) -> datetime:
+    return datetime(1970, 1, 1) + timedelta(seconds=int(seconds))
+
+
+class OrderMetrics:
+    """Order counts, revenue and cancellations bucketed by created_at, per restaurant or platform-wide.
+
+    Orders are read as a narrow projection through a streaming cursor and
+    bucketed with NumPy. Closed buckets are cached per (restaurant, interval)
+    for TIMESERIES_CLOSED_BUCKET_TTL_SECONDS, so a dashboard refresh only
+    re-reads the current bucket. Revenue follows BR-028 (DELIVERED orders);
+    cancellations are CANCELLED orders, both by the order's created_at.
+    """
+
+    def __init__(self):
+        self.db = get_db_manager()
+        # (restaurant_id, step) -> {bucket_start: (values, computed_at)}, least recently used first
+        self._series: OrderedDict = OrderedDict()
+        self._lock = Lock()
+
+    def _compute(self, restaurant_id: Optional[int], step: int, start: int, end: int) -> np.ndarray:
+        """Bucket values for [start, end) as an (n, 3) array: orders, revenue, cancellations."""
+        query = "SELECT created_at, status, total FROM `Order` WHERE created_at >= %s AND created_at < %s"
+        params = [_from_seconds(start), _from_seconds(end)]
+        if restaurant_id is not None:
+            query += " AND restaurant_id = %s"
+            params.append(restaurant_id)
+
+        n = (end - start) // step
+        values = np.zeros((n, 3), dtype=np.float64)
+        created, statuses, totals = [], [], []
+
+        def bucket_chunk() -> None:
+            index = ((np.array(created, dtype="datetime64[s]") - _EPOCH).astype(np.int64) - start) // step
+            status_array = np.array(statuses)
+            values[:, 0] += np.bincount(index, minlength=n)
+            delivered = status_array == "DELIVERED"
+            values[:, 1] += np.bincount(index[delivered], weights=np.array(totals, dtype=np.float64)[delivered],
+                                        minlength=n)
+            values[:, 2] += np.bincount(index[status_array == "CANCELLED"], minlength=n)
+            created.clear()
+            statuses.clear()
+            totals.clear()
+
+        for row in self.db.stream_query(query, tuple(params), batch_size=_STREAM_CHUNK):
+            created.append(row["created_at"])
+            statuses.append(row["status"])
+            totals.append(row["total"])
+            if len(created) >= _STREAM_CHUNK:
+                bucket_chunk()
+        if created:
+            bucket_chunk()
+        return values
+
+    def series(self, metric: str, interval: str, start: Optional[datetime] = None,
+               end: Optional[datetime] = None, restaurant_id: Optional[int] = None) -> List[Tuple[datetime, float]]:
+        """(bucket_start, value) points from start up to end (default: the interval's lookback up to now)."""
+        if metric not in METRICS:
+            raise ValueError(f"Metric must be one of: {', '.join(METRICS)}")
+        if interval not in INTERVALS:
+            raise ValueError(f"Interval must be one of: {', '.join(INTERVALS)}")
+        step, lookback = INTERVALS[interval]
+        now = _to_seconds(datetime.now())
+        end_seconds = min(_to_seconds(end), now) if end else now
+        start_seconds = _to_seconds(start) if start else end_seconds - int(lookback.total_seconds())
+        first = start_seconds // step * step
+        last = (end_seconds // step + 1) * step
+        if first >= last:
+            raise ValueError("start must be before end")
+        if (last - first) // step > MAX_POINTS:
+            raise ValueError(f"Too many buckets; at most {MAX_POINTS} per request")
+
+        key = (restaurant_id, step)
+        ttl = settings.TIMESERIES_CLOSED_BUCKET_TTL_SECONDS
+        current = now // step * step
+        with self._lock:
+            cached = self._series.setdefault(key, {})
+            self._series.move_to_end(key)
+            while len(self._series) > MAX_SERIES:
+                self._series.popitem(last=False)
+            expired_before = time.monotonic() - ttl
+            hits = {
+                bucket: cached[bucket][0] for bucket in range(first, min(last, current), step)
+                if bucket in cached and cached[bucket][1] >= expired_before
+            }
+        missing = [bucket for bucket in range(first, last, step) if bucket not in hits]
+
+        fresh: Dict[int, np.ndarray] = {}
+        if missing:
+            low, high = missing[0], missing[-1] + step
+            values = self._compute(restaurant_id, step, low, high)
+            fresh = {low + i * step: values[i] for i in range(len(values))}
+            computed_at = time.monotonic()
+            with self._lock:
+                for bucket, row in fresh.items():
+                    if bucket < current:
+                        cached[bucket] = (row, computed_at)
+                if len(cached) > 4 * MAX_POINTS:
+                    for bucket in sorted(cached)[:len(cached) - 2 * MAX_POINTS]:
+                        del cached[bucket]
+
+        column = METRICS[metric]
+        points = []
+        for bucket in range(first, last, step):
+            row = hits[bucket] if bucket in hits else fresh[bucket]
+            value = round(float(row[column]), 2) if metric == "revenue" else int(row[column])
+            points.append((_from_seconds(bucket), value))
+        return points
+
+
+# Global order metrics
+order_metrics = OrderMetrics()
@@ -72,6 +72,8 @@ CREATE TABLE `address` (
   `is_default` tinyint(1) DEFAULT '0',
   `created_at` datetime DEFAULT CURRENT_TIMESTAMP,
   `updated_at` datetime DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
+  `latitude` decimal(10,8) DEFAULT NULL,
+  `longitude` decimal(11,8) DEFAULT NULL,
   PRIMARY KEY (`address_id`),
   KEY `idx_address_customer` (`customer_id`),
   KEY `idx_address_default` (`customer_id`,`is_default`),
@@ -85,7 +87,7 @@ CREATE TABLE `address` (
 
 LOCK TABLES `address` WRITE;
 /*!40000 ALTER TABLE `address` DISABLE KEYS */;
-INSERT INTO `address` VALUES (1,1,'Home','101 Market St','San Francisco','CA','94101','USA',1,'2025-12-07 17:07:24','2025-12-07 17:07:24'),(2,2,'Home','102 Market St','San Francisco','CA','94102','USA',1,'2025-12-07 17:07:24','2025-12-07 17:07:24'),(3,3,'Home','103 Market St','San Francisco','CA','94103','USA',1,'2025-12-07 17:07:24','2025-12-07 17:07:24'),(4,4,'Home','104 Market St','San Francisco','CA','94104','USA',1,'2025-12-07 17:07:24','2025-12-07 17:07:24'),(5,5,'Home','105 Market St','San Francisco','CA','94105','USA',1,'2025-12-07 17:07:24','2025-12-07 17:07:24'),(6,6,'Home','106 Market St','San Francisco','CA','94106','USA',1,'2025-12-07 17:07:24','2025-12-07 17:07:24'),(7,7,'Home','107 Market St','San Francisco','CA','94107','USA',1,'2025-12-07 17:07:24','2025-12-07 17:07:24'),(8,8,'Home','108 Market St','San Francisco','CA','94108','USA',1,'2025-12-07 17:07:24','2025-12-07 17:07:24'),(9,9,'Home','109 Market St','San Francisco','CA','94109','USA',1,'2025-12-07 17:07:24','2025-12-07 17:07:24'),(10,10,'Home','110 Market St','San Francisco','CA','94110','USA',1,'2025-12-07 17:07:24','2025-12-07 17:07:24'),(11,11,'Home','111 Market St','San Francisco','CA','94111','USA',1,'2025-12-07 17:07:24','2025-12-07 17:07:24'),(12,12,'Home','112 Market St','San Francisco','CA','94112','USA',1,'2025-12-07 17:07:24','2025-12-07 17:07:24'),(13,13,'Home','113 Market St','San Francisco','CA','94113','USA',1,'2025-12-07 17:07:24','2025-12-07 17:07:24'),(14,14,'Home','114 Market St','San Francisco','CA','94114','USA',1,'2025-12-07 17:07:24','2025-12-07 17:07:24'),(15,15,'Home','115 Market St','San Francisco','CA','94115','USA',1,'2025-12-07 17:07:24','2025-12-07 17:07:24'),(16,16,'Home','116 Market St','San Francisco','CA','94116','USA',1,'2025-12-07 17:07:24','2025-12-07 17:07:24'),(17,17,'Home','117 Market St','San Francisco','CA','94117','USA',1,'2025-12-07 17:07:24','2025-12-07 17:07:24'),(18,18,'Home','118 Market St','San Francisco','CA','94118','USA',1,'2025-12-07 17:07:24','2025-12-07 17:07:24'),(19,19,'Home','119 Market St','San Francisco','CA','94119','USA',1,'2025-12-07 17:07:24','2025-12-07 17:07:24'),(20,20,'Home','120 Market St','San Francisco','CA','94120','USA',1,'2025-12-07 17:07:24','2025-12-07 17:07:24'),(21,21,'Home','121 Market St','San Francisco','CA','94121','USA',1,'2025-12-07 17:07:24','2025-12-07 17:07:24'),(22,22,'Home','122 Market St','San Francisco','CA','94122','USA',1,'2025-12-07 17:07:24','2025-12-07 17:07:24'),(23,23,'Home','123 Market St','San Francisco','CA','94123','USA',1,'2025-12-07 17:07:24','2025-12-07 17:07:24'),(24,24,'Home','124 Market St','San Francisco','CA','94124','USA',1,'2025-12-07 17:07:24','2025-12-07 17:07:24'),(25,25,'Home','125 Market St','San Francisco','CA','94125','USA',1,'2025-12-07 17:07:24','2025-12-07 17:07:24'),(26,26,'Home','126 Market St','San Francisco','CA','94126','USA',1,'2025-12-07 17:07:24','2025-12-07 17:07:24'),(27,27,'Home','127 Market St','San Francisco','CA','94127','USA',1,'2025-12-07 17:07:24','2025-12-07 17:07:24'),(28,28,'Home','128 Market St','San Francisco','CA','94128','USA',1,'2025-12-07 17:07:24','2025-12-07 17:07:24'),(29,29,'Home','129 Market St','San Francisco','CA','94129','USA',1,'2025-12-07 17:07:24','2025-12-07 17:07:24'),(30,30,'Home','130 Market St','San Francisco','CA','94130','USA',1,'2025-12-07 17:07:24','2025-12-07 17:07:24');
+INSERT INTO `address` VALUES (1,1,'Home','101 Market St','San Francisco','CA','94101','USA',1,'2025-12-07 17:07:24','2025-12-07 17:07:24',NULL,NULL),(2,2,'Home','102 Market St','San Francisco','CA','94102','USA',1,'2025-12-07 17:07:24','2025-12-07 17:07:24',NULL,NULL),(3,3,'Home','103 Market St','San Francisco','CA','94103','USA',1,'2025-12-07 17:07:24','2025-12-07 17:07:24',NULL,NULL),(4,4,'Home','104 Market St','San Francisco','CA','94104','USA',1,'2025-12-07 17:07:24','2025-12-07 17:07:24',NULL,NULL),(5,5,'Home','105 Market St','San Francisco','CA','94105','USA',1,'2025-12-07 17:07:24','2025-12-07 17:07:24',NULL,NULL),(6,6,'Home','106 Market St','San Francisco','CA','94106','USA',1,'2025-12-07 17:07:24','2025-12-07 17:07:24',NULL,NULL),(7,7,'Home','107 Market St','San Francisco','CA','94107','USA',1,'2025-12-07 17:07:24','2025-12-07 17:07:24',NULL,NULL),(8,8,'Home','108 Market St','San Francisco','CA','94108','USA',1,'2025-12-07 17:07:24','2025-12-07 17:07:24',NULL,NULL),(9,9,'Home','109 Market St','San Francisco','CA','94109','USA',1,'2025-12-07 17:07:24','2025-12-07 17:07:24',NULL,NULL),(10,10,'Home','110 Market St','San Francisco','CA','94110','USA',1,'2025-12-07 17:07:24','2025-12-07 17:07:24',NULL,NULL),(11,11,'Home','111 Market St','San Francisco','CA','94111','USA',1,'2025-12-07 17:07:24','2025-12-07 17:07:24',NULL,NULL),(12,12,'Home','112 Market St','San Francisco','CA','94112','USA',1,'2025-12-07 17:07:24','2025-12-07 17:07:24',NULL,NULL),(13,13,'Home','113 Market St','San Francisco','CA','94113','USA',1,'2025-12-07 17:07:24','2025-12-07 17:07:24',NULL,NULL),(14,14,'Home','114 Market St','San Francisco','CA','94114','USA',1,'2025-12-07 17:07:24','2025-12-07 17:07:24',NULL,NULL),(15,15,'Home','115 Market St','San Francisco','CA','94115','USA',1,'2025-12-07 17:07:24','2025-12-07 17:07:24',NULL,NULL),(16,16,'Home','116 Market St','San Francisco','CA','94116','USA',1,'2025-12-07 17:07:24','2025-12-07 17:07:24',NULL,NULL),(17,17,'Home','117 Market St','San Francisco','CA','94117','USA',1,'2025-12-07 17:07:24','2025-12-07 17:07:24',NULL,NULL),(18,18,'Home','118 Market St','San Francisco','CA','94118','USA',1,'2025-12-07 17:07:24','2025-12-07 17:07:24',NULL,NULL),(19,19,'Home','119 Market St','San Francisco','CA','94119','USA',1,'2025-12-07 17:07:24','2025-12-07 17:07:24',NULL,NULL),(20,20,'Home','120 Market St','San Francisco','CA','94120','USA',1,'2025-12-07 17:07:24','2025-12-07 17:07:24',NULL,NULL),(21,21,'Home','121 Market St','San Francisco','CA','94121','USA',1,'2025-12-07 17:07:24','2025-12-07 17:07:24',NULL,NULL),(22,22,'Home','122 Market St','San Francisco','CA','94122','USA',1,'2025-12-07 17:07:24','2025-12-07 17:07:24',NULL,NULL),(23,23,'Home','123 Market St','San Francisco','CA','94123','USA',1,'2025-12-07 17:07:24','2025-12-07 17:07:24',NULL,NULL),(24,24,'Home','124 Market St','San Francisco','CA','94124','USA',1,'2025-12-07 17:07:24','2025-12-07 17:07:24',NULL,NULL),(25,25,'Home','125 Market St','San Francisco','CA','94125','USA',1,'2025-12-07 17:07:24','2025-12-07 17:07:24',NULL,NULL),(26,26,'Home','126 Market St','San Francisco','CA','94126','USA',1,'2025-12-07 17:07:24','2025-12-07 17:07:24',NULL,NULL),(27,27,'Home','127 Market St','San Francisco','CA','94127','USA',1,'2025-12-07 17:07:24','2025-12-07 17:07:24',NULL,NULL),(28,28,'Home','128 Market St','San Francisco','CA','94128','USA',1,'2025-12-07 17:07:24','2025-12-07 17:07:24',NULL,NULL),(29,29,'Home','129 Market St','San Francisco','CA','94129','USA',1,'2025-12-07 17:07:24','2025-12-07 17:07:24',NULL,NULL),(30,30,'Home','130 Market St','San Francisco','CA','94130','USA',1,'2025-12-07 17:07:24','2025-12-07 17:07:24',NULL,NULL);
 /*!40000 ALTER TABLE `address` ENABLE KEYS */;
 UNLOCK TABLES;
 
@@ -157,6 +159,38 @@ INSERT INTO `businesshours` VALUES (1,31,'MONDAY','08:00:00','20:00:00',0),(2,32
 /*!40000 ALTER TABLE `businesshours` ENABLE KEYS */;
 UNLOCK TABLES;
 
+--
+-- Table structure for table `businesshoursexception`
+--
+
+DROP TABLE IF EXISTS `businesshoursexception`;
+/*!40101 SET @saved_cs_client     = @@character_set_client */;
+/*!50503 SET character_set_client = utf8mb4 */;
+CREATE TABLE `businesshoursexception` (
+  `business_hours_exception_id` bigint NOT NULL AUTO_INCREMENT,
+  `restaurant_id` bigint NOT NULL,
+  `exception_date` date NOT NULL,
+  `is_closed` tinyint(1) NOT NULL DEFAULT '0',
+  `open_time` time DEFAULT NULL,
+  `close_time` time DEFAULT NULL,
+  `reason` varchar(255) DEFAULT NULL,
+  `created_at` datetime DEFAULT CURRENT_TIMESTAMP,
+  PRIMARY KEY (`business_hours_exception_id`),
+  UNIQUE KEY `unique_restaurant_exception_date` (`restaurant_id`,`exception_date`),
+  KEY `idx_exception_date` (`exception_date`),
+  CONSTRAINT `businesshoursexception_ibfk_1` FOREIGN KEY (`restaurant_id`) REFERENCES `restaurant` (`restaurant_id`) ON DELETE CASCADE
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_0900_ai_ci;
+/*!40101 SET character_set_client = @saved_cs_client */;
+
+--
+-- Dumping data for table `businesshoursexception`
+--
+
+LOCK TABLES `businesshoursexception` WRITE;
+/*!40000 ALTER TABLE `businesshoursexception` DISABLE KEYS */;
+/*!40000 ALTER TABLE `businesshoursexception` ENABLE KEYS */;
+UNLOCK TABLES;
+
 --
 -- Table structure for table `customer`
 --
@@ -183,6 +217,92 @@ INSERT INTO `customer` VALUES (1,'Customer 01','555-1001'),(2,'Customer 02','555
 /*!40000 ALTER TABLE `customer` ENABLE KEYS */;
 UNLOCK TABLES;
 
+--
+-- Table structure for table `customerstats`
+--
+
+DROP TABLE IF EXISTS `customerstats`;
+/*!40101 SET @saved_cs_client     = @@character_set_client */;
+/*!50503 SET character_set_client = utf8mb4 */;
+CREATE TABLE `customerstats` (
+  `customer_id` bigint NOT NULL,
+  `total_orders` int NOT NULL DEFAULT '0',
+  `total_spent` decimal(12,2) NOT NULL DEFAULT '0.00',
+  `last_order_date` datetime DEFAULT NULL,
+  PRIMARY KEY (`customer_id`),
+  KEY `idx_customer_stats_spent` (`total_spent`,`customer_id`),
+  CONSTRAINT `customerstats_ibfk_1` FOREIGN KEY (`customer_id`) REFERENCES `customer` (`customer_id`) ON DELETE CASCADE
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_0900_ai_ci;
+/*!40101 SET character_set_client = @saved_cs_client */;
+
+--
+-- Dumping data for table `customerstats`
+--
+
+LOCK TABLES `customerstats` WRITE;
+/*!40000 ALTER TABLE `customerstats` DISABLE KEYS */;
+INSERT INTO `customerstats` VALUES (1,1,19.54,'2025-01-01 10:00:00'),(2,1,20.63,'2025-01-02 10:00:00'),(5,1,23.89,'2025-01-05 10:00:00'),(8,1,27.15,'2025-01-08 10:00:00'),(9,1,28.24,'2025-01-09 10:00:00'),(11,1,30.41,'2025-01-11 10:00:00'),(12,1,31.50,'2025-01-12 10:00:00'),(14,1,33.68,'2025-01-14 10:00:00'),(15,1,34.76,'2025-01-15 10:00:00'),(17,1,36.94,'2025-01-17 10:00:00'),(18,1,38.03,'2025-01-18 10:00:00'),(20,1,40.20,'2025-01-20 10:00:00'),(22,1,42.38,'2025-01-22 10:00:00'),(23,1,43.46,'2025-01-23 10:00:00'),(24,1,44.55,'2025-01-24 10:00:00'),(25,1,45.64,'2025-01-25 10:00:00');
+/*!40000 ALTER TABLE `customerstats` ENABLE KEYS */;
+UNLOCK TABLES;
+
+--
+-- Table structure for table `deliveryzone`
+--
+
+DROP TABLE IF EXISTS `deliveryzone`;
+/*!40101 SET @saved_cs_client     = @@character_set_client */;
+/*!50503 SET character_set_client = utf8mb4 */;
+CREATE TABLE `deliveryzone` (
+  `delivery_zone_id` bigint NOT NULL AUTO_INCREMENT,
+  `restaurant_id` bigint NOT NULL,
+  `zone_name` varchar(100) NOT NULL,
+  `polygon` json NOT NULL COMMENT '[[latitude, longitude], ...]',
+  `is_active` tinyint(1) NOT NULL DEFAULT '1',
+  `created_at` datetime DEFAULT CURRENT_TIMESTAMP,
+  `updated_at` datetime DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
+  PRIMARY KEY (`delivery_zone_id`),
+  KEY `idx_delivery_zone_restaurant` (`restaurant_id`,`is_active`),
+  CONSTRAINT `deliveryzone_ibfk_1` FOREIGN KEY (`restaurant_id`) REFERENCES `restaurant` (`restaurant_id`) ON DELETE CASCADE
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_0900_ai_ci;
+/*!40101 SET character_set_client = @saved_cs_client */;
+
+--
+-- Dumping data for table `deliveryzone`
+--
+
+LOCK TABLES `deliveryzone` WRITE;
+/*!40000 ALTER TABLE `deliveryzone` DISABLE KEYS */;
+/*!40000 ALTER TABLE `deliveryzone` ENABLE KEYS */;
+UNLOCK TABLES;
+
+--
+-- Table structure for table `fulfillmentsketch`
+--
+
+DROP TABLE IF EXISTS `fulfillmentsketch`;
+/*!40101 SET @saved_cs_client     = @@character_set_client */;
+/*!50503 SET character_set_client = utf8mb4 */;
+CREATE TABLE `fulfillmentsketch` (
+  `restaurant_id` bigint NOT NULL,
+  `stage` varchar(32) NOT NULL,
+  `sketch` json NOT NULL,
+  `sample_count` bigint NOT NULL DEFAULT '0',
+  `updated_at` datetime DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
+  PRIMARY KEY (`restaurant_id`,`stage`),
+  CONSTRAINT `fulfillmentsketch_ibfk_1` FOREIGN KEY (`restaurant_id`) REFERENCES `restaurant` (`restaurant_id`) ON DELETE CASCADE
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_0900_ai_ci;
+/*!40101 SET character_set_client = @saved_cs_client */;
+
+--
+-- Dumping data for table `fulfillmentsketch`
+--
+
+LOCK TABLES `fulfillmentsketch` WRITE;
+/*!40000 ALTER TABLE `fulfillmentsketch` DISABLE KEYS */;
+INSERT INTO `fulfillmentsketch` VALUES (31,'confirmation','{"relative_accuracy": 0.01, "bins": {"286": 1}, "zero_count": 0, "count": 1, "sum": 300.0, "min": 300.0, "max": 300.0}',1,'2025-12-07 17:07:24'),(31,'delivery','{"relative_accuracy": 0.01, "bins": {"366": 1}, "zero_count": 0, "count": 1, "sum": 1500.0, "min": 1500.0, "max": 1500.0}',1,'2025-12-07 17:07:24'),(31,'fulfillment','{"relative_accuracy": 0.01, "bins": {"418": 1}, "zero_count": 0, "count": 1, "sum": 4200.0, "min": 4200.0, "max": 4200.0}',1,'2025-12-07 17:07:24'),(31,'kitchen_start','{"relative_accuracy": 0.01, "bins": {"355": 1}, "zero_count": 0, "count": 1, "sum": 1200.0, "min": 1200.0, "max": 1200.0}',1,'2025-12-07 17:07:24'),(31,'pickup','{"relative_accuracy": 0.01, "bins": {"341": 1}, "zero_count": 0, "count": 1, "sum": 900.0, "min": 900.0, "max": 900.0}',1,'2025-12-07 17:07:24'),(31,'preparation','{"relative_accuracy": 0.01, "bins": {"320": 1}, "zero_count": 0, "count": 1, "sum": 600.0, "min": 600.0, "max": 600.0}',1,'2025-12-07 17:07:24'),(32,'confirmation','{"relative_accuracy": 0.01, "bins": {"286": 1}, "zero_count": 0, "count": 1, "sum": 300.0, "min": 300.0, "max": 300.0}',1,'2025-12-07 17:07:24'),(32,'delivery','{"relative_accuracy": 0.01, "bins": {"366": 1}, "zero_count": 0, "count": 1, "sum": 1500.0, "min": 1500.0, "max": 1500.0}',1,'2025-12-07 17:07:24'),(32,'fulfillment','{"relative_accuracy": 0.01, "bins": {"418": 1}, "zero_count": 0, "count": 1, "sum": 4200.0, "min": 4200.0, "max": 4200.0}',1,'2025-12-07 17:07:24'),(32,'kitchen_start','{"relative_accuracy": 0.01, "bins": {"355": 1}, "zero_count": 0, "count": 1, "sum": 1200.0, "min": 1200.0, "max": 1200.0}',1,'2025-12-07 17:07:24'),(32,'pickup','{"relative_accuracy": 0.01, "bins": {"341": 1}, "zero_count": 0, "count": 1, "sum": 900.0, "min": 900.0, "max": 900.0}',1,'2025-12-07 17:07:24'),(32,'preparation','{"relative_accuracy": 0.01, "bins": {"320": 1}, "zero_count": 0, "count": 1, "sum": 600.0, "min": 600.0, "max": 600.0}',1,'2025-12-07 17:07:24'),(33,'confirmation','{"relative_accuracy": 0.01, "bins": {"286": 1}, "zero_count": 0, "count": 1, "sum": 300.0, "min": 300.0, "max": 300.0}',1,'2025-12-07 17:07:24'),(33,'kitchen_start','{"relative_accuracy": 0.01, "bins": {"355": 1}, "zero_count": 0, "count": 1, "sum": 1200.0, "min": 1200.0, "max": 1200.0}',1,'2025-12-07 17:07:24'),(33,'pickup','{"relative_accuracy": 0.01, "bins": {"341": 1}, "zero_count": 0, "count": 1, "sum": 900.0, "min": 900.0, "max": 900.0}',1,'2025-12-07 17:07:24'),(33,'preparation','{"relative_accuracy": 0.01, "bins": {"320": 1}, "zero_count": 0, "count": 1, "sum": 600.0, "min": 600.0, "max": 600.0}',1,'2025-12-07 17:07:24'),(34,'confirmation','{"relative_accuracy": 0.01, "bins": {"286": 1}, "zero_count": 0, "count": 1, "sum": 300.0, "min": 300.0, "max": 300.0}',1,'2025-12-07 17:07:24'),(35,'confirmation','{"relative_accuracy": 0.01, "bins": {"286": 1}, "zero_count": 0, "count": 1, "sum": 300.0, "min": 300.0, "max": 300.0}',1,'2025-12-07 17:07:24'),(35,'delivery','{"relative_accuracy": 0.01, "bins": {"366": 1}, "zero_count": 0, "count": 1, "sum": 1500.0, "min": 1500.0, "max": 1500.0}',1,'2025-12-07 17:07:24'),(35,'fulfillment','{"relative_accuracy": 0.01, "bins": {"418": 1}, "zero_count": 0, "count": 1, "sum": 4200.0, "min": 4200.0, "max": 4200.0}',1,'2025-12-07 17:07:24'),(35,'kitchen_start','{"relative_accuracy": 0.01, "bins": {"355": 1}, "zero_count": 0, "count": 1, "sum": 1200.0, "min": 1200.0, "max": 1200.0}',1,'2025-12-07 17:07:24'),(35,'pickup','{"relative_accuracy": 0.01, "bins": {"341": 1}, "zero_count": 0, "count": 1, "sum": 900.0, "min": 900.0, "max": 900.0}',1,'2025-12-07 17:07:24'),(35,'preparation','{"relative_accuracy": 0.01, "bins": {"320": 1}, "zero_count": 0, "count": 1, "sum": 600.0, "min": 600.0, "max": 600.0}',1,'2025-12-07 17:07:24'),(36,'confirmation','{"relative_accuracy": 0.01, "bins": {"286": 1}, "zero_count": 0, "count": 1, "sum": 300.0, "min": 300.0, "max": 300.0}',1,'2025-12-07 17:07:24'),(37,'confirmation','{"relative_accuracy": 0.01, "bins": {"286": 1}, "zero_count": 0, "count": 1, "sum": 300.0, "min": 300.0, "max": 300.0}',1,'2025-12-07 17:07:24'),(37,'kitchen_start','{"relative_accuracy": 0.01, "bins": {"355": 1}, "zero_count": 0, "count": 1, "sum": 1200.0, "min": 1200.0, "max": 1200.0}',1,'2025-12-07 17:07:24'),(37,'preparation','{"relative_accuracy": 0.01, "bins": {"320": 1}, "zero_count": 0, "count": 1, "sum": 600.0, "min": 600.0, "max": 600.0}',1,'2025-12-07 17:07:24'),(38,'confirmation','{"relative_accuracy": 0.01, "bins": {"286": 1}, "zero_count": 0, "count": 1, "sum": 300.0, "min": 300.0, "max": 300.0}',1,'2025-12-07 17:07:24'),(38,'delivery','{"relative_accuracy": 0.01, "bins": {"366": 1}, "zero_count": 0, "count": 1, "sum": 1500.0, "min": 1500.0, "max": 1500.0}',1,'2025-12-07 17:07:24'),(38,'fulfillment','{"relative_accuracy": 0.01, "bins": {"418": 1}, "zero_count": 0, "count": 1, "sum": 4200.0, "min": 4200.0, "max": 4200.0}',1,'2025-12-07 17:07:24'),(38,'kitchen_start','{"relative_accuracy": 0.01, "bins": {"355": 1}, "zero_count": 0, "count": 1, "sum": 1200.0, "min": 1200.0, "max": 1200.0}',1,'2025-12-07 17:07:24'),(38,'pickup','{"relative_accuracy": 0.01, "bins": {"341": 1}, "zero_count": 0, "count": 1, "sum": 900.0, "min": 900.0, "max": 900.0}',1,'2025-12-07 17:07:24'),(38,'preparation','{"relative_accuracy": 0.01, "bins": {"320": 1}, "zero_count": 0, "count": 1, "sum": 600.0, "min": 600.0, "max": 600.0}',1,'2025-12-07 17:07:24'),(39,'confirmation','{"relative_accuracy": 0.01, "bins": {"286": 1}, "zero_count": 0, "count": 1, "sum": 300.0, "min": 300.0, "max": 300.0}',1,'2025-12-07 17:07:24'),(39,'delivery','{"relative_accuracy": 0.01, "bins": {"366": 1}, "zero_count": 0, "count": 1, "sum": 1500.0, "min": 1500.0, "max": 1500.0}',1,'2025-12-07 17:07:24'),(39,'fulfillment','{"relative_accuracy": 0.01, "bins": {"418": 1}, "zero_count": 0, "count": 1, "sum": 4200.0, "min": 4200.0, "max": 4200.0}',1,'2025-12-07 17:07:24'),(39,'kitchen_start','{"relative_accuracy": 0.01, "bins": {"355": 1}, "zero_count": 0, "count": 1, "sum": 1200.0, "min": 1200.0, "max": 1200.0}',1,'2025-12-07 17:07:24'),(39,'pickup','{"relative_accuracy": 0.01, "bins": {"341": 1}, "zero_count": 0, "count": 1, "sum": 900.0, "min": 900.0, "max": 900.0}',1,'2025-12-07 17:07:24'),(39,'preparation','{"relative_accuracy": 0.01, "bins": {"320": 1}, "zero_count": 0, "count": 1, "sum": 600.0, "min": 600.0, "max": 600.0}',1,'2025-12-07 17:07:24'),(40,'confirmation','{"relative_accuracy": 0.01, "bins": {"286": 1}, "zero_count": 0, "count": 1, "sum": 300.0, "min": 300.0, "max": 300.0}',1,'2025-12-07 17:07:24'),(41,'confirmation','{"relative_accuracy": 0.01, "bins": {"286": 1}, "zero_count": 0, "count": 1, "sum": 300.0, "min": 300.0, "max": 300.0}',1,'2025-12-07 17:07:24'),(41,'delivery','{"relative_accuracy": 0.01, "bins": {"366": 1}, "zero_count": 0, "count": 1, "sum": 1500.0, "min": 1500.0, "max": 1500.0}',1,'2025-12-07 17:07:24'),(41,'fulfillment','{"relative_accuracy": 0.01, "bins": {"418": 1}, "zero_count": 0, "count": 1, "sum": 4200.0, "min": 4200.0, "max": 4200.0}',1,'2025-12-07 17:07:24'),(41,'kitchen_start','{"relative_accuracy": 0.01, "bins": {"355": 1}, "zero_count": 0, "count": 1, "sum": 1200.0, "min": 1200.0, "max": 1200.0}',1,'2025-12-07 17:07:24'),(41,'pickup','{"relative_accuracy": 0.01, "bins": {"341": 1}, "zero_count": 0, "count": 1, "sum": 900.0, "min": 900.0, "max": 900.0}',1,'2025-12-07 17:07:24'),(41,'preparation','{"relative_accuracy": 0.01, "bins": {"320": 1}, "zero_count": 0, "count": 1, "sum": 600.0, "min": 600.0, "max": 600.0}',1,'2025-12-07 17:07:24'),(42,'confirmation','{"relative_accuracy": 0.01, "bins": {"286": 1}, "zero_count": 0, "count": 1, "sum": 300.0, "min": 300.0, "max": 300.0}',1,'2025-12-07 17:07:24'),(42,'delivery','{"relative_accuracy": 0.01, "bins": {"366": 1}, "zero_count": 0, "count": 1, "sum": 1500.0, "min": 1500.0, "max": 1500.0}',1,'2025-12-07 17:07:24'),(42,'fulfillment','{"relative_accuracy": 0.01, "bins": {"418": 1}, "zero_count": 0, "count": 1, "sum": 4200.0, "min": 4200.0, "max": 4200.0}',1,'2025-12-07 17:07:24'),(42,'kitchen_start','{"relative_accuracy": 0.01, "bins": {"355": 1}, "zero_count": 0, "count": 1, "sum": 1200.0, "min": 1200.0, "max": 1200.0}',1,'2025-12-07 17:07:24'),(42,'pickup','{"relative_accuracy": 0.01, "bins": {"341": 1}, "zero_count": 0, "count": 1, "sum": 900.0, "min": 900.0, "max": 900.0}',1,'2025-12-07 17:07:24'),(42,'preparation','{"relative_accuracy": 0.01, "bins": {"320": 1}, "zero_count": 0, "count": 1, "sum": 600.0, "min": 600.0, "max": 600.0}',1,'2025-12-07 17:07:24'),(44,'confirmation','{"relative_accuracy": 0.01, "bins": {"286": 1}, "zero_count": 0, "count": 1, "sum": 300.0, "min": 300.0, "max": 300.0}',1,'2025-12-07 17:07:24'),(44,'delivery','{"relative_accuracy": 0.01, "bins": {"366": 1}, "zero_count": 0, "count": 1, "sum": 1500.0, "min": 1500.0, "max": 1500.0}',1,'2025-12-07 17:07:24'),(44,'fulfillment','{"relative_accuracy": 0.01, "bins": {"418": 1}, "zero_count": 0, "count": 1, "sum": 4200.0, "min": 4200.0, "max": 4200.0}',1,'2025-12-07 17:07:24'),(44,'kitchen_start','{"relative_accuracy": 0.01, "bins": {"355": 1}, "zero_count": 0, "count": 1, "sum": 1200.0, "min": 1200.0, "max": 1200.0}',1,'2025-12-07 17:07:24'),(44,'pickup','{"relative_accuracy": 0.01, "bins": {"341": 1}, "zero_count": 0, "count": 1, "sum": 900.0, "min": 900.0, "max": 900.0}',1,'2025-12-07 17:07:24'),(44,'preparation','{"relative_accuracy": 0.01, "bins": {"320": 1}, "zero_count": 0, "count": 1, "sum": 600.0, "min": 600.0, "max": 600.0}',1,'2025-12-07 17:07:24'),(45,'confirmation','{"relative_accuracy": 0.01, "bins": {"286": 1}, "zero_count": 0, "count": 1, "sum": 300.0, "min": 300.0, "max": 300.0}',1,'2025-12-07 17:07:24'),(45,'delivery','{"relative_accuracy": 0.01, "bins": {"366": 1}, "zero_count": 0, "count": 1, "sum": 1500.0, "min": 1500.0, "max": 1500.0}',1,'2025-12-07 17:07:24'),(45,'fulfillment','{"relative_accuracy": 0.01, "bins": {"418": 1}, "zero_count": 0, "count": 1, "sum": 4200.0, "min": 4200.0, "max": 4200.0}',1,'2025-12-07 17:07:24'),(45,'kitchen_start','{"relative_accuracy": 0.01, "bins": {"355": 1}, "zero_count": 0, "count": 1, "sum": 1200.0, "min": 1200.0, "max": 1200.0}',1,'2025-12-07 17:07:24'),(45,'pickup','{"relative_accuracy": 0.01, "bins": {"341": 1}, "zero_count": 0, "count": 1, "sum": 900.0, "min": 900.0, "max": 900.0}',1,'2025-12-07 17:07:24'),(45,'preparation','{"relative_accuracy": 0.01, "bins": {"320": 1}, "zero_count": 0, "count": 1, "sum": 600.0, "min": 600.0, "max": 600.0}',1,'2025-12-07 17:07:24'),(46,'confirmation','{"relative_accuracy": 0.01, "bins": {"286": 1}, "zero_count": 0, "count": 1, "sum": 300.0, "min": 300.0, "max": 300.0}',1,'2025-12-07 17:07:24'),(47,'confirmation','{"relative_accuracy": 0.01, "bins": {"286": 1}, "zero_count": 0, "count": 1, "sum": 300.0, "min": 300.0, "max": 300.0}',1,'2025-12-07 17:07:24'),(47,'delivery','{"relative_accuracy": 0.01, "bins": {"366": 1}, "zero_count": 0, "count": 1, "sum": 1500.0, "min": 1500.0, "max": 1500.0}',1,'2025-12-07 17:07:24'),(47,'fulfillment','{"relative_accuracy": 0.01, "bins": {"418": 1}, "zero_count": 0, "count": 1, "sum": 4200.0, "min": 4200.0, "max": 4200.0}',1,'2025-12-07 17:07:24'),(47,'kitchen_start','{"relative_accuracy": 0.01, "bins": {"355": 1}, "zero_count": 0, "count": 1, "sum": 1200.0, "min": 1200.0, "max": 1200.0}',1,'2025-12-07 17:07:24'),(47,'pickup','{"relative_accuracy": 0.01, "bins": {"341": 1}, "zero_count": 0, "count": 1, "sum": 900.0, "min": 900.0, "max": 900.0}',1,'2025-12-07 17:07:24'),(47,'preparation','{"relative_accuracy": 0.01, "bins": {"320": 1}, "zero_count": 0, "count": 1, "sum": 600.0, "min": 600.0, "max": 600.0}',1,'2025-12-07 17:07:24'),(48,'confirmation','{"relative_accuracy": 0.01, "bins": {"286": 1}, "zero_count": 0, "count": 1, "sum": 300.0, "min": 300.0, "max": 300.0}',1,'2025-12-07 17:07:24'),(48,'delivery','{"relative_accuracy": 0.01, "bins": {"366": 1}, "zero_count": 0, "count": 1, "sum": 1500.0, "min": 1500.0, "max": 1500.0}',1,'2025-12-07 17:07:24'),(48,'fulfillment','{"relative_accuracy": 0.01, "bins": {"418": 1}, "zero_count": 0, "count": 1, "sum": 4200.0, "min": 4200.0, "max": 4200.0}',1,'2025-12-07 17:07:24'),(48,'kitchen_start','{"relative_accuracy": 0.01, "bins": {"355": 1}, "zero_count": 0, "count": 1, "sum": 1200.0, "min": 1200.0, "max": 1200.0}',1,'2025-12-07 17:07:24'),(48,'pickup','{"relative_accuracy": 0.01, "bins": {"341": 1}, "zero_count": 0, "count": 1, "sum": 900.0, "min": 900.0, "max": 900.0}',1,'2025-12-07 17:07:24'),(48,'preparation','{"relative_accuracy": 0.01, "bins": {"320": 1}, "zero_count": 0, "count": 1, "sum": 600.0, "min": 600.0, "max": 600.0}',1,'2025-12-07 17:07:24'),(49,'confirmation','{"relative_accuracy": 0.01, "bins": {"286": 1}, "zero_count": 0, "count": 1, "sum": 300.0, "min": 300.0, "max": 300.0}',1,'2025-12-07 17:07:24'),(49,'kitchen_start','{"relative_accuracy": 0.01, "bins": {"355": 1}, "zero_count": 0, "count": 1, "sum": 1200.0, "min": 1200.0, "max": 1200.0}',1,'2025-12-07 17:07:24'),(49,'pickup','{"relative_accuracy": 0.01, "bins": {"341": 1}, "zero_count": 0, "count": 1, "sum": 900.0, "min": 900.0, "max": 900.0}',1,'2025-12-07 17:07:24'),(49,'preparation','{"relative_accuracy": 0.01, "bins": {"320": 1}, "zero_count": 0, "count": 1, "sum": 600.0, "min": 600.0, "max": 600.0}',1,'2025-12-07 17:07:24'),(50,'confirmation','{"relative_accuracy": 0.01, "bins": {"286": 1}, "zero_count": 0, "count": 1, "sum": 300.0, "min": 300.0, "max": 300.0}',1,'2025-12-07 17:07:24'),(50,'delivery','{"relative_accuracy": 0.01, "bins": {"366": 1}, "zero_count": 0, "count": 1, "sum": 1500.0, "min": 1500.0, "max": 1500.0}',1,'2025-12-07 17:07:24'),(50,'fulfillment','{"relative_accuracy": 0.01, "bins": {"418": 1}, "zero_count": 0, "count": 1, "sum": 4200.0, "min": 4200.0, "max": 4200.0}',1,'2025-12-07 17:07:24'),(50,'kitchen_start','{"relative_accuracy": 0.01, "bins": {"355": 1}, "zero_count": 0, "count": 1, "sum": 1200.0, "min": 1200.0, "max": 1200.0}',1,'2025-12-07 17:07:24'),(50,'pickup','{"relative_accuracy": 0.01, "bins": {"341": 1}, "zero_count": 0, "count": 1, "sum": 900.0, "min": 900.0, "max": 900.0}',1,'2025-12-07 17:07:24'),(50,'preparation','{"relative_accuracy": 0.01, "bins": {"320": 1}, "zero_count": 0, "count": 1, "sum": 600.0, "min": 600.0, "max": 600.0}',1,'2025-12-07 17:07:24'),(51,'confirmation','{"relative_accuracy": 0.01, "bins": {"286": 1}, "zero_count": 0, "count": 1, "sum": 300.0, "min": 300.0, "max": 300.0}',1,'2025-12-07 17:07:24'),(52,'confirmation','{"relative_accuracy": 0.01, "bins": {"286": 1}, "zero_count": 0, "count": 1, "sum": 300.0, "min": 300.0, "max": 300.0}',1,'2025-12-07 17:07:24'),(52,'delivery','{"relative_accuracy": 0.01, "bins": {"366": 1}, "zero_count": 0, "count": 1, "sum": 1500.0, "min": 1500.0, "max": 1500.0}',1,'2025-12-07 17:07:24'),(52,'fulfillment','{"relative_accuracy": 0.01, "bins": {"418": 1}, "zero_count": 0, "count": 1, "sum": 4200.0, "min": 4200.0, "max": 4200.0}',1,'2025-12-07 17:07:24'),(52,'kitchen_start','{"relative_accuracy": 0.01, "bins": {"355": 1}, "zero_count": 0, "count": 1, "sum": 1200.0, "min": 1200.0, "max": 1200.0}',1,'2025-12-07 17:07:24'),(52,'pickup','{"relative_accuracy": 0.01, "bins": {"341": 1}, "zero_count": 0, "count": 1, "sum": 900.0, "min": 900.0, "max": 900.0}',1,'2025-12-07 17:07:24'),(52,'preparation','{"relative_accuracy": 0.01, "bins": {"320": 1}, "zero_count": 0, "count": 1, "sum": 600.0, "min": 600.0, "max": 600.0}',1,'2025-12-07 17:07:24'),(53,'confirmation','{"relative_accuracy": 0.01, "bins": {"286": 1}, "zero_count": 0, "count": 1, "sum": 300.0, "min": 300.0, "max": 300.0}',1,'2025-12-07 17:07:24'),(53,'delivery','{"relative_accuracy": 0.01, "bins": {"366": 1}, "zero_count": 0, "count": 1, "sum": 1500.0, "min": 1500.0, "max": 1500.0}',1,'2025-12-07 17:07:24'),(53,'fulfillment','{"relative_accuracy": 0.01, "bins": {"418": 1}, "zero_count": 0, "count": 1, "sum": 4200.0, "min": 4200.0, "max": 4200.0}',1,'2025-12-07 17:07:24'),(53,'kitchen_start','{"relative_accuracy": 0.01, "bins": {"355": 1}, "zero_count": 0, "count": 1, "sum": 1200.0, "min": 1200.0, "max": 1200.0}',1,'2025-12-07 17:07:24'),(53,'pickup','{"relative_accuracy": 0.01, "bins": {"341": 1}, "zero_count": 0, "count": 1, "sum": 900.0, "min": 900.0, "max": 900.0}',1,'2025-12-07 17:07:24'),(53,'preparation','{"relative_accuracy": 0.01, "bins": {"320": 1}, "zero_count": 0, "count": 1, "sum": 600.0, "min": 600.0, "max": 600.0}',1,'2025-12-07 17:07:24'),(54,'confirmation','{"relative_accuracy": 0.01, "bins": {"286": 1}, "zero_count": 0, "count": 1, "sum": 300.0, "min": 300.0, "max": 300.0}',1,'2025-12-07 17:07:24'),(54,'delivery','{"relative_accuracy": 0.01, "bins": {"366": 1}, "zero_count": 0, "count": 1, "sum": 1500.0, "min": 1500.0, "max": 1500.0}',1,'2025-12-07 17:07:24'),(54,'fulfillment','{"relative_accuracy": 0.01, "bins": {"418": 1}, "zero_count": 0, "count": 1, "sum": 4200.0, "min": 4200.0, "max": 4200.0}',1,'2025-12-07 17:07:24'),(54,'kitchen_start','{"relative_accuracy": 0.01, "bins": {"355": 1}, "zero_count": 0, "count": 1, "sum": 1200.0, "min": 1200.0, "max": 1200.0}',1,'2025-12-07 17:07:24'),(54,'pickup','{"relative_accuracy": 0.01, "bins": {"341": 1}, "zero_count": 0, "count": 1, "sum": 900.0, "min": 900.0, "max": 900.0}',1,'2025-12-07 17:07:24'),(54,'preparation','{"relative_accuracy": 0.01, "bins": {"320": 1}, "zero_count": 0, "count": 1, "sum": 600.0, "min": 600.0, "max": 600.0}',1,'2025-12-07 17:07:24'),(55,'confirmation','{"relative_accuracy": 0.01, "bins": {"286": 1}, "zero_count": 0, "count": 1, "sum": 300.0, "min": 300.0, "max": 300.0}',1,'2025-12-07 17:07:24'),(55,'delivery','{"relative_accuracy": 0.01, "bins": {"366": 1}, "zero_count": 0, "count": 1, "sum": 1500.0, "min": 1500.0, "max": 1500.0}',1,'2025-12-07 17:07:24'),(55,'fulfillment','{"relative_accuracy": 0.01, "bins": {"418": 1}, "zero_count": 0, "count": 1, "sum": 4200.0, "min": 4200.0, "max": 4200.0}',1,'2025-12-07 17:07:24'),(55,'kitchen_start','{"relative_accuracy": 0.01, "bins": {"355": 1}, "zero_count": 0, "count": 1, "sum": 1200.0, "min": 1200.0, "max": 1200.0}',1,'2025-12-07 17:07:24'),(55,'pickup','{"relative_accuracy": 0.01, "bins": {"341": 1}, "zero_count": 0, "count": 1, "sum": 900.0, "min": 900.0, "max": 900.0}',1,'2025-12-07 17:07:24'),(55,'preparation','{"relative_accuracy": 0.01, "bins": {"320": 1}, "zero_count": 0, "count": 1, "sum": 600.0, "min": 600.0, "max": 600.0}',1,'2025-12-07 17:07:24');
+/*!40000 ALTER TABLE `fulfillmentsketch` ENABLE KEYS */;
+UNLOCK TABLES;
+
 --
 -- Table structure for table `menu`
 --
@@ -282,6 +402,37 @@ INSERT INTO `menuitempricehistory` VALUES (1,1,10.99,11.99,'2025-12-07 17:07:24'
 /*!40000 ALTER TABLE `menuitempricehistory` ENABLE KEYS */;
 UNLOCK TABLES;
 
+--
+-- Table structure for table `menuitemsalesdaily`
+--
+
+DROP TABLE IF EXISTS `menuitemsalesdaily`;
+/*!40101 SET @saved_cs_client     = @@character_set_client */;
+/*!50503 SET character_set_client = utf8mb4 */;
+CREATE TABLE `menuitemsalesdaily` (
+  `menu_item_id` bigint NOT NULL,
+  `sale_date` date NOT NULL,
+  `restaurant_id` bigint NOT NULL,
+  `order_count` int NOT NULL DEFAULT '0',
+  `quantity_sold` int NOT NULL DEFAULT '0',
+  `revenue` decimal(12,2) NOT NULL DEFAULT '0.00',
+  PRIMARY KEY (`menu_item_id`,`sale_date`),
+  KEY `idx_item_sales_restaurant_date` (`restaurant_id`,`sale_date`),
+  CONSTRAINT `menuitemsalesdaily_ibfk_1` FOREIGN KEY (`menu_item_id`) REFERENCES `menuitem` (`menu_item_id`) ON DELETE CASCADE,
+  CONSTRAINT `menuitemsalesdaily_ibfk_2` FOREIGN KEY (`restaurant_id`) REFERENCES `restaurant` (`restaurant_id`) ON DELETE CASCADE
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_0900_ai_ci;
+/*!40101 SET character_set_client = @saved_cs_client */;
+
+--
+-- Dumping data for table `menuitemsalesdaily`
+--
+
+LOCK TABLES `menuitemsalesdaily` WRITE;
+/*!40000 ALTER TABLE `menuitemsalesdaily` DISABLE KEYS */;
+INSERT INTO `menuitemsalesdaily` VALUES (1,'2025-01-01',31,1,1,11.99),(3,'2025-01-02',32,1,1,12.99),(9,'2025-01-05',35,1,1,15.99),(15,'2025-01-08',38,1,1,18.99),(17,'2025-01-09',39,1,1,19.99),(21,'2025-01-11',41,1,1,21.99),(23,'2025-01-12',42,1,1,22.99),(27,'2025-01-14',44,1,1,24.99),(29,'2025-01-15',45,1,1,25.99),(33,'2025-01-17',47,1,1,27.99),(35,'2025-01-18',48,1,1,28.99),(39,'2025-01-20',50,1,1,30.99),(43,'2025-01-22',52,1,1,32.99),(45,'2025-01-23',53,1,1,33.99),(47,'2025-01-24',54,1,1,34.99),(49,'2025-01-25',55,1,1,35.99);
+/*!40000 ALTER TABLE `menuitemsalesdaily` ENABLE KEYS */;
+UNLOCK TABLES;
+
 --
 -- Table structure for table `modifier`
 --
@@ -343,6 +494,38 @@ INSERT INTO `modifieroption` VALUES (1,1,'Standard Option 01',0.00,1,'2025-12-07
 /*!40000 ALTER TABLE `modifieroption` ENABLE KEYS */;
 UNLOCK TABLES;
 
+--
+-- Table structure for table `notification`
+--
+
+DROP TABLE IF EXISTS `notification`;
+/*!40101 SET @saved_cs_client     = @@character_set_client */;
+/*!50503 SET character_set_client = utf8mb4 */;
+CREATE TABLE `notification` (
+  `notification_id` bigint NOT NULL AUTO_INCREMENT,
+  `customer_id` bigint NOT NULL,
+  `notification_type` enum('CARD_EXPIRING') NOT NULL,
+  `reference_id` bigint DEFAULT NULL,
+  `dedupe_key` varchar(100) NOT NULL,
+  `message` varchar(500) NOT NULL,
+  `is_read` tinyint(1) NOT NULL DEFAULT '0',
+  `created_at` datetime DEFAULT CURRENT_TIMESTAMP,
+  PRIMARY KEY (`notification_id`),
+  UNIQUE KEY `unique_notification_dedupe` (`dedupe_key`),
+  KEY `idx_notification_customer` (`customer_id`,`created_at`),
+  CONSTRAINT `notification_ibfk_1` FOREIGN KEY (`customer_id`) REFERENCES `customer` (`customer_id`) ON DELETE CASCADE
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_0900_ai_ci;
+/*!40101 SET character_set_client = @saved_cs_client */;
+
+--
+-- Dumping data for table `notification`
+--
+
+LOCK TABLES `notification` WRITE;
+/*!40000 ALTER TABLE `notification` DISABLE KEYS */;
+/*!40000 ALTER TABLE `notification` ENABLE KEYS */;
+UNLOCK TABLES;
+
 --
 -- Table structure for table `order`
 --
@@ -387,6 +570,7 @@ CREATE TABLE `order` (
   KEY `idx_order_status` (`status`),
   KEY `idx_order_created` (`created_at`),
   KEY `idx_order_customer_created` (`customer_id`,`created_at`),
+  KEY `idx_order_restaurant_created` (`restaurant_id`,`created_at`),
   CONSTRAINT `order_ibfk_1` FOREIGN KEY (`customer_id`) REFERENCES `customer` (`customer_id`) ON DELETE CASCADE,
   CONSTRAINT `order_ibfk_2` FOREIGN KEY (`restaurant_id`) REFERENCES `restaurant` (`restaurant_id`) ON DELETE CASCADE,
   CONSTRAINT `order_ibfk_3` FOREIGN KEY (`delivery_address_id`) REFERENCES `address` (`address_id`) ON DELETE SET NULL,
@@ -492,6 +676,7 @@ CREATE TABLE `paymentmethod` (
   PRIMARY KEY (`payment_method_id`),
   KEY `idx_payment_method_customer` (`customer_id`),
   KEY `idx_payment_method_default` (`customer_id`,`is_default`),
+  KEY `idx_payment_method_expiry` (`expiry_year`,`expiry_month`),
   CONSTRAINT `paymentmethod_ibfk_1` FOREIGN KEY (`customer_id`) REFERENCES `customer` (`customer_id`) ON DELETE CASCADE
 ) ENGINE=InnoDB AUTO_INCREMENT=31 DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_0900_ai_ci;
 /*!40101 SET character_set_client = @saved_cs_client */;
@@ -506,6 +691,31 @@ INSERT INTO `paymentmethod` VALUES (1,1,'CREDIT_CARD','tok_cust_01','1111','Visa
 /*!40000 ALTER TABLE `paymentmethod` ENABLE KEYS */;
 UNLOCK TABLES;
 
+--
+-- Table structure for table `postalcodecentroid`
+--
+
+DROP TABLE IF EXISTS `postalcodecentroid`;
+/*!40101 SET @saved_cs_client     = @@character_set_client */;
+/*!50503 SET character_set_client = utf8mb4 */;
+CREATE TABLE `postalcodecentroid` (
+  `postal_code` varchar(20) NOT NULL,
+  `country` varchar(50) NOT NULL DEFAULT 'USA',
+  `latitude` decimal(10,8) NOT NULL,
+  `longitude` decimal(11,8) NOT NULL,
+  PRIMARY KEY (`country`,`postal_code`)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_0900_ai_ci;
+/*!40101 SET character_set_client = @saved_cs_client */;
+
+--
+-- Dumping data for table `postalcodecentroid`
+--
+
+LOCK TABLES `postalcodecentroid` WRITE;
+/*!40000 ALTER TABLE `postalcodecentroid` DISABLE KEYS */;
+/*!40000 ALTER TABLE `postalcodecentroid` ENABLE KEYS */;
+UNLOCK TABLES;
+
 --
 -- Table structure for table `refund`
 --
@@ -563,9 +773,12 @@ CREATE TABLE `restaurant` (
   `country` varchar(50) NOT NULL DEFAULT 'USA',
   `latitude` decimal(10,8) DEFAULT NULL,
   `longitude` decimal(11,8) DEFAULT NULL,
+  `geohash` varchar(12) DEFAULT NULL,
   PRIMARY KEY (`restaurant_id`),
   KEY `idx_restaurant_status` (`operating_status`),
   KEY `idx_restaurant_location` (`city`,`state`),
+  KEY `idx_restaurant_geohash` (`geohash`),
+  KEY `idx_restaurant_lat_lng` (`latitude`,`longitude`),
   CONSTRAINT `restaurant_ibfk_1` FOREIGN KEY (`restaurant_id`) REFERENCES `account` (`account_id`) ON DELETE CASCADE
 ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_0900_ai_ci;
 /*!40101 SET character_set_client = @saved_cs_client */;
@@ -576,10 +789,39 @@ CREATE TABLE `restaurant` (
 
 LOCK TABLES `restaurant` WRITE;
 /*!40000 ALTER TABLE `restaurant` DISABLE KEYS */;
-INSERT INTO `restaurant` VALUES (31,'Restaurant 01','555-2001','contact_restaurant01@grubngo.com','OPEN','201 Market St','San Francisco','CA','94131','USA',NULL,NULL),(32,'Restaurant 02','555-2002','contact_restaurant02@grubngo.com','OPEN','202 Market St','San Francisco','CA','94132','USA',NULL,NULL),(33,'Restaurant 03','555-2003','contact_restaurant03@grubngo.com','OPEN','203 Market St','San Francisco','CA','94133','USA',NULL,NULL),(34,'Restaurant 04','555-2004','contact_restaurant04@grubngo.com','OPEN','204 Market St','San Francisco','CA','94134','USA',NULL,NULL),(35,'Restaurant 05','555-2005','contact_restaurant05@grubngo.com','OPEN','205 Market St','San Francisco','CA','94135','USA',NULL,NULL),(36,'Restaurant 06','555-2006','contact_restaurant06@grubngo.com','OPEN','206 Market St','San Francisco','CA','94136','USA',NULL,NULL),(37,'Restaurant 07','555-2007','contact_restaurant07@grubngo.com','OPEN','207 Market St','San Francisco','CA','94137','USA',NULL,NULL),(38,'Restaurant 08','555-2008','contact_restaurant08@grubngo.com','OPEN','208 Market St','San Francisco','CA','94138','USA',NULL,NULL),(39,'Restaurant 09','555-2009','contact_restaurant09@grubngo.com','OPEN','209 Market St','San Francisco','CA','94139','USA',NULL,NULL),(40,'Restaurant 10','555-2010','contact_restaurant10@grubngo.com','OPEN','210 Market St','San Francisco','CA','94140','USA',NULL,NULL),(41,'Restaurant 11','555-2011','contact_restaurant11@grubngo.com','TEMPORARILY_CLOSED','211 Market St','San Francisco','CA','94141','USA',NULL,NULL),(42,'Restaurant 12','555-2012','contact_restaurant12@grubngo.com','TEMPORARILY_CLOSED','212 Market St','San Francisco','CA','94142','USA',NULL,NULL),(43,'Restaurant 13','555-2013','contact_restaurant13@grubngo.com','TEMPORARILY_CLOSED','213 Market St','San Francisco','CA','94143','USA',NULL,NULL),(44,'Restaurant 14','555-2014','contact_restaurant14@grubngo.com','OPEN','214 Market St','San Francisco','CA','94144','USA',NULL,NULL),(45,'Restaurant 15','555-2015','contact_restaurant15@grubngo.com','PERMANENTLY_CLOSED','215 Market St','San Francisco','CA','94145','USA',NULL,NULL),(46,'Restaurant 16','555-2016','contact_restaurant16@grubngo.com','OPEN','216 Market St','San Francisco','CA','94146','USA',NULL,NULL),(47,'Restaurant 17','555-2017','contact_restaurant17@grubngo.com','OPEN','217 Market St','San Francisco','CA','94147','USA',NULL,NULL),(48,'Restaurant 18','555-2018','contact_restaurant18@grubngo.com','OPEN','218 Market St','San Francisco','CA','94148','USA',NULL,NULL),(49,'Restaurant 19','555-2019','contact_restaurant19@grubngo.com','OPEN','219 Market St','San Francisco','CA','94149','USA',NULL,NULL),(50,'Restaurant 20','555-2020','contact_restaurant20@grubngo.com','OPEN','220 Market St','San Francisco','CA','94150','USA',NULL,NULL),(51,'Restaurant 21','555-2021','contact_restaurant21@grubngo.com','OPEN','221 Market St','San Francisco','CA','94151','USA',NULL,NULL),(52,'Restaurant 22','555-2022','contact_restaurant22@grubngo.com','OPEN','222 Market St','San Francisco','CA','94152','USA',NULL,NULL),(53,'Restaurant 23','555-2023','contact_restaurant23@grubngo.com','OPEN','223 Market St','San Francisco','CA','94153','USA',NULL,NULL),(54,'Restaurant 24','555-2024','contact_restaurant24@grubngo.com','OPEN','224 Market St','San Francisco','CA','94154','USA',NULL,NULL),(55,'Restaurant 25','555-2025','contact_restaurant25@grubngo.com','OPEN','225 Market St','San Francisco','CA','94155','USA',NULL,NULL);
+INSERT INTO `restaurant` VALUES (31,'Restaurant 01','555-2001','contact_restaurant01@grubngo.com','OPEN','201 Market St','San Francisco','CA','94131','USA',NULL,NULL,NULL),(32,'Restaurant 02','555-2002','contact_restaurant02@grubngo.com','OPEN','202 Market St','San Francisco','CA','94132','USA',NULL,NULL,NULL),(33,'Restaurant 03','555-2003','contact_restaurant03@grubngo.com','OPEN','203 Market St','San Francisco','CA','94133','USA',NULL,NULL,NULL),(34,'Restaurant 04','555-2004','contact_restaurant04@grubngo.com','OPEN','204 Market St','San Francisco','CA','94134','USA',NULL,NULL,NULL),(35,'Restaurant 05','555-2005','contact_restaurant05@grubngo.com','OPEN','205 Market St','San Francisco','CA','94135','USA',NULL,NULL,NULL),(36,'Restaurant 06','555-2006','contact_restaurant06@grubngo.com','OPEN','206 Market St','San Francisco','CA','94136','USA',NULL,NULL,NULL),(37,'Restaurant 07','555-2007','contact_restaurant07@grubngo.com','OPEN','207 Market St','San Francisco','CA','94137','USA',NULL,NULL,NULL),(38,'Restaurant 08','555-2008','contact_restaurant08@grubngo.com','OPEN','208 Market St','San Francisco','CA','94138','USA',NULL,NULL,NULL),(39,'Restaurant 09','555-2009','contact_restaurant09@grubngo.com','OPEN','209 Market St','San Francisco','CA','94139','USA',NULL,NULL,NULL),(40,'Restaurant 10','555-2010','contact_restaurant10@grubngo.com','OPEN','210 Market St','San Francisco','CA','94140','USA',NULL,NULL,NULL),(41,'Restaurant 11','555-2011','contact_restaurant11@grubngo.com','TEMPORARILY_CLOSED','211 Market St','San Francisco','CA','94141','USA',NULL,NULL,NULL),(42,'Restaurant 12','555-2012','contact_restaurant12@grubngo.com','TEMPORARILY_CLOSED','212 Market St','San Francisco','CA','94142','USA',NULL,NULL,NULL),(43,'Restaurant 13','555-2013','contact_restaurant13@grubngo.com','TEMPORARILY_CLOSED','213 Market St','San Francisco','CA','94143','USA',NULL,NULL,NULL),(44,'Restaurant 14','555-2014','contact_restaurant14@grubngo.com','OPEN','214 Market St','San Francisco','CA','94144','USA',NULL,NULL,NULL),(45,'Restaurant 15','555-2015','contact_restaurant15@grubngo.com','PERMANENTLY_CLOSED','215 Market St','San Francisco','CA','94145','USA',NULL,NULL,NULL),(46,'Restaurant 16','555-2016','contact_restaurant16@grubngo.com','OPEN','216 Market St','San Francisco','CA','94146','USA',NULL,NULL,NULL),(47,'Restaurant 17','555-2017','contact_restaurant17@grubngo.com','OPEN','217 Market St','San Francisco','CA','94147','USA',NULL,NULL,NULL),(48,'Restaurant 18','555-2018','contact_restaurant18@grubngo.com','OPEN','218 Market St','San Francisco','CA','94148','USA',NULL,NULL,NULL),(49,'Restaurant 19','555-2019','contact_restaurant19@grubngo.com','OPEN','219 Market St','San Francisco','CA','94149','USA',NULL,NULL,NULL),(50,'Restaurant 20','555-2020','contact_restaurant20@grubngo.com','OPEN','220 Market St','San Francisco','CA','94150','USA',NULL,NULL,NULL),(51,'Restaurant 21','555-2021','contact_restaurant21@grubngo.com','OPEN','221 Market St','San Francisco','CA','94151','USA',NULL,NULL,NULL),(52,'Restaurant 22','555-2022','contact_restaurant22@grubngo.com','OPEN','222 Market St','San Francisco','CA','94152','USA',NULL,NULL,NULL),(53,'Restaurant 23','555-2023','contact_restaurant23@grubngo.com','OPEN','223 Market St','San Francisco','CA','94153','USA',NULL,NULL,NULL),(54,'Restaurant 24','555-2024','contact_restaurant24@grubngo.com','OPEN','224 Market St','San Francisco','CA','94154','USA',NULL,NULL,NULL),(55,'Restaurant 25','555-2025','contact_restaurant25@grubngo.com','OPEN','225 Market St','San Francisco','CA','94155','USA',NULL,NULL,NULL);
 /*!40000 ALTER TABLE `restaurant` ENABLE KEYS */;
 UNLOCK TABLES;
 
+--
+-- Table structure for table `restaurantdailystats`
+--
+
+DROP TABLE IF EXISTS `restaurantdailystats`;
+/*!40101 SET @saved_cs_client     = @@character_set_client */;
+/*!50503 SET character_set_client = utf8mb4 */;
+CREATE TABLE `restaurantdailystats` (
+  `restaurant_id` bigint NOT NULL,
+  `stat_date` date NOT NULL,
+  `delivered_orders` int NOT NULL DEFAULT '0',
+  `gross_revenue` decimal(12,2) NOT NULL DEFAULT '0.00',
+  `refund_count` int NOT NULL DEFAULT '0',
+  `refunded_amount` decimal(12,2) NOT NULL DEFAULT '0.00',
+  PRIMARY KEY (`restaurant_id`,`stat_date`),
+  CONSTRAINT `restaurantdailystats_ibfk_1` FOREIGN KEY (`restaurant_id`) REFERENCES `restaurant` (`restaurant_id`) ON DELETE CASCADE
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_0900_ai_ci;
+/*!40101 SET character_set_client = @saved_cs_client */;
+
+--
+-- Dumping data for table `restaurantdailystats`
+--
+
+LOCK TABLES `restaurantdailystats` WRITE;
+/*!40000 ALTER TABLE `restaurantdailystats` DISABLE KEYS */;
+INSERT INTO `restaurantdailystats` VALUES (31,'2025-01-01',1,19.54,0,0.00),(31,'2025-02-01',0,0.00,1,1.60),(32,'2025-01-02',1,20.63,0,0.00),(32,'2025-02-02',0,0.00,1,1.70),(33,'2025-02-03',0,0.00,1,1.80),(34,'2025-02-04',0,0.00,1,1.90),(35,'2025-01-05',1,23.89,0,0.00),(35,'2025-02-05',0,0.00,1,2.00),(36,'2025-02-06',0,0.00,1,2.10),(37,'2025-02-07',0,0.00,1,2.20),(38,'2025-01-08',1,27.15,0,0.00),(38,'2025-02-08',0,0.00,1,2.30),(39,'2025-01-09',1,28.24,0,0.00),(39,'2025-02-09',0,0.00,1,2.40),(40,'2025-02-10',0,0.00,1,2.50),(41,'2025-01-11',1,30.41,0,0.00),(42,'2025-01-12',1,31.50,0,0.00),(44,'2025-01-14',1,33.68,0,0.00),(45,'2025-01-15',1,34.76,0,0.00),(47,'2025-01-17',1,36.94,0,0.00),(48,'2025-01-18',1,38.03,0,0.00),(50,'2025-01-20',1,40.20,0,0.00),(52,'2025-01-22',1,42.38,0,0.00),(53,'2025-01-23',1,43.46,0,0.00),(54,'2025-01-24',1,44.55,0,0.00),(55,'2025-01-25',1,45.64,0,0.00);
+/*!40000 ALTER TABLE `restaurantdailystats` ENABLE KEYS */;
+UNLOCK TABLES;
+
 --
 -- Table structure for table `transaction`
 --